@@ -0,0 +1,56 @@
+"""Re-normalize posted_at across every raw file in data/raw and report what would change.
+
+Prints per-format parse counts, values that no parser accepts (a scrape would have stamped these
+"now"), values whose normalized form differs from what is stored, and parse throughput.
+Read-only: nothing is rewritten.
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.scrapers.timestamps import TimestampNormalizer
+from src.utils import iter_raw_headline_paths, iter_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Audit posted_at normalization over data/raw.")
+    parser.add_argument("--column", default="posted_at", help="Timestamp column to audit (default posted_at).")
+    parser.add_argument("--show", type=int, default=10, help="Example rows to print per problem (default 10).")
+    args = parser.parse_args()
+
+    normalizer = TimestampNormalizer()
+    unparseable: Counter[str] = Counter()
+    changed: list[tuple[str, str, str]] = []
+    n = 0
+    parse_s = 0.0
+    for path in iter_raw_headline_paths():
+        values = [row.get(args.column, "") for row in iter_rows(path)]
+        start = time.perf_counter()
+        normalized = [normalizer.normalize(v, source=path.name, fallback_now=False) for v in values]
+        parse_s += time.perf_counter() - start
+        n += len(values)
+        for v, out in zip(values, normalized):
+            if out is None:
+                unparseable[v] += 1
+            elif out != v and len(changed) < args.show:
+                changed.append((path.name, v, out))
+
+    rate = n / parse_s if parse_s else 0.0
+    print(f"{n} {args.column} values in {parse_s:.3f}s ({rate:,.0f}/s)")
+    for fmt, count in sorted(normalizer.stats().items()):
+        print(f"  {fmt}: {count}")
+    print(f"Unparseable: {sum(unparseable.values())}")
+    for v, count in unparseable.most_common(args.show):
+        print(f"  {count} x {v!r}")
+    print(f"Would change (first {args.show}):")
+    for name, before, after in changed:
+        print(f"  {name}: {before!r} -> {after!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,59 +2,222 @@
 Build data/cleaned/base_data.csv from all raw headline files.
 
 Pipeline:
-1. Load data/raw/headlines_*.csv (and legacy *.jsonl).
+1. Stream data/raw/headlines_*.csv (and legacy *.jsonl) chunk by chunk.
 2. Run ticker + AI matching (same as run_process).
-3. Keep rows where is_ai_related is True.
+3. Keep rows where is_ai_related is True (only these are held in memory).
 4. Dedupe by (posted_at, url, ticker), first row kept.
 5. Sort by posted_at, ticker, url — overwrite base_data.csv.
 
-Run after scrapers (or via CI). Full rebuild each run so config changes stay consistent.
+Incremental by default: data/cleaned/base_data_manifest.json (committed) records each raw file's size
+and sha256 plus the config YAML fingerprint; data/cleaned/base_data_stat_cache.json (local, git-ignored)
+adds mtimes so unchanged files are not re-hashed on this machine. Only new or changed raw files are
+matched and merged into the existing base_data.csv (existing rows win the dedupe). A full rebuild happens automatically when the
+relationship/entity YAML fingerprint changes, when base_data.csv or the manifest is missing, or with --full.
+
+--raw-format parquet reads data/raw/parquet/date=*/ instead of the daily CSVs; --parquet also writes
+data/cleaned/base_data_parquet/ (partitioned by posted_at date). Both need pyarrow.
 """
+import argparse
+import csv
+import hashlib
+import json
 import sys
+from itertools import chain
 from pathlib import Path
+from typing import Iterable
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
-from src.matching import run_matching_to_rows
-from src.utils import DATA_CLEANED, iter_raw_headline_paths
+from src.matching import config_fingerprint, iter_matched_rows
+from src.utils import (
+    BASE_DATA_PARQUET,
+    DATA_CLEANED,
+    iter_raw_headline_paths,
+    iter_raw_parquet_paths,
+    load_csv,
+    write_parquet,
+)
+
+MANIFEST_PATH = DATA_CLEANED / "base_data_manifest.json"
+# Local-only size/mtime/sha256 per raw file; mtimes differ per checkout, so they stay out of the manifest.
+STAT_CACHE_PATH = DATA_CLEANED / "base_data_stat_cache.json"
 
 
 def _row_key(r: dict) -> tuple:
     return (r.get("posted_at", ""), r.get("url", ""), r.get("ticker", ""))
 
 
-def main() -> None:
-    output_path = DATA_CLEANED / "base_data.csv"
-    raw_paths = iter_raw_headline_paths()
-    if not raw_paths:
-        print("No data/raw/headlines_*.csv or headlines_*.jsonl found. Run scrapers first.")
-        sys.exit(1)
-
-    matched = run_matching_to_rows(raw_paths)
-    ai_rows = [r for r in matched if r.get("is_ai_related") is True]
-
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _load_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _write_json(path: Path, data: dict) -> None:
+    tmp_path = path.parent / f"{path.name}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    tmp_path.replace(path)
+
+
+def _write_manifest(fingerprint: str, files: dict[str, dict], stats: dict[str, dict]) -> None:
+    """Committed manifest (content only, so unchanged raw files leave it byte-identical) plus the local stat cache."""
+    _write_json(MANIFEST_PATH, {"config_fingerprint": fingerprint, "files": files})
+    _write_json(STAT_CACHE_PATH, stats)
+
+
+def _scan_raw_files(
+    raw_paths: list[Path], known: dict[str, dict], stat_cache: dict[str, dict]
+) -> tuple[list[Path], dict[str, dict], dict[str, dict]]:
+    """
+    Return (new or changed paths, manifest entries {size, sha256}, stat cache entries {size, mtime, sha256}).
+    A file is changed when its sha256 differs from the manifest's. The hash is reused from the local
+    stat cache when size + mtime are unchanged; fresh checkouts (CI) have no cache and hash every file.
+    """
+    changed: list[Path] = []
+    entries: dict[str, dict] = {}
+    stats: dict[str, dict] = {}
+    for p in raw_paths:
+        st = p.stat()
+        cached = stat_cache.get(p.name)
+        if cached and cached.get("size") == st.st_size and cached.get("mtime") == st.st_mtime:
+            digest = cached["sha256"]
+        else:
+            digest = _file_sha256(p)
+        entries[p.name] = {"size": st.st_size, "sha256": digest}
+        stats[p.name] = {"size": st.st_size, "mtime": st.st_mtime, "sha256": digest}
+        prev = known.get(p.name)
+        if not prev or prev.get("sha256") != digest:
+            changed.append(p)
+    return changed, entries, stats
+
+
+def _dedupe(rows: Iterable[dict]) -> list[dict]:
+    """Keep the first row per (posted_at, url, ticker), then sort by that key."""
     seen: set[tuple] = set()
     deduped: list[dict] = []
-    for r in ai_rows:
+    for r in rows:
         k = _row_key(r)
         if k in seen:
             continue
         seen.add(k)
         deduped.append(r)
-
     deduped.sort(key=lambda r: _row_key(r))
+    return deduped
+
+
+def _write_csv(rows: list[dict], path: Path) -> None:
+    """Write rows with every discovered column (first-seen order, missing -> "") as UTF-8 CSV, atomically."""
+    fieldnames = list(dict.fromkeys(k for r in rows for k in r))
+    tmp_path = path.parent / f"{path.name}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval="", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    tmp_path.replace(path)
+
+
+def _write_base_parquet(rows: list[dict]) -> None:
+    """Rewrite the base_data Parquet dataset from the final (deduped, sorted) rows."""
+    write_parquet(
+        rows,
+        BASE_DATA_PARQUET,
+        partition_col="posted_at",
+        stem="base_data",
+        sort_cols=["posted_at", "ticker", "url"],
+        replace=True,
+    )
+    print(f"Wrote {BASE_DATA_PARQUET.name}/ ({len(rows)} rows).")
 
-    DATA_CLEANED.mkdir(parents=True, exist_ok=True)
-    # Preserve all discovered columns and write a clean UTF-8 CSV.
-    import pandas as pd
 
-    pd.DataFrame(deduped).to_csv(output_path, index=False, encoding="utf-8")
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build data/cleaned/base_data.csv from raw headlines.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild from every raw file even if the manifest says nothing changed.",
+    )
+    parser.add_argument(
+        "--raw-format",
+        choices=("csv", "parquet"),
+        default="csv",
+        help="Read raw daily CSVs (default) or the data/raw/parquet dataset.",
+    )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Also write data/cleaned/base_data_parquet/ partitioned by posted_at date.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for matching (default 1 = serial); useful for large backfills and full rebuilds.",
+    )
+    args = parser.parse_args()
+
+    output_path = DATA_CLEANED / "base_data.csv"
+    if args.raw_format == "parquet":
+        raw_paths = iter_raw_parquet_paths()
+    else:
+        raw_paths = iter_raw_headline_paths()
+    if not raw_paths:
+        print("No data/raw/headlines_*.csv, headlines_*.jsonl or parquet partitions found. Run scrapers first.")
+        sys.exit(1)
+
+    fingerprint = config_fingerprint()
+    manifest = _load_json(MANIFEST_PATH)
+    full = (
+        args.full
+        or not output_path.exists()
+        or manifest.get("config_fingerprint") != fingerprint
+    )
+    known = {} if full else manifest.get("files", {})
+    changed, entries, stats = _scan_raw_files(raw_paths, known, _load_json(STAT_CACHE_PATH))
+    to_match = raw_paths if full else changed
+
+    if not full and not to_match:
+        _write_manifest(fingerprint, entries, stats)
+        if args.parquet and not BASE_DATA_PARQUET.exists():
+            _write_base_parquet(load_csv(output_path))
+        print(f"{output_path.name} up to date: no new or changed raw files ({len(raw_paths)} tracked).")
+        return
+
+    # Raw files are streamed through matching; only is_ai_related rows are kept in memory.
+    n_matched = 0
+    ai_rows: list[dict] = []
+    for r in iter_matched_rows(to_match, workers=args.workers):
+        n_matched += 1
+        if r.get("is_ai_related") is True:
+            ai_rows.append(r)
+    existing = [] if full else load_csv(output_path)
+    deduped = _dedupe(chain(existing, ai_rows))
+
+    DATA_CLEANED.mkdir(parents=True, exist_ok=True)
+    _write_csv(deduped, output_path)
+    _write_manifest(fingerprint, entries, stats)
+    if args.parquet:
+        _write_base_parquet(deduped)
 
+    mode = "full rebuild" if full else f"incremental, {len(existing)} existing rows"
     print(
-        f"Wrote {output_path.name}: {len(matched)} matched rows -> "
+        f"Wrote {output_path.name} ({mode}): {n_matched} matched rows -> "
         f"{len(ai_rows)} is_ai_related -> {len(deduped)} after (posted_at, url, ticker) dedupe "
-        f"({len(raw_paths)} raw file(s))."
+        f"({len(to_match)} of {len(raw_paths)} raw file(s) matched)."
     )
 
 
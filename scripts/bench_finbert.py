@@ -0,0 +1,129 @@
+"""Parity check and CPU throughput benchmark: int8-quantized FinBERT (finbert-int8) vs fp32 FinBERT.
+
+Parity: int8 scores for every unique headline in the input against the fp32 `sentiment_finbert`
+stored there (or recomputed with --recompute-fp32): max / mean abs diff, Spearman rank correlation
+and sign agreement. Exits 1 if the rank correlation is below --min-rank-corr.
+Throughput: headlines/s of both models on --sample headlines, after one warm-up batch each.
+
+Usage:
+  python scripts/bench_finbert.py
+  python scripts/bench_finbert.py --threads 2 --sample 512
+  python scripts/bench_finbert.py data/cleaned/processed_base_data.jsonl --recompute-fp32
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.sentiment.finbert_scorer import (
+    DEFAULT_BATCH_SIZE,
+    FINBERT_THREADS_ENV,
+    score_finbert_batch,
+    score_finbert_int8_batch,
+)
+from src.utils import DATA_CLEANED, iter_rows
+
+DEFAULT_INPUT = DATA_CLEANED / "processed_base_data.jsonl"
+MIN_RANK_CORR = 0.98
+# Scores this close to 0 count as neutral for sign agreement.
+SIGN_EPS = 0.05
+
+
+def _ranks(values: list[float]) -> list[float]:
+    """Average ranks (ties share the mean rank), as in Spearman's rho."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2
+        i = j + 1
+    return ranks
+
+
+def spearman(a: list[float], b: list[float]) -> float:
+    ra, rb = _ranks(a), _ranks(b)
+    n = len(ra)
+    ma, mb = sum(ra) / n, sum(rb) / n
+    cov = sum((x - ma) * (y - mb) for x, y in zip(ra, rb))
+    var_a = sum((x - ma) ** 2 for x in ra)
+    var_b = sum((y - mb) ** 2 for y in rb)
+    return cov / (var_a * var_b) ** 0.5 if var_a and var_b else 1.0
+
+
+def _sign(x: float) -> int:
+    return 0 if abs(x) < SIGN_EPS else (1 if x > 0 else -1)
+
+
+def throughput(score, headlines: list[str], batch_size: int) -> float:
+    """Headlines per second for score(headlines, batch_size), after one warm-up batch."""
+    score(headlines[:batch_size], batch_size)
+    start = time.perf_counter()
+    score(headlines, batch_size)
+    return len(headlines) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="FinBERT int8 vs fp32: score parity and CPU throughput.")
+    parser.add_argument("input", nargs="?", type=Path, default=DEFAULT_INPUT, help="Processed JSONL/CSV with headlines.")
+    parser.add_argument("--threads", type=int, default=None, help=f"Intra-op CPU threads (default ${FINBERT_THREADS_ENV} or all cores).")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"Batch size (default {DEFAULT_BATCH_SIZE}).")
+    parser.add_argument("--sample", type=int, default=256, help="Headlines timed per model (default 256).")
+    parser.add_argument("--recompute-fp32", action="store_true", help="Score fp32 now instead of using stored sentiment_finbert.")
+    parser.add_argument("--min-rank-corr", type=float, default=MIN_RANK_CORR, help=f"Parity gate (default {MIN_RANK_CORR}).")
+    parser.add_argument("--skip-throughput", action="store_true", help="Parity check only.")
+    args = parser.parse_args()
+
+    if args.threads:
+        os.environ[FINBERT_THREADS_ENV] = str(args.threads)
+    if not args.input.exists():
+        print(f"Input not found: {args.input}", file=sys.stderr)
+        return 1
+    reference: dict[str, float | None] = {}
+    for row in iter_rows(args.input):
+        h = row.get("headline") or ""
+        if h.strip() and h not in reference:
+            ref = row.get("sentiment_finbert")
+            reference[h] = float(ref) if ref not in (None, "") else None
+    headlines = list(reference)
+    if not headlines:
+        print("No headlines in input.", file=sys.stderr)
+        return 1
+    if args.recompute_fp32 or any(v is None for v in reference.values()):
+        fp32 = score_finbert_batch(headlines, args.batch_size)
+        ref_label = "fp32 (recomputed)"
+    else:
+        fp32 = [reference[h] for h in headlines]
+        ref_label = "fp32 (stored sentiment_finbert)"
+    int8 = score_finbert_int8_batch(headlines, args.batch_size)
+
+    diffs = [abs(a - b) for a, b in zip(fp32, int8)]
+    rho = spearman(fp32, int8)
+    signs = sum(_sign(a) == _sign(b) for a, b in zip(fp32, int8)) / len(headlines)
+    print(f"Parity vs {ref_label} on {len(headlines)} headlines:")
+    print(f"  max abs diff  {max(diffs):.4f}")
+    print(f"  mean abs diff {sum(diffs) / len(diffs):.4f}")
+    print(f"  Spearman rho  {rho:.4f}  (gate {args.min_rank_corr})")
+    print(f"  sign agreement {signs:.1%}  (|score| < {SIGN_EPS} = neutral)")
+
+    if not args.skip_throughput:
+        import torch
+
+        sample = (headlines * (args.sample // len(headlines) + 1))[: args.sample]
+        fp32_rate = throughput(score_finbert_batch, sample, args.batch_size)
+        int8_rate = throughput(score_finbert_int8_batch, sample, args.batch_size)
+        print(f"Throughput on {len(sample)} headlines, batch {args.batch_size}, {torch.get_num_threads()} thread(s):")
+        print(f"  fp32 {fp32_rate:8.1f} headlines/s")
+        print(f"  int8 {int8_rate:8.1f} headlines/s  ({int8_rate / fp32_rate:.2f}x)")
+    return 0 if rho >= args.min_rank_corr else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Import-time benchmark for the script entry points.
+
+Each script is loaded in a fresh interpreter with runpy (module-level imports run, main() does not)
+and timed against a bare `python -c pass`; the best of --repeat runs is compared to its budget in
+STARTUP_BUDGET_MS. Exits 1 if any script is over budget, so it can guard startup in CI.
+
+Usage:
+  python scripts/bench_startup.py
+  python scripts/bench_startup.py --repeat 5 run_process.py database.py
+  python scripts/bench_startup.py --importtime database.py   # python -X importtime breakdown, slowest first
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = ROOT / "scripts"
+
+# Milliseconds of import work allowed on top of interpreter startup. pandas, numpy, requests, yaml and
+# the model backends are imported where they are used, so no entry point should pay for them at import.
+STARTUP_BUDGET_MS: dict[str, float] = {
+    "audit_timestamps.py": 100,
+    "base_data.py": 100,
+    "bench_startup.py": 50,
+    "database.py": 50,
+    "jsonl_to_csv.py": 100,
+    "merge_raw_csv_to_daily.py": 100,
+    "rebuild_seen_index.py": 100,
+    "run_all_scrapers.py": 100,
+    "run_backtest.py": 100,
+    "run_process.py": 100,
+    "update_prices.py": 100,
+}
+DEFAULT_BUDGET_MS = 100.0
+
+
+def _time_python(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def _load_code(script: Path) -> str:
+    return f"import runpy; runpy.run_path({str(script)!r}, run_name='bench_startup')"
+
+
+def measure(script: Path, repeat: int) -> float:
+    """Best-of-repeat import cost of script in ms, net of bare interpreter startup."""
+    base = min(_time_python("pass") for _ in range(repeat))
+    return max(0.0, min(_time_python(_load_code(script)) for _ in range(repeat)) - base)
+
+
+def importtime(script: Path, top: int = 15) -> None:
+    """Print the slowest cumulative imports for one script (python -X importtime)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _load_code(script)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    for cumulative_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:8.1f} ms  {name}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark import time of scripts/*.py entry points.")
+    parser.add_argument("scripts", nargs="*", help="Script file names (default: every scripts/*.py).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per script; the best is kept (default 3).")
+    parser.add_argument("--importtime", action="store_true", help="Show the slowest imports instead of timing.")
+    args = parser.parse_args()
+
+    names = args.scripts or sorted(p.name for p in SCRIPTS_DIR.glob("*.py"))
+    over = 0
+    for name in names:
+        script = SCRIPTS_DIR / name
+        if args.importtime:
+            print(f"== {name}")
+            importtime(script)
+            continue
+        ms = measure(script, max(1, args.repeat))
+        budget = STARTUP_BUDGET_MS.get(name, DEFAULT_BUDGET_MS)
+        status = "ok" if ms <= budget else "OVER"
+        over += ms > budget
+        print(f"{name:28s} {ms:7.0f} ms  (budget {budget:.0f})  {status}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,23 @@
+"""
+SQLite store for processed sentiment rows (data/sentiment.db).
+
+Usage:
+  python scripts/database.py                                  # create/migrate schema only
+  python scripts/database.py data/cleaned/processed_*.jsonl   # stream-ingest processed JSONL file(s)
+"""
 import sqlite3
+import sys
 from pathlib import Path
+from typing import Iterable
 
 ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils import iter_jsonl_rows
+
+# Bump when init_db gains a migration; stored in PRAGMA user_version so inserts skip init when current.
+SCHEMA_VERSION = 2
+INSERT_BATCH_ROWS = 5000
 
 CREATE_TABLE = """
 CREATE TABLE IF NOT EXISTS sentiment_scores (
@@ -23,6 +39,20 @@ CREATE TABLE IF NOT EXISTS sentiment_scores (
 );
 """
 
+CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_sentiment_scores_ticker_posted_at ON sentiment_scores (ticker, posted_at)",
+)
+
+INSERT_COLUMNS = (
+    "posted_at", "fetched_at", "headline", "url", "source", "reporter",
+    "ticker", "is_ai_related", "is_proxy_partnership",
+    "sentiment_finbert", "sentiment_llm_phi3", "sentiment_llm_llama3_2", "sentiment_llm_deepseek_r1",
+)
+INSERT_SQL = (
+    f"INSERT OR IGNORE INTO sentiment_scores ({', '.join(INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in INSERT_COLUMNS)})"
+)
+
 
 def get_db_path() -> Path:
     """Return path to data/sentiment.db; ensure data/ exists."""
@@ -32,20 +62,36 @@ def get_db_path() -> Path:
 
 
 def get_connection() -> sqlite3.Connection:
-    """Open and return a connection to the sentiment DB. Caller must close."""
-    return sqlite3.connect(get_db_path())
+    """
+    Open and return a connection to the sentiment DB. Caller must close.
+    Uses WAL journaling (readers don't block the writer) with synchronous=NORMAL, which is
+    crash-safe in WAL mode and avoids an fsync per transaction.
+    """
+    conn = sqlite3.connect(get_db_path())
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
 
 
 def init_db(conn: sqlite3.Connection) -> None:
-    """Create sentiment_scores table if it does not exist."""
+    """Create sentiment_scores table and indexes if they do not exist; run migrations."""
     conn.execute(CREATE_TABLE)
     # Lightweight migration for existing DBs that still have sentiment_vader only.
     cols = [r[1] for r in conn.execute("PRAGMA table_info(sentiment_scores)").fetchall()]
     if "sentiment_finbert" not in cols:
         conn.execute("ALTER TABLE sentiment_scores ADD COLUMN sentiment_finbert REAL")
+    for sql in CREATE_INDEXES:
+        conn.execute(sql)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
 
 
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """Run init_db only when the stored schema version is behind (one cheap PRAGMA otherwise)."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        init_db(conn)
+
+
 def _row_to_tuple(row: dict) -> tuple:
     """Map a processed row dict to (posted_at, fetched_at, ..., sentiment_llm_deepseek_r1)."""
     def b(v):
@@ -67,29 +113,34 @@ def _row_to_tuple(row: dict) -> tuple:
     )
 
 
-def insert_processed_rows(conn: sqlite3.Connection, rows: list[dict]) -> int:
+def insert_processed_rows(conn: sqlite3.Connection, rows: Iterable[dict]) -> int:
     """
     Insert processed rows into sentiment_scores. Uses INSERT OR IGNORE so
-    duplicate (headline, url, ticker) are skipped. Calls init_db(conn) first.
-    Returns number of rows inserted.
+    duplicate (headline, url, ticker) are skipped. Initializes the schema if needed.
+    Rows are written with executemany in one explicit transaction per INSERT_BATCH_ROWS batch.
+    Returns number of rows inserted (from SQLite's change counter, no table scans).
     """
-    init_db(conn)
-    if not rows:
-        return 0
-    cols = (
-        "posted_at", "fetched_at", "headline", "url", "source", "reporter",
-        "ticker", "is_ai_related", "is_proxy_partnership",
-        "sentiment_finbert", "sentiment_llm_phi3", "sentiment_llm_llama3_2", "sentiment_llm_deepseek_r1",
-    )
-    placeholders = ", ".join("?" for _ in cols)
-    sql = f"INSERT OR IGNORE INTO sentiment_scores ({', '.join(cols)}) VALUES ({placeholders})"
-    cursor = conn.cursor()
-    count_before = cursor.execute("SELECT COUNT(*) FROM sentiment_scores").fetchone()[0]
+    _ensure_schema(conn)
+    before = conn.total_changes
+    batch: list[tuple] = []
     for row in rows:
-        cursor.execute(sql, _row_to_tuple(row))
-    conn.commit()
-    count_after = cursor.execute("SELECT COUNT(*) FROM sentiment_scores").fetchone()[0]
-    return count_after - count_before
+        batch.append(_row_to_tuple(row))
+        if len(batch) >= INSERT_BATCH_ROWS:
+            _insert_batch(conn, batch)
+            batch = []
+    if batch:
+        _insert_batch(conn, batch)
+    return conn.total_changes - before
+
+
+def _insert_batch(conn: sqlite3.Connection, batch: list[tuple]) -> None:
+    with conn:
+        conn.executemany(INSERT_SQL, batch)
+
+
+def ingest_jsonl(conn: sqlite3.Connection, paths: Iterable[Path]) -> int:
+    """Stream-ingest processed_*.jsonl file(s) of any size; returns rows inserted."""
+    return insert_processed_rows(conn, iter_jsonl_rows(paths))
 
 
 if __name__ == "__main__":
@@ -97,5 +148,9 @@ if __name__ == "__main__":
     try:
         init_db(conn)
         print(f"DB initialized: {get_db_path()}")
+        paths = [Path(a) for a in sys.argv[1:]]
+        if paths:
+            inserted = ingest_jsonl(conn, paths)
+            print(f"Inserted {inserted} new row(s) from {len(paths)} file(s).")
     finally:
         conn.close()
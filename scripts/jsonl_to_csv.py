@@ -2,22 +2,28 @@
 
 Scrapers now write daily `data/raw/headlines_YYYYMMDD.csv` directly; use this only for old `headlines_*_*.jsonl` snapshots.
 """
+from __future__ import annotations
+
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
-import pandas as pd
-
 from src.utils import DATA_RAW, load_jsonl
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 CANONICAL_COLS = ["source", "fetched_at", "headline", "posted_at", "reporter", "url"]
 
 
 def dataframe_from_rows(rows: list[dict]) -> pd.DataFrame:
     """Order columns: canonical schema first, then any extras (sorted)."""
+    import pandas as pd
+
     if not rows:
         return pd.DataFrame(columns=CANONICAL_COLS)
     df = pd.DataFrame(rows)
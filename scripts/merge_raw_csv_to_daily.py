@@ -17,8 +17,6 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
-import pandas as pd
-
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
@@ -49,6 +47,7 @@ def main() -> int:
     if not csv_files:
         print("No headlines_*.csv in data/raw.")
         return 0
+    import pandas as pd
 
     by_date: dict[str, list[Path]] = defaultdict(list)
     for p in csv_files:
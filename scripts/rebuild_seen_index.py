@@ -0,0 +1,41 @@
+"""Rebuild the cross-day seen-article index (data/raw/.index/seen.bloom) by scanning every raw file in data/raw.
+
+Run after deleting or rewriting raw files, or to resize: --fp-rate sets the target false-positive rate
+(a false positive drops a genuinely new article), --capacity the number of keys it is sized for.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.scrapers.seen_index import DEFAULT_FP_RATE, SEEN_INDEX_PATH, rebuild_seen_index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the seen-article Bloom filter from data/raw.")
+    parser.add_argument(
+        "--fp-rate",
+        type=float,
+        default=DEFAULT_FP_RATE,
+        help=f"Target false-positive rate (default {DEFAULT_FP_RATE}).",
+    )
+    parser.add_argument(
+        "--capacity",
+        type=int,
+        default=None,
+        help="Keys to size for (default: max of 500000 and twice the archived row count).",
+    )
+    args = parser.parse_args()
+
+    index = rebuild_seen_index(capacity=args.capacity, fp_rate=args.fp_rate)
+    print(
+        f"Wrote {SEEN_INDEX_PATH.relative_to(ROOT)}: {index.count} keys from {len(index.files)} raw file(s), "
+        f"{len(index.bits) / 1024:.0f} KiB, {index.n_hashes} hashes, "
+        f"expected FP rate {index.expected_fp_rate():.1e} (target {index.fp_rate:.0e} at capacity {index.capacity})."
+    )
+
+
+if __name__ == "__main__":
+    main()
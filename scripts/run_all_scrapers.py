@@ -1,5 +1,12 @@
-"""Run all 3 scrapers (TechCrunch, NewsAPI, Google News RSS) and save output to data/raw/."""
+"""Run all 3 scrapers (TechCrunch, NewsAPI, Google News RSS) and save output to data/raw/.
+
+--format csv|parquet|both picks the raw storage (default csv; parquet needs pyarrow).
+--no-seen-index keeps stories already archived on earlier days (default drops them; see
+scripts/rebuild_seen_index.py).
+--compact re-sorts and dedupes today's CSV after the run (appends otherwise keep arrival order).
+"""
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Project root
@@ -7,15 +14,32 @@ ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
 from src.scrapers import scrape_all_sources
+from src.scrapers.base import compact_raw_daily_csv
 
 DATA_RAW = ROOT / "data" / "raw"
 
 
 def main():
+    argv = sys.argv[1:]
+    fmt = "csv"
+    if "--format" in argv:
+        i = argv.index("--format")
+        if i + 1 < len(argv):
+            fmt = argv[i + 1].strip().lower()
+    if fmt not in ("csv", "parquet", "both"):
+        print(f"Unknown --format {fmt!r}; use csv, parquet or both.")
+        return 1
     print("Running all sources (TechCrunch, NewsAPI, Google News RSS)...")
-    articles = scrape_all_sources(save=True)
+    articles = scrape_all_sources(save=True, fmt=fmt, skip_seen="--no-seen-index" not in argv)
+    if "--compact" in argv and fmt in ("csv", "both"):
+        for path in sorted(DATA_RAW.glob(f"headlines_{datetime.now(timezone.utc):%Y%m%d}*.csv")):
+            compact_raw_daily_csv(path)
+            print(f"Compacted {path.name}")
     print(f"\nOutput saved to: {DATA_RAW}")
-    print("  - headlines_YYYYMMDD.csv         (UTC day file; merge + dedupe on repeat runs)")
+    if fmt in ("csv", "both"):
+        print("  - headlines_YYYYMMDD.csv         (UTC day file; new rows appended, deduped by (headline, url))")
+    if fmt in ("parquet", "both"):
+        print("  - parquet/date=YYYYMMDD/         (Parquet partition per UTC day; merge + dedupe)")
     return 0
 
 
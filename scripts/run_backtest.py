@@ -0,0 +1,82 @@
+"""Backtest every daily sentiment feature against forward returns in one pass.
+
+Builds the daily panel from a processed file and aligns it to prices from the local store
+(python scripts/update_prices.py). For every ticker (and ALL pooled), every sentiment feature
+and every horizon it writes: correlation, hit rate, lowest/highest quintile excess return and
+their spread, and the contrarian overlay (short positive, long negative sentiment) PnL.
+--resamples N adds block-bootstrap intervals and permutation p-values for correlation and hit
+rate (src/backtest/significance.py), computed in parallel across --workers processes.
+
+Usage:
+  python scripts/run_backtest.py
+  python scripts/run_backtest.py --variant partnership --lag 1
+  python scripts/run_backtest.py --resamples 5000 --seed 1
+  python scripts/run_backtest.py data/cleaned/processed_base_data.jsonl --horizons 1,5 --output data/cleaned/bt.csv
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.returns.store import PRICE_STORE_PATH
+from src.utils import DATA_CLEANED, iter_rows
+
+DEFAULT_INPUT = DATA_CLEANED / "processed_base_data.jsonl"
+VARIANT_CHOICES = ("all", "ai", "partnership", "direct")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Ticker x sentiment feature x horizon signal backtest.")
+    parser.add_argument("input", nargs="?", type=Path, default=DEFAULT_INPUT, help="Processed JSONL/CSV/Parquet with sentiment_* columns.")
+    parser.add_argument("--db", type=Path, default=PRICE_STORE_PATH, help="Price store (default data/prices.db).")
+    parser.add_argument("--variant", choices=VARIANT_CHOICES, default="all", help="Rows to aggregate (is_ai_related / is_proxy_partnership filters).")
+    parser.add_argument("--horizons", default="1,3,5,7", help="Forward horizons in trading days (default 1,3,5,7; ret_eod is always included).")
+    parser.add_argument("--lag", type=int, default=0, help="Trading days between the headline day and the aligned trade date (default 0).")
+    parser.add_argument("--no-changes", action="store_true", help="Skip <feature>_change signals.")
+    parser.add_argument("--resamples", type=int, default=0, help="Bootstrap and permutation resamples for significance (default 0 = off).")
+    parser.add_argument("--block", type=int, default=5, help="Bootstrap block length in headline days per ticker (default 5).")
+    parser.add_argument("--seed", type=int, default=0, help="Resampling seed (default 0).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes for resampling (default: all cores).")
+    parser.add_argument("--output", type=Path, default=None, help="CSV path (default data/cleaned/backtest_<variant>.csv).")
+    args = parser.parse_args()
+
+    # numpy/pandas load here, so --help and bench_startup stay fast.
+    from src.backtest import ALL_TICKERS, backtest, build_events, significance
+    from src.returns import PriceStore
+    from src.sentiment import build_daily_panel
+
+    if not args.input.exists():
+        print(f"Input not found: {args.input}", file=sys.stderr)
+        return 1
+    if not args.db.exists():
+        print(f"Price store not found: {args.db} (run scripts/update_prices.py)", file=sys.stderr)
+        return 1
+    horizons = [int(h) for h in args.horizons.split(",") if h.strip()]
+    sentiment = build_daily_panel(list(iter_rows(args.input)), variant=args.variant)
+    with PriceStore(args.db) as store:
+        prices = store.load(sentiment.tickers)
+    events = build_events(sentiment, prices, horizons, lag=args.lag, changes=not args.no_changes)
+    results = backtest(events)
+    columns = ["signal", "n", "corr", "hit_rate", "q_spread", "overlay_mean", "overlay_tstat"]
+    if args.resamples > 0:
+        sig = significance(events, args.resamples, block=args.block, seed=args.seed, workers=args.workers)
+        keys = ["ticker", "signal", "horizon"]
+        results = results.merge(sig[keys + ["corr_lo", "corr_hi", "corr_p", "hit_lo", "hit_hi", "hit_p"]], on=keys, how="left")
+        columns += ["corr_lo", "corr_hi", "corr_p", "hit_p"]
+
+    output = args.output or DATA_CLEANED / f"backtest_{args.variant}.csv"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    results.to_csv(output, index=False)
+    print(f"{len(results)} rows ({len(sentiment.tickers)} tickers + {ALL_TICKERS}, {results['signal'].nunique()} signals, {results['horizon'].nunique()} horizons) -> {output}")
+    pooled = results[(results["ticker"] == ALL_TICKERS) & (results["horizon"] == "ret_1d")]
+    print("Pooled 1D, strongest correlations:")
+    top = pooled.reindex(pooled["corr"].abs().sort_values(ascending=False).index).head(10)
+    print(top[columns].to_string(index=False, float_format="%.4f"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
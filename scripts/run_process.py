@@ -4,7 +4,30 @@ Run sentiment pipeline from base data to one processed file.
 Reads data/cleaned/base_data.csv by default (or a custom CSV path),
 runs sentiment (FinBERT + phi3, llama3.2:3b, deepseek-r1:1.5b),
 writes data/cleaned/processed_<suffix>.jsonl.
+
+Scores are cached in data/sentiment_cache.db (keyed by headline, model, prompt version and
+YAML context), so only headlines not scored before hit FinBERT/Ollama. --no-cache disables it.
+Ollama calls run concurrently per model; --concurrency N overrides the per-model in-flight limit.
+
+Every score is appended to processed_<suffix>.checkpoint.jsonl as it arrives; the output is
+assembled from it at the end. After a crash, rerun with --resume to skip headlines already scored.
+
+--collapse-dups scores near-duplicate headlines once (same tickers and the same text after dropping
+a " - Publisher" suffix, case and punctuation); they share scores and rows get a headline_cluster_id
+column. --dup-threshold J (implies --collapse-dups) also merges wording variants down to word Jaccard J,
+which can merge different stories ("No. 1" / "No. 2"). Off by default: every distinct headline is scored.
+
+--backends finbert-int8 scores with the dynamically int8-quantized FinBERT (faster on CPU; separate
+sentiment_finbert_int8 column, parity via scripts/bench_finbert.py). --finbert-threads N sets the
+intra-op CPU threads of either FinBERT (default: $FINBERT_THREADS, else all cores).
+
+--service URL sends cache misses to a running scoring service (scripts/serve_sentiment.py) so models are
+not loaded in this process, e.g. --service http://127.0.0.1:8765 or --service unix:/tmp/sentiment.sock.
+
+The input may also be a .jsonl file or a Parquet dataset directory (e.g. data/cleaned/base_data_parquet);
+--parquet additionally writes data/cleaned/processed_<suffix>_parquet/ (needs pyarrow).
 """
+import os
 import sys
 from pathlib import Path
 import time
@@ -12,13 +35,14 @@ import time
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
-from src.utils import (
-    DATA_CLEANED,
-    load_csv,
-    processed_output_path,
-    write_jsonl,
-)
-from src.sentiment import add_sentiment_to_rows
+from src.utils import DATA_CLEANED, chunked, iter_jsonl, processed_output_path, write_parquet
+from src.sentiment import ScoreCache, run_sentiment_checkpointed
+from src.sentiment.checkpoint import checkpoint_path_for
+from src.sentiment.finbert_scorer import FINBERT_THREADS_ENV
+from src.sentiment.near_dupes import DEFAULT_THRESHOLD
+
+# Processed rows per write_parquet call for --parquet.
+PARQUET_CHUNK_ROWS = 50000
 
 # Default: all backends. Set to ["finbert"] for fast run without LLMs.
 DEFAULT_BACKENDS = ["finbert", "phi3", "llama3.2:3b", "deepseek-r1:1.5b"]
@@ -32,6 +56,33 @@ def main() -> None:
         if i + 1 < len(argv):
             backends = [b.strip() for b in argv[i + 1].split(",") if b.strip()]
         argv = argv[:i] + argv[i + 2 :]
+    concurrency = None
+    if "--concurrency" in argv:
+        i = argv.index("--concurrency")
+        if i + 1 < len(argv):
+            concurrency = int(argv[i + 1])
+        argv = argv[:i] + argv[i + 2 :]
+    dup_threshold = DEFAULT_THRESHOLD if "--collapse-dups" in argv else None
+    if "--dup-threshold" in argv:
+        i = argv.index("--dup-threshold")
+        if i + 1 < len(argv):
+            dup_threshold = float(argv[i + 1])
+        argv = argv[:i] + argv[i + 2 :]
+    if "--finbert-threads" in argv:
+        i = argv.index("--finbert-threads")
+        if i + 1 < len(argv):
+            os.environ[FINBERT_THREADS_ENV] = argv[i + 1]
+        argv = argv[:i] + argv[i + 2 :]
+    service = None
+    if "--service" in argv:
+        i = argv.index("--service")
+        if i + 1 < len(argv):
+            service = argv[i + 1]
+        argv = argv[:i] + argv[i + 2 :]
+    use_cache = "--no-cache" not in argv
+    resume = "--resume" in argv
+    parquet = "--parquet" in argv
+    argv = [a for a in argv if a not in ("--no-cache", "--resume", "--parquet", "--collapse-dups")]
     input_csv = argv[0] if argv else str(DATA_CLEANED / "base_data.csv")
     input_path = Path(input_csv)
     if not input_path.is_absolute():
@@ -42,24 +93,55 @@ def main() -> None:
         sys.exit(1)
 
     stem = input_path.stem
-    suffix = stem.replace("headlines_", "", 1)
+    suffix = stem.replace("headlines_", "", 1).removesuffix("_parquet")
     output_path = processed_output_path(suffix)
     print(f"Using input file: {input_path.name}")
 
     print(f"Sentiment backends: {', '.join(backends)}")
-    if "finbert" in backends and len(backends) == 1:
+    if service:
+        print(f"  (Scoring via service at {service}.)")
+    if all(b.startswith("finbert") for b in backends):
         print("  (FinBERT-only run; use no --backends for full LLM run.)")
-    elif any(b != "finbert" for b in backends):
+    elif any(not b.startswith("finbert") for b in backends):
         print("  (Ensure Ollama is running with phi3, llama3.2:3b, deepseek-r1:1.5b for LLM scores.)")
 
     start_time = time.time()
-    base_rows = load_csv(input_path)
-    full = add_sentiment_to_rows(base_rows, backends=backends)
-    write_jsonl(full, output_path)
+    checkpoint_path = checkpoint_path_for(output_path)
+    if resume and checkpoint_path.exists():
+        print(f"Resuming from checkpoint: {checkpoint_path.name}")
+    cache = ScoreCache() if use_cache else None
+    try:
+        rows_read, rows_written = run_sentiment_checkpointed(
+            input_path,
+            output_path,
+            backends=backends,
+            cache=cache,
+            ollama_concurrency=concurrency,
+            resume=resume,
+            checkpoint_path=checkpoint_path,
+            near_dup_threshold=dup_threshold,
+            service=service,
+        )
+        cache_stats = cache.stats() if cache is not None else None
+    finally:
+        if cache is not None:
+            cache.close()
 
-    print(f"Rows read: {len(base_rows)}")
+    print(f"Rows read: {rows_read}")
     print(f"Output: {output_path}")
-    print(f"Rows written: {len(full)}")
+    print(f"Rows written: {rows_written}")
+    if parquet:
+        parquet_root = DATA_CLEANED / f"{output_path.stem}_parquet"
+        # Clear the dataset, then stream the JSONL in chunks; each chunk is merged into its partitions.
+        write_parquet([], parquet_root, partition_col="posted_at", stem=output_path.stem, replace=True)
+        for rows in chunked(iter_jsonl(output_path), PARQUET_CHUNK_ROWS):
+            write_parquet(rows, parquet_root, partition_col="posted_at", stem=output_path.stem)
+        print(f"Parquet: {parquet_root}")
+    if cache_stats is not None:
+        print(
+            f"Score cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['entries']} entries"
+        )
     print(f"Time taken: {time.time() - start_time:.2f} seconds")
 
 
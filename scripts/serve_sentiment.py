@@ -0,0 +1,92 @@
+"""Run the warm-model scoring service: FinBERT stays loaded, Ollama models are kept warm, requests are micro-batched.
+
+Clients: `python scripts/run_process.py --service http://127.0.0.1:8765` or
+`add_sentiment_to_rows(rows, service="http://127.0.0.1:8765")` (use "unix:/path.sock" with --socket).
+Endpoints: GET /health, GET /stats (per-backend p50/p95 latency, FinBERT batch sizes), POST /score.
+
+Usage:
+  python scripts/serve_sentiment.py
+  python scripts/serve_sentiment.py --backends finbert --socket /tmp/sentiment.sock
+  python scripts/serve_sentiment.py --status            # print /health and /stats of a running service
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.sentiment.finbert_scorer import FINBERT_THREADS_ENV
+from src.sentiment.service import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    MAX_BATCH,
+    MAX_WAIT_MS,
+    ScoringService,
+    ServiceClient,
+    make_server,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local sentiment scoring service with warm models.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default {DEFAULT_PORT}).")
+    parser.add_argument("--socket", type=Path, default=None, help="Serve on this Unix socket instead of TCP.")
+    parser.add_argument(
+        "--backends",
+        default=None,
+        help="Comma-separated BACKENDS ids to serve (default: finbert and the three Ollama models).",
+    )
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help=f"FinBERT micro-batch size (default {MAX_BATCH}).")
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=MAX_WAIT_MS,
+        help=f"Longest a request waits for others to batch with (default {MAX_WAIT_MS}).",
+    )
+    parser.add_argument("--finbert-threads", type=int, default=None, help="Intra-op CPU threads for FinBERT.")
+    parser.add_argument("--no-warm-ollama", action="store_true", help="Do not preload Ollama models at startup.")
+    parser.add_argument("--status", action="store_true", help="Query a running service instead of starting one.")
+    args = parser.parse_args()
+
+    url = f"unix:{args.socket}" if args.socket else f"http://{args.host}:{args.port}"
+    if args.status:
+        try:
+            with ServiceClient(url, timeout=5) as client:
+                print(json.dumps({"health": client.health(), "stats": client.stats()}, indent=2))
+        except OSError as e:
+            print(f"No scoring service at {url}: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.finbert_threads:
+        os.environ[FINBERT_THREADS_ENV] = str(args.finbert_threads)
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()] if args.backends else None
+    service = ScoringService(backends, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+    if not service.backends:
+        print(f"No known backends in {args.backends!r}.", file=sys.stderr)
+        return 1
+    print(f"Loading models for: {', '.join(service.backends)}")
+    service.warm(ollama=not args.no_warm_ollama)
+    cold = [m for m, ok in service.ollama_warm.items() if not ok]
+    if cold:
+        print(f"  Ollama not reachable for {', '.join(cold)}; those backends will retry per request.")
+    server = make_server(service, args.host, args.port, args.socket)
+    print(f"Serving on {url} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket:
+            args.socket.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Fill or extend the local price store (data/prices.db) used by the return analysis.
+
+By default fetches, per ticker, only the days missing between --start and --end from yfinance
+(existing bars are kept). --seed loads bars from a CSV/JSONL/Parquet file first, so the analysis
+can run without network access; --offline skips fetching entirely. --export writes the store
+back out as a CSV that --seed accepts (e.g. to seed CI or another machine).
+
+Usage:
+  python scripts/update_prices.py
+  python scripts/update_prices.py --seed prices.csv --offline
+  python scripts/update_prices.py --tickers NVDA,MSFT --start 2026-01-01 --export data/prices_export.csv
+"""
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.returns.store import PRICE_STORE_PATH, PriceStore
+from src.utils import DATA_CLEANED, iter_rows
+
+# Calendar days of history fetched before the first headline (covers ret_eod and weekend events).
+LEAD_DAYS = 10
+
+
+def _default_tickers() -> list[str]:
+    from src.matching import get_matching_config
+
+    return sorted(get_matching_config()["tickers"])
+
+
+def _default_start() -> date:
+    """LEAD_DAYS before the earliest posted_at in base_data.csv (today if it is missing)."""
+    path = DATA_CLEANED / "base_data.csv"
+    days = [r["posted_at"][:10] for r in iter_rows(path) if r.get("posted_at")] if path.exists() else []
+    first = date.fromisoformat(min(days)) if days else date.today()
+    return first - timedelta(days=LEAD_DAYS)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Update the local SQLite price store.")
+    parser.add_argument("--tickers", default=None, help="Comma-separated tickers (default: every ticker in config/relationships).")
+    parser.add_argument("--start", default=None, help=f"First date YYYY-MM-DD (default: {LEAD_DAYS} days before the first headline).")
+    parser.add_argument("--end", default=None, help="Last date YYYY-MM-DD, inclusive (default: today; a session is only fetched after its close).")
+    parser.add_argument("--seed", type=Path, default=None, help="Load bars from this CSV/JSONL/Parquet file first.")
+    parser.add_argument("--offline", action="store_true", help="Do not fetch; only seed and report.")
+    parser.add_argument("--export", type=Path, default=None, help="Write the whole store to this CSV afterwards.")
+    parser.add_argument("--db", type=Path, default=PRICE_STORE_PATH, help="Store path (default data/prices.db).")
+    args = parser.parse_args()
+
+    with PriceStore(args.db) as store:
+        if args.seed:
+            if not args.seed.exists():
+                print(f"Seed file not found: {args.seed}", file=sys.stderr)
+                return 1
+            print(f"Seeded {store.add_rows(iter_rows(args.seed))} new bar(s) from {args.seed}")
+        if not args.offline:
+            tickers = [t.strip() for t in args.tickers.split(",") if t.strip()] if args.tickers else _default_tickers()
+            start = date.fromisoformat(args.start) if args.start else _default_start()
+            end = date.fromisoformat(args.end) if args.end else date.today()
+            added = store.update(tickers, start, end + timedelta(days=1))
+            print(f"Fetched {sum(added.values())} new bar(s) for {len(tickers)} ticker(s), {start} .. {end}")
+        for ticker, (first, last, n) in store.coverage().items():
+            print(f"  {ticker:6s} {first} .. {last}  ({n} bars)")
+        if args.export:
+            print(f"Exported {store.export_csv(args.export)} bar(s) to {args.export}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
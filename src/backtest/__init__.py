@@ -0,0 +1,21 @@
+"""Signal evaluation over the daily sentiment panel and forward returns."""
+from src.lazy import lazy_exports
+
+# Public name -> submodule, loaded on first attribute access (PEP 562) so importing the package does not load numpy.
+_EXPORTS = {
+    "ALL_TICKERS": ".engine",
+    "METRICS": ".engine",
+    "Events": ".engine",
+    "backtest": ".engine",
+    "build_events": ".engine",
+    "grid_metrics": ".engine",
+    "run_backtest": ".engine",
+    "pair_stats": ".engine",
+    "significance": ".significance",
+    "block_bootstrap_index": ".significance",
+    "permutation_index": ".significance",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,283 @@
+"""Signal backtest over every ticker x sentiment feature x horizon at once: correlation, hit rate, quintiles, overlay PnL."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from src.returns.calendar import trading_day_index
+from src.returns.forward import HORIZONS, eod_returns, forward_returns, horizon_column
+from src.sentiment.daily import ffill
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.returns.store import PricePanel
+    from src.sentiment.daily import DailyPanel
+
+# Scope label of the pooled (all tickers) rows in the result table.
+ALL_TICKERS = "ALL"
+N_QUANTILES = 5
+# Relative variance below which a signal or return is treated as constant (corr NaN, as in pandas).
+VAR_EPS = 1e-12
+# Metric arrays returned by grid_metrics, in result-table column order.
+METRICS = (
+    "n",
+    "corr",
+    "hit_rate",
+    "q_low",
+    "q_high",
+    "q_spread",
+    "overlay_mean",
+    "overlay_total",
+    "overlay_tstat",
+)
+
+
+@dataclass
+class Events:
+    """
+    One column per (date, ticker) with at least one headline: sentiment features (signals, K x E),
+    returns from the aligned trading day (returns, H x E: ret_eod then ret_<h>d) and the same
+    returns in excess of the equal-weight mean over every stored ticker that day (excess).
+    """
+
+    tickers: list[str]
+    ticker_idx: np.ndarray  # (E,) index into tickers
+    days: np.ndarray  # (E,) datetime64[D] headline day (UTC)
+    signal_names: list[str]
+    signals: np.ndarray  # (K, E)
+    return_names: list[str]
+    returns: np.ndarray  # (H, E)
+    excess: np.ndarray  # (H, E)
+
+
+def _changes(values: np.ndarray, observed: np.ndarray) -> np.ndarray:
+    """Per ticker, value minus its value on the previous day with headlines (NaN on the first such day)."""
+    rows = np.arange(values.shape[0])[:, None]
+    last = np.maximum.accumulate(np.where(observed, rows, -1), axis=0)
+    prev = np.vstack([np.full((1, values.shape[1]), -1), last[:-1]])
+    before = np.take_along_axis(values, np.maximum(prev, 0), axis=0)
+    return np.where(observed & (prev >= 0), values - before, np.nan)
+
+
+def _cross_section_mean(matrix: np.ndarray) -> np.ndarray:
+    """Mean over the last axis ignoring NaN (NaN where every value is NaN), keeping dims."""
+    ok = ~np.isnan(matrix)
+    n = ok.sum(axis=-1, keepdims=True)
+    total = np.where(ok, matrix, 0).sum(axis=-1, keepdims=True)
+    out = np.full(n.shape, np.nan)
+    np.divide(total, n, out=out, where=n > 0)
+    return out
+
+
+def build_events(
+    sentiment: DailyPanel,
+    prices: PricePanel,
+    horizons: Sequence[int] = HORIZONS,
+    lag: int = 0,
+    changes: bool = True,
+    values: np.ndarray | None = None,
+) -> Events:
+    """
+    Events from a daily sentiment panel and a price panel. Signals are sentiment.features(values)
+    (per-backend averages, deltas vs FinBERT, spread) plus, with changes, <feature>_change against
+    the ticker's previous headline day. Each day is aligned to the first trading day on or after it
+    (lag shifts by trading days, as in event_returns).
+    """
+    feats = sentiment.features(values if values is not None else ffill(sentiment.mean()))
+    observed = sentiment.headline_counts > 0
+    if changes:
+        feats.update({f"{name}_change": _changes(arr, observed) for name, arr in list(feats.items())})
+    date_idx, tick_idx = np.nonzero(observed)
+    order = np.lexsort((date_idx, tick_idx))
+    date_idx, tick_idx = date_idx[order], tick_idx[order]
+    days = sentiment.dates[date_idx]
+
+    matrices = np.stack([eod_returns(prices.values), *forward_returns(prices.values, horizons)])
+    excess = matrices - _cross_section_mean(matrices)
+    row = trading_day_index(prices.dates, days, lag)
+    col_of = {t: i for i, t in enumerate(prices.tickers)}
+    col = np.array([col_of.get(sentiment.tickers[i], -1) for i in tick_idx], dtype=np.int64)
+    ok = (row >= 0) & (col >= 0)
+    r, c = np.where(ok, row, 0), np.where(ok, col, 0)
+    if matrices.shape[1] == 0:
+        gathered = np.full((2, len(matrices), len(row)), np.nan)
+    else:
+        gathered = np.where(ok, np.stack([matrices[:, r, c], excess[:, r, c]]), np.nan)
+
+    return Events(
+        tickers=list(sentiment.tickers),
+        ticker_idx=tick_idx,
+        days=days,
+        signal_names=list(feats),
+        signals=np.stack([arr[date_idx, tick_idx] for arr in feats.values()]) if feats else np.empty((0, len(days))),
+        return_names=["ret_eod", *(horizon_column(h) for h in horizons)],
+        returns=gathered[0],
+        excess=gathered[1],
+    )
+
+
+def _group_sum(values: np.ndarray, onehot: np.ndarray) -> np.ndarray:
+    """(..., E) @ (E, G) -> (G, ...): per-group sums of the last axis."""
+    return np.moveaxis(values @ onehot, -1, 0)
+
+
+def _quantile_buckets(signals: np.ndarray, group: np.ndarray, n_groups: int, q: int) -> np.ndarray:
+    """
+    Quantile bucket (0 .. q-1) of every signal value within its (signal, group), with pd.qcut's
+    edges (linear-interpolated quantiles, right-closed bins); -1 where the signal is NaN.
+    """
+    n_signals, n_events = signals.shape
+    valid = ~np.isnan(signals)
+    key = np.where(valid, signals, np.inf)
+    order = np.lexsort((key, np.broadcast_to(group, key.shape)), axis=-1)
+    ordered = np.take_along_axis(key, order, axis=-1)
+    sizes = np.bincount(group, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    n_valid = _group_sum(valid.astype(np.float64), np.eye(n_groups)[group]).T.astype(np.int64)  # (K, G)
+    k_idx = np.arange(n_signals)[:, None]
+    edges = []
+    for j in range(1, q):
+        pos = (n_valid - 1) * (j / q)
+        lo = np.floor(np.maximum(pos, 0)).astype(np.int64)
+        hi = np.minimum(lo + 1, np.maximum(n_valid - 1, 0))
+        a = ordered[k_idx, np.minimum(starts + lo, n_events - 1)]
+        b = ordered[k_idx, np.minimum(starts + hi, n_events - 1)]
+        with np.errstate(invalid="ignore"):
+            edge = a + (pos - lo) * (b - a)
+        edges.append(np.where(n_valid > 0, edge, np.nan))
+    per_event = np.stack(edges)[:, :, group]  # (q-1, K, E)
+    bucket = (signals[None] > per_event).sum(axis=0)
+    return np.where(valid, bucket, -1)
+
+
+def pair_stats(
+    signals: np.ndarray,
+    returns: np.ndarray,
+    membership: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (n, corr, hit_rate), each shaped (groups, *batch, signals, horizons), from signals (*batch, K, E),
+    returns (*batch, H, E) and a 0/1 (E, groups) membership matrix (an event may be in several groups).
+    n counts pairs with both values, corr is their Pearson correlation, hit_rate the share of pairs with
+    both values nonzero whose signs match.
+    """
+    s = signals[..., :, None, :]
+    r = returns[..., None, :, :]
+    pair = ~np.isnan(s) & ~np.isnan(r)
+    n = _group_sum(pair.astype(np.float64), membership)
+
+    s0, r0 = np.where(pair, s, 0), np.where(pair, r, 0)
+    # Center by the mean over all pairs so the per-group moment sums below do not cancel.
+    n_all = np.maximum(pair.sum(axis=-1, keepdims=True), 1)
+    ds = np.where(pair, s0 - s0.sum(axis=-1, keepdims=True) / n_all, 0)
+    dr = np.where(pair, r0 - r0.sum(axis=-1, keepdims=True) / n_all, 0)
+    sx, sy = _group_sum(ds, membership), _group_sum(dr, membership)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = _group_sum(ds * dr, membership) - sx * sy / n
+        sxx = _group_sum(ds * ds, membership)
+        syy = _group_sum(dr * dr, membership)
+        vx, vy = sxx - sx * sx / n, syy - sy * sy / n
+        ok = (vx > VAR_EPS * sxx) & (vy > VAR_EPS * syy)
+        corr = np.where(ok, cov / np.sqrt(np.where(ok, vx * vy, 1)), np.nan)
+
+    sign_s, sign_r = np.sign(s0), np.sign(r0)
+    decided = pair & (sign_s != 0) & (sign_r != 0)
+    hits = _group_sum((decided & (sign_s == sign_r)).astype(np.float64), membership)
+    n_decided = _group_sum(decided.astype(np.float64), membership)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hit_rate = np.where(n_decided > 0, hits / n_decided, np.nan)
+    return n, corr, hit_rate
+
+
+def grid_metrics(
+    signals: np.ndarray,
+    returns: np.ndarray,
+    excess: np.ndarray,
+    group: np.ndarray,
+    n_groups: int,
+    n_quantiles: int = N_QUANTILES,
+) -> dict[str, np.ndarray]:
+    """
+    Every METRICS array, shape (groups, signals, horizons), from events (last axis) in one pass:
+    n, corr and hit_rate as in pair_stats, q_low / q_high (mean excess return of the lowest / highest
+    signal quantile), q_spread (high - low), and the contrarian overlay: position -sign(signal) held
+    over the horizon, per-event mean, total and t-stat of its return.
+    """
+    onehot = np.eye(n_groups)[group]  # (E, G)
+    n, corr, hit_rate = pair_stats(signals, returns, onehot)
+    s = signals[:, None, :]  # (K, 1, E)
+    r = returns[None, :, :]  # (1, H, E)
+    pair = ~np.isnan(s) & ~np.isnan(r)  # (K, H, E)
+    pnl = np.where(pair, -np.sign(s) * r, 0)
+    pnl_sum = _group_sum(pnl, onehot)
+    pnl_sq = _group_sum(pnl * pnl, onehot)
+
+    bucket = _quantile_buckets(signals, group, n_groups, n_quantiles)[:, None, :]  # (K, 1, E)
+    x = excess[None, :, :]
+    x_ok = (bucket >= 0) & ~np.isnan(x)
+    quantile_means = []
+    for b in (0, n_quantiles - 1):
+        in_b = x_ok & (bucket == b)
+        total = _group_sum(np.where(in_b, x, 0), onehot)
+        count = _group_sum(in_b.astype(np.float64), onehot)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            quantile_means.append(np.where(count > 0, total / count, np.nan))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        overlay_mean = np.where(n > 0, pnl_sum / n, np.nan)
+        var = np.where(n > 1, (pnl_sq - n * overlay_mean**2) / (n - 1), np.nan)
+        tstat = np.where(var > 0, overlay_mean / np.sqrt(var / n), np.nan)
+    return {
+        "n": n,
+        "corr": corr,
+        "hit_rate": hit_rate,
+        "q_low": quantile_means[0],
+        "q_high": quantile_means[1],
+        "q_spread": quantile_means[1] - quantile_means[0],
+        "overlay_mean": overlay_mean,
+        "overlay_total": np.where(n > 0, pnl_sum, np.nan),
+        "overlay_tstat": tstat,
+    }
+
+
+def backtest(events: Events, n_quantiles: int = N_QUANTILES) -> pd.DataFrame:
+    """
+    Tidy result table: one row per (ticker, signal, horizon) plus the pooled ALL_TICKERS rows, with
+    every METRICS column. Quantiles are formed within each ticker (pooled: across all events).
+    """
+    import pandas as pd
+
+    per_ticker = grid_metrics(
+        events.signals, events.returns, events.excess, events.ticker_idx, len(events.tickers), n_quantiles
+    )
+    pooled = grid_metrics(
+        events.signals, events.returns, events.excess, np.zeros_like(events.ticker_idx), 1, n_quantiles
+    )
+    scopes = [*events.tickers, ALL_TICKERS]
+    shape = (len(scopes), len(events.signal_names), len(events.return_names))
+    g, k, h = (a.ravel() for a in np.indices(shape))
+    data = {
+        "ticker": np.array(scopes, dtype=object)[g],
+        "signal": np.array(events.signal_names, dtype=object)[k],
+        "horizon": np.array(events.return_names, dtype=object)[h],
+    }
+    for name in METRICS:
+        data[name] = np.concatenate([per_ticker[name], pooled[name]]).ravel()
+    df = pd.DataFrame(data)
+    df["n"] = df["n"].astype(np.int64)
+    return df
+
+
+def run_backtest(
+    sentiment: DailyPanel,
+    prices: PricePanel,
+    horizons: Sequence[int] = HORIZONS,
+    lag: int = 0,
+    changes: bool = True,
+    n_quantiles: int = N_QUANTILES,
+) -> pd.DataFrame:
+    """build_events then backtest: the whole ticker x signal x horizon grid as one table."""
+    return backtest(build_events(sentiment, prices, horizons, lag, changes), n_quantiles)
@@ -0,0 +1,199 @@
+"""Block-bootstrap intervals and permutation p-values for the backtest's correlations and hit rates."""
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .engine import ALL_TICKERS, Events, pair_stats
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_RESAMPLES = 2000
+# Consecutive headline days per bootstrap block (per ticker), keeping short-range autocorrelation.
+DEFAULT_BLOCK = 5
+DEFAULT_SEED = 0
+DEFAULT_CI = 0.95
+# Resamples x signals x horizons x events held in memory per chunk (~8 MB per float64 array).
+CHUNK_CELLS = 1_000_000
+
+# Per-process inputs for pool workers, set once by _init_worker.
+_worker_state: dict | None = None
+
+
+def _init_worker(state: dict) -> None:
+    global _worker_state
+    _worker_state = state
+
+
+def _membership(ticker_idx: np.ndarray, n_tickers: int) -> np.ndarray:
+    """(E, tickers + 1) 0/1 matrix: each event counts for its ticker and for the pooled ALL column."""
+    m = np.zeros((len(ticker_idx), n_tickers + 1))
+    m[np.arange(len(ticker_idx)), ticker_idx] = 1
+    m[:, -1] = 1
+    return m
+
+
+def _layout(ticker_idx: np.ndarray, n_tickers: int) -> tuple[np.ndarray, np.ndarray]:
+    """(starts, sizes) of each ticker's contiguous run of events; build_events orders events by ticker."""
+    if np.any(np.diff(ticker_idx) < 0):
+        raise ValueError("events must be ordered by ticker (as build_events returns them)")
+    sizes = np.bincount(ticker_idx, minlength=n_tickers)
+    return np.concatenate([[0], np.cumsum(sizes)[:-1]]), sizes
+
+
+def permutation_index(ticker_idx: np.ndarray, rng: np.random.Generator, n: int) -> np.ndarray:
+    """(n, E) event indices, each row shuffling events within every ticker (ticker_idx sorted)."""
+    return np.argsort(ticker_idx + rng.random((n, len(ticker_idx))), axis=1, kind="stable")
+
+
+def block_bootstrap_index(
+    ticker_idx: np.ndarray,
+    starts: np.ndarray,
+    sizes: np.ndarray,
+    block: int,
+    rng: np.random.Generator,
+    n: int,
+) -> np.ndarray:
+    """
+    (n, E) event indices of circular moving-block bootstrap samples drawn within every ticker: each
+    ticker's run is cut into blocks of `block` events and every block is replaced by `block`
+    consecutive events (wrapping) starting at a uniformly drawn event of the same ticker.
+    """
+    offset = np.arange(len(ticker_idx)) - starts[ticker_idx]
+    n_blocks = -(-sizes // block)
+    base = np.concatenate([[0], np.cumsum(n_blocks)[:-1]])
+    block_of = base[ticker_idx] + offset // block
+    size = sizes[ticker_idx]
+    first = (rng.random((n, int(n_blocks.sum())))[:, block_of] * size).astype(np.int64)
+    return starts[ticker_idx] + (first + offset % block) % size
+
+
+def _run_chunk(state: dict, kind: str, seed: np.random.SeedSequence, n: int) -> tuple[np.ndarray, ...]:
+    """
+    One chunk of n resamples. bootstrap: (corr, hit_rate) per resample as float32 (G, n, K, H).
+    permutation: counts per cell of resamples at least as extreme as observed, and of valid resamples.
+    """
+    rng = np.random.default_rng(seed)
+    signals, returns, ticker_idx = state["signals"], state["returns"], state["ticker_idx"]
+    if kind == "bootstrap":
+        idx = block_bootstrap_index(ticker_idx, state["starts"], state["sizes"], state["block"], rng, n)
+        s = np.moveaxis(signals[:, idx], 0, 1)  # (n, K, E)
+    else:
+        idx = permutation_index(ticker_idx, rng, n)
+        s = signals[None]
+    r = np.moveaxis(returns[:, idx], 0, 1)  # (n, H, E)
+    _, corr, hit = pair_stats(s, r, state["membership"])
+    if kind == "bootstrap":
+        return corr.astype(np.float32), hit.astype(np.float32)
+    corr0, hit0 = state["corr"][:, None], state["hit_rate"][:, None]
+    return (
+        (np.abs(corr) >= np.abs(corr0)).sum(axis=1),
+        (~np.isnan(corr)).sum(axis=1),
+        (hit >= hit0).sum(axis=1),
+        (hit <= hit0).sum(axis=1),
+        (~np.isnan(hit)).sum(axis=1),
+    )
+
+
+def _chunk_task(args: tuple[str, np.random.SeedSequence, int]) -> tuple[np.ndarray, ...]:
+    return _run_chunk(_worker_state, *args)
+
+
+def _map_chunks(state: dict, tasks: list[tuple], workers: int) -> list[tuple[np.ndarray, ...]]:
+    """Run tasks in order, in a process pool when workers > 1 (state is sent once per worker)."""
+    if workers <= 1 or len(tasks) <= 1:
+        return [_run_chunk(state, *t) for t in tasks]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)), initializer=_init_worker, initargs=(state,)
+    ) as pool:
+        return list(pool.map(_chunk_task, tasks))
+
+
+def significance(
+    events: Events,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    block: int = DEFAULT_BLOCK,
+    seed: int = DEFAULT_SEED,
+    workers: int = 1,
+    ci: float = DEFAULT_CI,
+) -> pd.DataFrame:
+    """
+    For every (ticker incl. ALL, signal, horizon): observed corr and hit_rate, ci-level percentile
+    intervals from n_resamples within-ticker block bootstraps (corr_lo / corr_hi, hit_lo / hit_hi),
+    and two-sided p-values from n_resamples within-ticker permutations of returns against signals
+    (corr_p: |corr| at least as large; hit_p: hit rate at least as far out on either side).
+    Resamples run in chunks of about CHUNK_CELLS values, in `workers` processes; each chunk draws
+    from its own child of SeedSequence(seed), so results depend on seed but not on workers.
+    """
+    import pandas as pd
+
+    if block < 1:
+        raise ValueError(f"block must be >= 1, got {block}")
+    n_tickers = len(events.tickers)
+    starts, sizes = _layout(events.ticker_idx, n_tickers)
+    membership = _membership(events.ticker_idx, n_tickers)
+    n, corr, hit_rate = pair_stats(events.signals, events.returns, membership)
+    state = {
+        "signals": events.signals,
+        "returns": events.returns,
+        "ticker_idx": events.ticker_idx,
+        "starts": starts,
+        "sizes": sizes,
+        "block": block,
+        "membership": membership,
+        "corr": corr,
+        "hit_rate": hit_rate,
+    }
+    n_signals, n_horizons, n_events = len(events.signal_names), len(events.return_names), len(events.ticker_idx)
+    per_chunk = max(1, CHUNK_CELLS // max(1, n_signals * n_horizons * n_events))
+    counts = [min(per_chunk, n_resamples - i) for i in range(0, n_resamples, per_chunk)]
+    boot_seed, perm_seed = np.random.SeedSequence(seed).spawn(2)
+    tasks = [("bootstrap", s, c) for s, c in zip(boot_seed.spawn(len(counts)), counts)]
+    tasks += [("permutation", s, c) for s, c in zip(perm_seed.spawn(len(counts)), counts)]
+    results = _map_chunks(state, tasks, workers)
+    boot, perm = results[: len(counts)], results[len(counts) :]
+
+    alpha = (1 - ci) / 2
+    shape = corr.shape
+    bounds = {}
+    for name, k in (("corr", 0), ("hit", 1)):
+        draws = np.concatenate([b[k] for b in boot], axis=1) if boot else np.full((shape[0], 0, *shape[1:]), np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            bounds[name] = np.nanquantile(draws, [alpha, 1 - alpha], axis=1) if draws.shape[1] else np.full((2, *shape), np.nan)
+    if perm:
+        corr_ge, corr_valid, hit_ge, hit_le, hit_valid = (sum(p[i] for p in perm) for i in range(5))
+    else:
+        corr_ge = corr_valid = hit_ge = hit_le = hit_valid = np.zeros(shape)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr_p = np.where(np.isnan(corr), np.nan, (1 + corr_ge) / (1 + corr_valid))
+        hit_p = np.where(
+            np.isnan(hit_rate),
+            np.nan,
+            np.minimum(1.0, 2 * np.minimum(1 + hit_ge, 1 + hit_le) / (1 + hit_valid)),
+        )
+
+    scopes = [*events.tickers, ALL_TICKERS]
+    g, k, h = (a.ravel() for a in np.indices(shape))
+    return pd.DataFrame(
+        {
+            "ticker": np.array(scopes, dtype=object)[g],
+            "signal": np.array(events.signal_names, dtype=object)[k],
+            "horizon": np.array(events.return_names, dtype=object)[h],
+            "n": n.ravel().astype(np.int64),
+            "corr": corr.ravel(),
+            "corr_lo": bounds["corr"][0].ravel(),
+            "corr_hi": bounds["corr"][1].ravel(),
+            "corr_p": corr_p.ravel(),
+            "hit_rate": hit_rate.ravel(),
+            "hit_lo": bounds["hit"][0].ravel(),
+            "hit_hi": bounds["hit"][1].ravel(),
+            "hit_p": hit_p.ravel(),
+        }
+    )
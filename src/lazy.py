@@ -0,0 +1,31 @@
+"""Lazy package exports (PEP 562): public names are imported from their submodule on first access."""
+import sys
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Return (__getattr__, __dir__) for a package __init__. exports maps public name -> relative
+    submodule (e.g. ".pipeline"); the submodule is imported the first time the name is used and
+    the value is cached in the package namespace, so later lookups are plain attribute reads.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        submodule = import_module(module, package)
+        # Importing binds the submodule on the package; an export with the submodule's own name
+        # (e.g. backtest.significance) must shadow it, whichever export was asked for first.
+        short = module.lstrip(".")
+        if exports.get(short) == module:
+            setattr(sys.modules[package], short, getattr(submodule, short))
+        value = getattr(submodule, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
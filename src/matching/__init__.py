@@ -1,12 +1,33 @@
 """Match headlines to Mag 7 tickers and AI relevance using config/relationships and config/entities_global."""
-
 from pathlib import Path
 
-from .config_loader import load_matching_config, build_context_for_headline
-from .matcher import run_matching, run_matching_to_rows
+from src.lazy import lazy_exports
+
+# Public name -> submodule, loaded on first attribute access (PEP 562).
+_EXPORTS = {
+    "load_matching_config": ".config_loader",
+    "get_matching_config": ".config_loader",
+    "build_context_for_headline": ".config_loader",
+    "config_fingerprint": ".config_loader",
+    "compile_matcher": ".matcher",
+    "run_matching": ".matcher",
+    "run_matching_to_rows": ".matcher",
+    "iter_matched_rows": ".matcher",
+}
 
-__all__ = ["load_matching_config", "build_context_for_headline", "run_matching", "run_matching_to_rows"]
+__all__ = [
+    "load_matching_config",
+    "get_matching_config",
+    "build_context_for_headline",
+    "config_fingerprint",
+    "compile_matcher",
+    "run_matching",
+    "run_matching_to_rows",
+    "iter_matched_rows",
+]
 
 CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
 RELATIONSHIPS_DIR = CONFIG_DIR / "relationships"
 ENTITIES_GLOBAL_PATH = CONFIG_DIR / "entities_global.yaml"
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,113 @@
+"""Aho-Corasick keyword automaton: one pass over a headline reports every labeled keyword hit."""
+from collections import deque
+from typing import Iterable
+
+# Hit categories; a label is (category, ticker) with ticker None for the global AI lists.
+AI_PHRASE = "ai_phrase"
+AI_ENTITY = "ai_entity"
+TICKER_KEYWORD = "ticker_keyword"
+PARTNER_KEYWORD = "partner_keyword"
+
+Label = tuple[str, str | None]
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same character class as re's Unicode \\w (alphanumeric or underscore)."""
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordAutomaton:
+    """
+    Multi-pattern matcher over lowercased keywords.
+    Single-token keywords only hit on word boundaries (like r"\\b...\\b"); keywords containing
+    a space hit anywhere as a plain substring. Build once, then call scan() per headline.
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        # Pattern id -> (length, needs word boundary, labels)
+        self._patterns: list[tuple[int, bool, list[Label]]] = []
+        self._pattern_ids: dict[str, int] = {}
+        self._built = False
+
+    def add(self, keyword: str, label: Label) -> None:
+        """Register keyword (case-insensitive) under label. Blank keywords are ignored."""
+        k = keyword.lower().strip()
+        if not k:
+            return
+        pid = self._pattern_ids.get(k)
+        if pid is not None:
+            labels = self._patterns[pid][2]
+            if label not in labels:
+                labels.append(label)
+            return
+        state = 0
+        for ch in k:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        pid = len(self._patterns)
+        self._patterns.append((len(k), " " not in k, [label]))
+        self._pattern_ids[k] = pid
+        self._out[state].append(pid)
+        self._built = False
+
+    def add_all(self, keywords: Iterable[str], label: Label) -> None:
+        for kw in keywords:
+            self.add(kw, label)
+
+    def build(self) -> "KeywordAutomaton":
+        """Compute failure links (BFS) and merge suffix outputs. Called lazily by scan()."""
+        queue: deque[int] = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + [
+                    pid for pid in self._out[self._fail[nxt]] if pid not in self._out[nxt]
+                ]
+        self._built = True
+        return self
+
+    def scan(self, text_lower: str) -> set[Label]:
+        """Return the set of labels whose keywords occur in text_lower (already lowercased)."""
+        if not self._built:
+            self.build()
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        hits: set[Label] = set()
+        n = len(text_lower)
+        state = 0
+        for i, ch in enumerate(text_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            for pid in out[state]:
+                length, needs_boundary, labels = patterns[pid]
+                if needs_boundary:
+                    start = i - length + 1
+                    # \b at each edge: word-ness must differ across the edge.
+                    before = start > 0 and _is_word_char(text_lower[start - 1])
+                    if before == _is_word_char(text_lower[start]):
+                        continue
+                    after = i + 1 < n and _is_word_char(text_lower[i + 1])
+                    if after == _is_word_char(ch):
+                        continue
+                hits.update(labels)
+        return hits
@@ -1,8 +1,16 @@
 """Load entities_global.yaml and config/relationships/*.yaml for the matcher."""
+import hashlib
+import pickle
 from pathlib import Path
 from typing import Any
 
-import yaml
+# Compiled config artifacts (pickled config + automaton + context index), keyed by config_fingerprint.
+# Local cache, safe to delete. Bump COMPILED_CONFIG_VERSION when the compiled layout changes.
+COMPILED_CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "config_cache"
+COMPILED_CONFIG_VERSION = 2
+
+# fingerprint -> compiled config, shared by every caller in this process.
+_compiled_configs: dict[str, dict] = {}
 
 
 def _collect_strings(value: Any) -> list[str]:
@@ -129,10 +137,17 @@ def _ecosystem_all_keywords(ecosystem: dict) -> list[str]:
     return out
 
 
+def _load_yaml(path: Path) -> dict:
+    """safe_load one YAML file ({} if empty). PyYAML is only imported when a config is actually parsed."""
+    import yaml
+
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
 def load_entities_global(path: Path) -> tuple[list[str], list[str]]:
     """Load entities_global.yaml; return (ai_buzz_phrases, ai_buzz_entities)."""
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    data = _load_yaml(path)
     phrases = _collect_strings(data.get("ai_buzz_phrases", []))
     entities = _collect_strings(data.get("ai_buzz_entities", []))
     return (phrases, entities)
@@ -144,8 +159,7 @@ def load_relationship(path: Path) -> tuple[str | None, list[str], list[str], dic
     Returns (ticker, ticker_keywords, partner_keywords, keyword_contexts).
     - keyword_contexts: keyword -> context string for products/subsidiaries that have context/catalyst in YAML.
     """
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    data = _load_yaml(path)
     ticker = _get_ticker_from_meta(data)
     if not ticker:
         return (None, [], [], {})
@@ -204,22 +218,162 @@ def load_matching_config(
     }
 
 
-def build_context_for_headline(headline_lower: str, tickers: list[str], config: dict) -> str | None:
+def config_fingerprint(
+    entities_path: Path | None = None,
+    relationships_dir: Path | None = None,
+) -> str:
+    """sha256 over the raw bytes of entities_global.yaml and every relationships/*.yaml (sorted by name)."""
+    from . import ENTITIES_GLOBAL_PATH, RELATIONSHIPS_DIR
+
+    entities_path = entities_path or ENTITIES_GLOBAL_PATH
+    relationships_dir = relationships_dir or RELATIONSHIPS_DIR
+
+    h = hashlib.sha256()
+    for path in [entities_path, *sorted(relationships_dir.glob("*.yaml"))]:
+        h.update(path.name.encode("utf-8") + b"\0")
+        h.update(path.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def load_search_terms(
+    entities_path: Path | None = None,
+    relationships_dir: Path | None = None,
+) -> list[str]:
+    """
+    NewsAPI query terms: per relationship YAML (sorted by name) the ticker, identity aliases and
+    subsidiary/product names with aliases, then entities_global.yaml AI phrases/entities.
+    Stripped, first occurrence kept; ["AI", "artificial intelligence"] if the config is empty.
+    """
+    from . import ENTITIES_GLOBAL_PATH, RELATIONSHIPS_DIR
+
+    entities_path = entities_path or ENTITIES_GLOBAL_PATH
+    relationships_dir = relationships_dir or RELATIONSHIPS_DIR
+    terms: list[str] = []
+
+    if relationships_dir.exists():
+        for path in sorted(relationships_dir.glob("*.yaml")):
+            try:
+                data = _load_yaml(path)
+            except OSError:
+                continue
+
+            metadata = data.get("metadata") or {}
+            identity = data.get("identity") or {}
+
+            ticker = metadata.get("target_ticker") or identity.get("ticker")
+            if ticker:
+                terms.append(str(ticker))
+
+            for alias in identity.get("aliases", []):
+                terms.append(alias)
+
+            for section in ("subsidiaries", "products"):
+                for name, meta in (data.get(section) or {}).items():
+                    terms.append(str(name))
+                    for alias in (meta or {}).get("aliases", []):
+                        terms.append(alias)
+
+    if entities_path.exists():
+        try:
+            g = _load_yaml(entities_path)
+        except OSError:
+            g = {}
+        terms.extend(g.get("ai_buzz_phrases") or [])
+        terms.extend(g.get("ai_buzz_entities") or [])
+
+    if not terms:
+        terms = ["AI", "artificial intelligence"]
+
+    seen: set[str] = set()
+    out: list[str] = []
+    for t in terms:
+        t = (t or "").strip()
+        if t and t not in seen:
+            seen.add(t)
+            out.append(t)
+    return out
+
+
+def get_matching_config(
+    entities_path: Path | None = None,
+    relationships_dir: Path | None = None,
+    use_disk_cache: bool = True,
+) -> dict:
+    """
+    Compiled matching config: load_matching_config() plus its compiled automaton
+    ("compiled_matcher"), keyword-context index ("compiled_contexts") and NewsAPI
+    "search_terms". Memoized per process and pickled under COMPILED_CONFIG_DIR, both keyed by
+    config_fingerprint, so YAML is only parsed when a file changed. Shared: treat as read-only.
+    """
+    from .matcher import _get_matcher
+
+    fingerprint = config_fingerprint(entities_path, relationships_dir)
+    config = _compiled_configs.get(fingerprint)
+    if config is not None:
+        return config
+    path = COMPILED_CONFIG_DIR / f"matching_v{COMPILED_CONFIG_VERSION}_{fingerprint[:16]}.pickle"
+    if use_disk_cache and path.exists():
+        try:
+            with open(path, "rb") as f:
+                config = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            config = None
+    if config is None:
+        config = load_matching_config(entities_path, relationships_dir)
+        _get_matcher(config)
+        _get_keyword_contexts(config)
+        config["search_terms"] = load_search_terms(entities_path, relationships_dir)
+        if use_disk_cache:
+            COMPILED_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.parent / f"{path.name}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+            # Artifacts for older YAML versions are never read again.
+            for old in COMPILED_CONFIG_DIR.glob("matching_v*.pickle"):
+                if old != path:
+                    old.unlink(missing_ok=True)
+    _compiled_configs[fingerprint] = config
+    return config
+
+
+def _get_keyword_contexts(config: dict) -> dict[str, list[tuple[str, str]]]:
+    """
+    ticker -> [(lowercased keyword, context)] in YAML order, compiled once and cached on the config dict.
+    Entries with an empty keyword or context are dropped.
+    """
+    compiled = config.get("compiled_contexts")
+    if compiled is None:
+        compiled = {
+            ticker: [
+                (kw.lower().strip(), ctx)
+                for kw, ctx in (data.get("keyword_contexts") or {}).items()
+                if kw and kw.strip() and ctx
+            ]
+            for ticker, data in config.get("tickers", {}).items()
+        }
+        config["compiled_contexts"] = compiled
+    return compiled
+
+
+def build_context_for_headline(
+    headline_lower: str,
+    tickers: list[str],
+    config: dict,
+) -> str | None:
     """
     Build a context string for the SLM from YAML: for each ticker, if the headline contains
     a keyword that has a context/catalyst in config, include it. Used to inject e.g.
     "This news relates to NVDA's primary 2026 catalyst" when Blackwell is mentioned.
+    Uses the per-config compiled keyword index (lowercased once).
     """
+    keyword_contexts = _get_keyword_contexts(config)
+    entries = [e for ticker in tickers for e in keyword_contexts.get(ticker, ())]
+    if not entries:
+        return None
     headline_lower = headline_lower.strip().lower()
-    parts: list[str] = []
-    for ticker in tickers:
-        data = config.get("tickers", {}).get(ticker, {})
-        for keyword, ctx in (data.get("keyword_contexts") or {}).items():
-            if not keyword or not ctx:
-                continue
-            kw_lower = keyword.lower()
-            if kw_lower in headline_lower or (" " + kw_lower + " " in " " + headline_lower + " "):
-                parts.append(ctx)
+    parts = [ctx for kw, ctx in entries if kw in headline_lower]
     if not parts:
         return None
     return "This news relates to " + "; ".join(parts) + "."
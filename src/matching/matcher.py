@@ -1,56 +1,66 @@
 """Match headlines to tickers and AI relevance; emit one row per (headline, ticker)."""
 import json
-import re
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
-from .config_loader import load_matching_config
-from src.utils import load_headline_paths
+from .automaton import (
+    AI_ENTITY,
+    AI_PHRASE,
+    PARTNER_KEYWORD,
+    TICKER_KEYWORD,
+    KeywordAutomaton,
+    Label,
+)
+from .config_loader import get_matching_config
+from src.utils import chunked, iter_headline_rows, iter_rows
 
 
 def _normalize(text: str) -> str:
     return " ".join(text.lower().strip().split())
 
 
-def _contains_keyword(text_lower: str, keyword: str) -> bool:
-    """True if keyword appears in text (phrase or word-boundary for single tokens)."""
-    k = keyword.lower().strip()
-    if not k:
-        return False
-    if " " in k:
-        return k in text_lower
-    return bool(re.search(r"\b" + re.escape(k) + r"\b", text_lower))
+def compile_matcher(config: dict) -> KeywordAutomaton:
+    """
+    Build one keyword automaton from loaded config: AI phrases/entities from entities_global.yaml,
+    plus ticker and partner keywords per relationship YAML, each hit labeled by category.
+    """
+    automaton = KeywordAutomaton()
+    automaton.add_all(config.get("ai_buzz_phrases", []), (AI_PHRASE, None))
+    automaton.add_all(config.get("ai_buzz_entities", []), (AI_ENTITY, None))
+    for ticker, data in config.get("tickers", {}).items():
+        automaton.add_all(data.get("ticker_keywords", []), (TICKER_KEYWORD, ticker))
+        automaton.add_all(data.get("partner_keywords", []), (PARTNER_KEYWORD, ticker))
+    return automaton.build()
+
+
+def _get_matcher(config: dict) -> KeywordAutomaton:
+    """Compiled automaton for config, built on first use and cached on the config dict."""
+    matcher = config.get("compiled_matcher")
+    if matcher is None:
+        matcher = compile_matcher(config)
+        config["compiled_matcher"] = matcher
+    return matcher
+
 
+def _scan(headline_lower: str, config: dict) -> set[Label]:
+    """Single pass over the headline; returns every (category, ticker) label hit."""
+    return _get_matcher(config).scan(headline_lower)
 
-def _is_ai_related(headline_lower: str, config: dict) -> bool:
+
+def _is_ai_related(hits: set[Label]) -> bool:
     """Based solely on entities_global.yaml (ai_buzz_phrases + ai_buzz_entities)."""
-    for phrase in config.get("ai_buzz_phrases", []):
-        if _contains_keyword(headline_lower, phrase):
-            return True
-    for entity in config.get("ai_buzz_entities", []):
-        if _contains_keyword(headline_lower, entity):
-            return True
-    return False
-
-
-def _associated_tickers(headline_lower: str, config: dict) -> list[str]:
-    """Tickers for which the headline matches at least one ticker keyword."""
-    associated = []
-    for ticker, data in config.get("tickers", {}).items():
-        for kw in data.get("ticker_keywords", []):
-            if _contains_keyword(headline_lower, kw):
-                associated.append(ticker)
-                break
-    return associated
+    return (AI_PHRASE, None) in hits or (AI_ENTITY, None) in hits
+
 
+def _associated_tickers(hits: set[Label], config: dict) -> list[str]:
+    """Tickers for which the headline matches at least one ticker keyword (config order)."""
+    return [t for t in config.get("tickers", {}) if (TICKER_KEYWORD, t) in hits]
 
-def _is_proxy_partnership(headline_lower: str, ticker: str, config: dict) -> bool:
+
+def _is_proxy_partnership(hits: set[Label], ticker: str) -> bool:
     """True if headline mentions one of this ticker's partner keywords."""
-    data = config.get("tickers", {}).get(ticker, {})
-    for kw in data.get("partner_keywords", []):
-        if _contains_keyword(headline_lower, kw):
-            return True
-    return False
+    return (PARTNER_KEYWORD, ticker) in hits
 
 
 def match_headline(row: dict, config: dict) -> list[dict]:
@@ -60,14 +70,15 @@ def match_headline(row: dict, config: dict) -> list[dict]:
     """
     headline = row.get("headline", "")
     headline_lower = _normalize(headline)
-    is_ai = _is_ai_related(headline_lower, config)
-    tickers = _associated_tickers(headline_lower, config)
+    hits = _scan(headline_lower, config)
+    is_ai = _is_ai_related(hits)
+    tickers = _associated_tickers(hits, config)
     if not tickers:
         return []
 
     out = []
     for ticker in tickers:
-        is_partnership = _is_proxy_partnership(headline_lower, ticker, config)
+        is_partnership = _is_proxy_partnership(hits, ticker)
         out.append({
             "posted_at": row.get("posted_at", ""),
             "fetched_at": row.get("fetched_at", ""),
@@ -82,40 +93,123 @@ def match_headline(row: dict, config: dict) -> list[dict]:
     return out
 
 
+# Rows per task when a single large file is split across workers.
+MATCH_CHUNK_ROWS = 5000
+
+# Per-process config for pool workers, set once by _init_worker.
+_worker_config: dict | None = None
+
+
+def _init_worker(config: dict) -> None:
+    """Pool initializer: receive config once per process and compile its automaton there."""
+    global _worker_config
+    _worker_config = config
+    _get_matcher(_worker_config)
+
+
+def _match_rows(rows: list[dict], config: dict) -> list[dict]:
+    matched: list[dict] = []
+    for row in rows:
+        matched.extend(match_headline(row, config))
+    return matched
+
+
+def _match_path_task(path: Path) -> tuple[int, list[dict]]:
+    n_read = 0
+    matched: list[dict] = []
+    for row in iter_rows(path):
+        n_read += 1
+        matched.extend(match_headline(row, _worker_config))
+    return (n_read, matched)
+
+
+def _match_chunk_task(rows: list[dict]) -> tuple[int, list[dict]]:
+    return (len(rows), _match_rows(rows, _worker_config))
+
+
+def _bounded_map(pool: Any, fn: Callable, items: Iterable, max_pending: int) -> Iterator:
+    """Like pool.map(fn, items), but draws items lazily and keeps at most max_pending tasks in flight."""
+    pending: deque = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _match_chunks(raw_paths: list[Path], config: dict, workers: int) -> Iterator[tuple[int, list[dict]]]:
+    """
+    Yield (headlines_read, matched rows) per file or MATCH_CHUNK_ROWS chunk, in the same order as the
+    serial loop. Raw rows are streamed, so only a few chunks are held at once.
+    workers > 1 uses a process pool: whole files are sharded when there are at least as many files
+    as workers, otherwise rows are split into MATCH_CHUNK_ROWS chunks. The config is sent once per
+    worker via the pool initializer (without the compiled automaton, which each worker rebuilds).
+    """
+    if workers <= 1:
+        for rows in chunked(iter_headline_rows(raw_paths), MATCH_CHUNK_ROWS):
+            yield (len(rows), _match_rows(rows, config))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    plain_config = {k: v for k, v in config.items() if k != "compiled_matcher"}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(plain_config,)
+    ) as pool:
+        if len(raw_paths) >= workers:
+            yield from _bounded_map(pool, _match_path_task, raw_paths, 2 * workers)
+        else:
+            chunks = chunked(iter_headline_rows(raw_paths), MATCH_CHUNK_ROWS)
+            yield from _bounded_map(pool, _match_chunk_task, chunks, 2 * workers)
+
+
+def iter_matched_rows(
+    raw_paths: list[Path],
+    config: dict | None = None,
+    workers: int = 1,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream raw headline file(s) (.csv, .jsonl or Parquet) and yield matched rows lazily, in the
+    same order as run_matching_to_rows. workers > 1 matches in a process pool.
+    """
+    if config is None:
+        config = get_matching_config()
+    for _, matched in _match_chunks(raw_paths, config, workers):
+        yield from matched
+
+
 def run_matching_to_rows(
     raw_paths: list[Path],
     config: dict | None = None,
+    workers: int = 1,
 ) -> list[dict[str, Any]]:
     """
     Read raw headline file(s) (.csv or .jsonl), match each headline, return matched rows (no file write).
     Use this to chain match -> sentiment -> write one processed file.
+    workers > 1 matches in a process pool; output order is identical to the serial path.
     """
-    if config is None:
-        config = load_matching_config()
-    raw_rows = load_headline_paths(raw_paths)
-    matched = []
-    for row in raw_rows:
-        matched.extend(match_headline(row, config))
-    return matched
+    return list(iter_matched_rows(raw_paths, config, workers))
 
 
 def run_matching(
     raw_paths: list[Path],
     output_path: Path,
     config: dict | None = None,
+    workers: int = 1,
 ) -> tuple[int, int]:
     """
     Read raw headline file(s), match each headline, write matched rows to output_path JSONL.
-    Returns (headlines_read, rows_written).
+    Returns (headlines_read, rows_written). workers > 1 matches in a process pool.
     """
     if config is None:
-        config = load_matching_config()
-    raw_rows = load_headline_paths(raw_paths)
-    matched = []
-    for row in raw_rows:
-        matched.extend(match_headline(row, config))
+        config = get_matching_config()
+    n_read = n_written = 0
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as out_f:
-        for row in matched:
-            out_f.write(json.dumps(row, ensure_ascii=False) + "\n")
-    return (len(raw_rows), len(matched))
+        for n, matched in _match_chunks(raw_paths, config, workers):
+            n_read += n
+            n_written += len(matched)
+            for row in matched:
+                out_f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return (n_read, n_written)
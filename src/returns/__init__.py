@@ -0,0 +1,23 @@
+"""Offline price store, vectorized forward returns and trading-calendar event alignment."""
+from src.lazy import lazy_exports
+
+# Public name -> submodule, loaded on first attribute access (PEP 562) so importing the package does not load numpy.
+_EXPORTS = {
+    "PRICE_STORE_PATH": ".store",
+    "PricePanel": ".store",
+    "PriceStore": ".store",
+    "completed_end": ".store",
+    "fetch_yfinance": ".store",
+    "HORIZONS": ".forward",
+    "eod_returns": ".forward",
+    "forward_returns": ".forward",
+    "horizon_column": ".forward",
+    "return_table": ".forward",
+    "event_days": ".calendar",
+    "event_returns": ".calendar",
+    "trading_day_index": ".calendar",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
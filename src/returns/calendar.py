@@ -0,0 +1,71 @@
+"""Trading-calendar alignment of sentiment events to price rows (vectorized replacement for a forward merge_asof)."""
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from .forward import HORIZONS, eod_returns, forward_returns, horizon_column
+from .store import PricePanel
+
+
+def event_days(timestamps: Iterable[str]) -> np.ndarray:
+    """UTC calendar day (datetime64[D]) of each "YYYY-MM-DDTHH:MM:SSZ" / "YYYY-MM-DD" value; NaT if blank/invalid."""
+    out = []
+    for ts in timestamps:
+        s = (ts or "")[:10] if isinstance(ts, str) else str(ts)[:10]
+        try:
+            out.append(np.datetime64(s, "D"))
+        except ValueError:
+            out.append(np.datetime64("NaT", "D"))
+    return np.array(out, dtype="datetime64[D]")
+
+
+def trading_day_index(calendar: np.ndarray, days: np.ndarray, lag: int = 0) -> np.ndarray:
+    """
+    Row in calendar (ascending trading days) of the first trading day on or after each day, shifted
+    by lag trading days (lag=1: next session after it). -1 where that falls outside the calendar or
+    the day is NaT. lag=0 matches merge_asof(direction="forward") on the event date.
+    """
+    days = np.asarray(days, dtype="datetime64[D]")
+    idx = np.searchsorted(calendar, days, side="left") + lag
+    bad = np.isnat(days) | (idx < 0) | (idx >= len(calendar))
+    return np.where(bad, -1, idx)
+
+
+def event_returns(
+    panel: PricePanel,
+    tickers: Sequence[str],
+    days: np.ndarray,
+    horizons: Sequence[int] = HORIZONS,
+    lag: int = 0,
+) -> dict[str, np.ndarray]:
+    """
+    Price-side columns for events (ticker, UTC day) in one gather: trade_date (NaT if unaligned),
+    close, ret_eod and ret_<h>d per horizon, NaN where the ticker is unknown or has no bar.
+    The calendar is the union of the panel's trading days; a ticker missing a bar on the aligned
+    day gets NaN rather than being moved to its own next bar (US tickers share one calendar).
+    """
+    row = trading_day_index(panel.dates, days, lag)
+    col_of = {t: i for i, t in enumerate(panel.tickers)}
+    col = np.array([col_of.get(t, -1) for t in tickers], dtype=np.int64)
+    ok = (row >= 0) & (col >= 0)
+    r, c = np.where(ok, row, 0), np.where(ok, col, 0)
+
+    def gather(matrix: np.ndarray) -> np.ndarray:
+        if matrix.size == 0:
+            return np.full(len(row), np.nan)
+        return np.where(ok, matrix[r, c], np.nan)
+
+    trade_date = np.full(len(row), np.datetime64("NaT"), dtype="datetime64[D]")
+    if len(panel.dates):
+        trade_date = np.where(row >= 0, panel.dates[np.where(row >= 0, row, 0)], trade_date)
+    out = {
+        "trade_date": trade_date,
+        "close": gather(panel.values),
+        "ret_eod": gather(eod_returns(panel.values)),
+    }
+    fwd = forward_returns(panel.values, horizons)
+    for k, h in enumerate(horizons):
+        out[horizon_column(h)] = gather(fwd[k])
+    return out
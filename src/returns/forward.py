@@ -0,0 +1,65 @@
+"""Vectorized trailing and forward returns over a dates x tickers price matrix, for any list of horizons."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from .store import PricePanel
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Forward horizons in trading days, as in the sentiment/return notebook.
+HORIZONS = (1, 3, 5, 7)
+
+
+def horizon_column(h: int) -> str:
+    """Column name for an h-trading-day forward return ("ret_1d")."""
+    return f"ret_{h}d"
+
+
+def eod_returns(prices: np.ndarray) -> np.ndarray:
+    """Close-to-close return into each day: p[t] / p[t-1] - 1 per column; first row NaN."""
+    out = np.full(prices.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[1:] = prices[1:] / prices[:-1] - 1
+    return out
+
+
+def forward_returns(prices: np.ndarray, horizons: Sequence[int] = HORIZONS) -> np.ndarray:
+    """
+    Forward returns p[t+h] / p[t] - 1 for every horizon at once: shape (len(horizons), *prices.shape).
+    Rows are trading days, so h counts trading days; the last h rows (and any NaN price) give NaN.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    out = np.full((len(horizons), *prices.shape), np.nan)
+    n = prices.shape[0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k, h in enumerate(horizons):
+            if h <= 0:
+                raise ValueError(f"horizons must be positive trading-day counts, got {h}")
+            if h < n:
+                out[k, : n - h] = prices[h:] / prices[: n - h] - 1
+    return out
+
+
+def return_table(panel: PricePanel, horizons: Sequence[int] = HORIZONS) -> pd.DataFrame:
+    """
+    Long table like the notebook's per-ticker loop: ticker, trade_date, close, ret_eod and one
+    ret_<h>d column per horizon, sorted by ticker then trade_date (days without a bar dropped).
+    """
+    import pandas as pd
+
+    fwd = forward_returns(panel.values, horizons)
+    n_dates, n_tickers = panel.values.shape
+    data = {
+        "ticker": np.repeat(np.array(panel.tickers, dtype=object), n_dates),
+        "trade_date": np.tile(panel.dates, n_tickers),
+        "close": panel.values.T.ravel(),
+        "ret_eod": eod_returns(panel.values).T.ravel(),
+    }
+    for k, h in enumerate(horizons):
+        data[horizon_column(h)] = fwd[k].T.ravel()
+    df = pd.DataFrame(data)
+    return df[df["close"].notna()].reset_index(drop=True)
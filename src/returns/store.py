@@ -0,0 +1,243 @@
+"""Local daily price store (SQLite): fetched once, extended incrementally, or seeded from a file for offline use."""
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from src.utils import ROOT
+
+if TYPE_CHECKING:
+    import numpy as np
+
+PRICE_STORE_PATH = ROOT / "data" / "prices.db"
+PRICE_FIELDS = ("open", "high", "low", "close", "adj_close", "volume")
+# A day's bar is only fetched once its US session has closed and settled, so the append-only store
+# never keeps a partial intraday bar.
+MARKET_TZ = "America/New_York"
+MARKET_CLOSE = time(16, 0)
+BAR_SETTLE = timedelta(minutes=30)
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS prices (
+    ticker TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    adj_close REAL,
+    volume REAL,
+    PRIMARY KEY (ticker, trade_date)
+);
+"""
+
+# fetch(ticker, start, end) -> rows with trade_date ("YYYY-MM-DD") and PRICE_FIELDS; end is exclusive.
+Fetcher = Callable[[str, date, date], list[dict[str, Any]]]
+
+
+@dataclass
+class PricePanel:
+    """One price field as a dates x tickers float matrix (NaN where a ticker has no bar that day)."""
+
+    dates: np.ndarray  # datetime64[D], ascending: every date any loaded ticker traded
+    tickers: list[str]
+    values: np.ndarray  # shape (len(dates), len(tickers))
+
+    def column(self, ticker: str) -> np.ndarray:
+        return self.values[:, self.tickers.index(ticker)]
+
+
+def _field_name(column: str) -> str:
+    """yfinance / notebook column names ("Date", "Adj Close") -> store names ("trade_date", "adj_close")."""
+    name = column.strip().lower().replace(" ", "_")
+    return "trade_date" if name in ("date", "datetime") else name
+
+
+def _to_float(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch_yfinance(ticker: str, start: date, end: date) -> list[dict[str, Any]]:
+    """Daily unadjusted OHLCV (plus Adj Close) for one ticker from yfinance over [start, end)."""
+    import yfinance as yf
+
+    df = yf.download(
+        tickers=ticker,
+        start=str(start),
+        end=str(end),
+        interval="1d",
+        auto_adjust=False,
+        progress=False,
+    )
+    if df is None or df.empty:
+        return []
+    df = df.reset_index()
+    df.columns = [c if isinstance(c, str) else c[0] for c in df.columns]
+    rows = []
+    for rec in df.to_dict(orient="records"):
+        row = {_field_name(k): v for k, v in rec.items()}
+        row["trade_date"] = str(row["trade_date"])[:10]
+        rows.append(row)
+    return rows
+
+
+def completed_end(now: datetime | None = None) -> date:
+    """
+    Exclusive end date covering only completed sessions: tomorrow (New York) once today's close plus
+    BAR_SETTLE has passed, otherwise today. now defaults to the current time; naive values are UTC.
+    """
+    from zoneinfo import ZoneInfo
+
+    tz = ZoneInfo(MARKET_TZ)
+    if now is None:
+        local = datetime.now(tz)
+    else:
+        local = (now if now.tzinfo else now.replace(tzinfo=ZoneInfo("UTC"))).astimezone(tz)
+    settled = datetime.combine(local.date(), MARKET_CLOSE, tz) + BAR_SETTLE
+    return local.date() + timedelta(days=1) if local >= settled else local.date()
+
+
+class PriceStore:
+    """
+    Append-only (ticker, trade_date) -> OHLCV table. Existing bars are never overwritten, so a
+    seeded or previously fetched history stays fixed; update() only fetches dates outside the
+    range already stored for each ticker. Reads (load, coverage) never touch the network.
+    """
+
+    def __init__(self, path: Path = PRICE_STORE_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(CREATE_TABLE)
+        self._conn.commit()
+
+    def add_rows(self, rows: Iterable[dict[str, Any]], ticker: str | None = None) -> int:
+        """Insert bars not already stored; returns how many were new. Column names as in _field_name."""
+        records = []
+        for raw in rows:
+            row = {_field_name(k): v for k, v in raw.items()}
+            t = (ticker or row.get("ticker") or "").strip()
+            d = str(row.get("trade_date") or "")[:10]
+            if not t or len(d) != 10:
+                continue
+            records.append((t, d, *(_to_float(row.get(f)) for f in PRICE_FIELDS)))
+        before = self._conn.total_changes
+        self._conn.executemany(
+            f"INSERT OR IGNORE INTO prices (ticker, trade_date, {', '.join(PRICE_FIELDS)}) "
+            f"VALUES (?, ?, {', '.join('?' for _ in PRICE_FIELDS)})",
+            records,
+        )
+        self._conn.commit()
+        return self._conn.total_changes - before
+
+    def seed_from_file(self, path: Path) -> int:
+        """Add bars from a CSV / JSONL / Parquet file with ticker, date and OHLCV columns. Returns rows added."""
+        from src.utils import iter_rows
+
+        return self.add_rows(iter_rows(path))
+
+    def coverage(self) -> dict[str, tuple[str, str, int]]:
+        """ticker -> (first trade_date, last trade_date, bar count)."""
+        return {
+            t: (first, last, n)
+            for t, first, last, n in self._conn.execute(
+                "SELECT ticker, MIN(trade_date), MAX(trade_date), COUNT(*) FROM prices GROUP BY ticker ORDER BY ticker"
+            )
+        }
+
+    def update(
+        self,
+        tickers: list[str],
+        start: date,
+        end: date,
+        fetch: Fetcher | None = None,
+    ) -> dict[str, int]:
+        """
+        Make [start, end) available for each ticker, fetching only the parts before the first and
+        after the last stored bar (fetch defaults to fetch_yfinance). Returns ticker -> bars added.
+        end is capped at completed_end(), so a session still trading (or not yet settled) is left
+        for a later update instead of being stored as a partial bar.
+        """
+        fetch = fetch or fetch_yfinance
+        end = min(end, completed_end())
+        cov = self.coverage()
+        added: dict[str, int] = {}
+        for t in tickers:
+            ranges = [(start, end)]
+            if t in cov:
+                first, last = date.fromisoformat(cov[t][0]), date.fromisoformat(cov[t][1])
+                ranges = [(start, first), (last + timedelta(days=1), end)]
+            added[t] = sum(self.add_rows(fetch(t, a, b), ticker=t) for a, b in ranges if a < b)
+        return added
+
+    def load(
+        self,
+        tickers: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        field: str = "close",
+    ) -> PricePanel:
+        """PricePanel of field for tickers (default: all stored) over trade dates in [start, end] (ISO dates)."""
+        if field not in PRICE_FIELDS:
+            raise ValueError(f"field must be one of {PRICE_FIELDS}, got {field!r}")
+        import numpy as np
+
+        where, params = [], []
+        if tickers is not None:
+            where.append(f"ticker IN ({', '.join('?' for _ in tickers)})")
+            params.extend(tickers)
+        if start:
+            where.append("trade_date >= ?")
+            params.append(start)
+        if end:
+            where.append("trade_date <= ?")
+            params.append(end)
+        sql = f"SELECT ticker, trade_date, {field} FROM prices"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        rows = self._conn.execute(sql, params).fetchall()
+        names = sorted({r[0] for r in rows}) if tickers is None else list(tickers)
+        if not rows:
+            return PricePanel(np.array([], dtype="datetime64[D]"), names, np.empty((0, len(names))))
+        t_col = np.array([r[0] for r in rows])
+        d_col = np.array([r[1] for r in rows], dtype="datetime64[D]")
+        v_col = np.array([np.nan if r[2] is None else r[2] for r in rows], dtype=np.float64)
+        dates, d_idx = np.unique(d_col, return_inverse=True)
+        col_of = {t: i for i, t in enumerate(names)}
+        t_idx = np.array([col_of[t] for t in t_col])
+        values = np.full((len(dates), len(names)), np.nan)
+        values[d_idx, t_idx] = v_col
+        return PricePanel(dates, names, values)
+
+    def export_csv(self, path: Path) -> int:
+        """Write every stored bar to a CSV that seed_from_file accepts. Returns rows written."""
+        import csv
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        n = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["ticker", "trade_date", *PRICE_FIELDS])
+            for row in self._conn.execute(
+                f"SELECT ticker, trade_date, {', '.join(PRICE_FIELDS)} FROM prices ORDER BY ticker, trade_date"
+            ):
+                writer.writerow(["" if v is None else v for v in row])
+                n += 1
+        return n
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> PriceStore:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,6 +1,15 @@
-from .base import scrape_all_sources, RawArticle
-from .techcrunch import scrape_techcrunch
-from .newsapi_tech import scrape_newsapi_tech
-from .google_news_rss import scrape_google_news_tech
+from src.lazy import lazy_exports
+
+# Public name -> submodule, loaded on first attribute access (PEP 562) so that importing the package
+# does not pull in requests/feedparser/pandas just to expose names.
+_EXPORTS = {
+    "scrape_all_sources": ".base",
+    "RawArticle": ".base",
+    "scrape_techcrunch": ".techcrunch",
+    "scrape_newsapi_tech": ".newsapi_tech",
+    "scrape_google_news_tech": ".google_news_rss",
+}
 
 __all__ = ["scrape_all_sources", "RawArticle", "scrape_techcrunch", "scrape_newsapi_tech", "scrape_google_news_tech"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,18 +1,36 @@
 """Base scraper: fetch, parse, timestamp extraction, rate limiting, dedup, save daily CSV."""
-import re
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+if TYPE_CHECKING:
+    import requests
 
 DATA_RAW = Path(__file__).resolve().parent.parent.parent / "data" / "raw"
 DATA_RAW.mkdir(parents=True, exist_ok=True)
 
 RAW_ROW_COLUMNS = ["source", "fetched_at", "headline", "posted_at", "reporter", "url"]
+# Per-day sidecar sets of (headline, url) keys for append-only raw CSV writes (local cache, rebuildable).
+RAW_INDEX_DIR = DATA_RAW / ".index"
+# ETag / Last-Modified per feed URL for conditional GETs (committed by CI next to the raw CSVs).
+VALIDATORS_PATH = DATA_RAW / "feed_validators.json"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/115.0"
+# Minimum seconds between request starts to the same host; different hosts never wait on each other.
+DEFAULT_HOST_INTERVAL_S = 1.0
+HOST_MIN_INTERVAL_S: dict[str, float] = {
+    "newsapi.org": 0.2,
+}
 
 
 @dataclass
@@ -51,19 +69,9 @@ def deduplicate(articles: list[RawArticle]) -> list[RawArticle]:
     return out
 
 
-def save_raw_daily_csv(articles: list[RawArticle], suffix: str = "") -> Path:
-    """
-    Append-merge into data/raw/headlines_YYYYMMDD[suffix].csv (UTC calendar day).
-    Schema: source, fetched_at, headline, posted_at, reporter, url.
-    If the file exists, read it, concat new rows, dedupe by (headline, url) keeping first,
-    sort by posted_at then headline, then atomically overwrite.
-    """
-    now = datetime.now(timezone.utc)
-    date_str = now.strftime("%Y%m%d")
-    fetched_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
-    path = DATA_RAW / f"headlines_{date_str}{suffix}.csv"
-
-    new_rows = [
+def _raw_rows(articles: list[RawArticle], fetched_at: str) -> list[dict]:
+    """RawArticle list -> rows in RAW_ROW_COLUMNS schema."""
+    return [
         {
             "source": a.pipeline_source or "unknown",
             "fetched_at": fetched_at,
@@ -74,11 +82,144 @@ def save_raw_daily_csv(articles: list[RawArticle], suffix: str = "") -> Path:
         }
         for a in articles
     ]
-    new_df = pd.DataFrame(new_rows, columns=RAW_ROW_COLUMNS)
+
+
+def save_raw_daily_parquet(articles: list[RawArticle]) -> Path:
+    """
+    Parquet counterpart of save_raw_daily_csv: merge into
+    data/raw/parquet/date=YYYYMMDD/headlines_YYYYMMDD.parquet (UTC fetch day), deduped by (headline, url)
+    keeping first, sorted by posted_at then headline. Needs pyarrow.
+    """
+    from src.utils import DATA_RAW_PARQUET, write_parquet
+
+    now = datetime.now(timezone.utc)
+    fetched_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    write_parquet(
+        _raw_rows(articles, fetched_at),
+        DATA_RAW_PARQUET,
+        partition_col="fetched_at",
+        stem="headlines",
+        key_cols=["headline", "url"],
+        sort_cols=["posted_at", "headline"],
+    )
+    date_str = now.strftime("%Y%m%d")
+    return DATA_RAW_PARQUET / f"date={date_str}" / f"headlines_{date_str}.parquet"
+
+
+def _raw_key(headline: str, url: str) -> str:
+    """Compact (headline, url) dedupe key for the per-day sidecar index."""
+    return hashlib.sha1(f"{headline}\x1f{url}".encode("utf-8")).hexdigest()[:16]
+
+
+def _index_path(path: Path) -> Path:
+    return RAW_INDEX_DIR / f"{path.stem}.keys"
+
+
+def _read_csv_header(path: Path) -> list[str]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _load_day_index(path: Path) -> set[str]:
+    """
+    (headline, url) keys already in a day file. The sidecar is append-only: key lines, each write
+    closed by "@size <bytes>". If the last size does not match the CSV (edited, compacted, or
+    sidecar missing), the index is rebuilt by streaming the CSV.
+    """
+    keys: set[str] = set()
+    size = path.stat().st_size if path.exists() else 0
+    index_path = _index_path(path)
+    if index_path.exists():
+        last_size = None
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line.startswith("@size "):
+                    last_size = int(line[6:])
+                elif line:
+                    keys.add(line)
+        if last_size == size:
+            return keys
+    keys = set()
+    if size > 0:
+        with open(path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                keys.add(_raw_key(row.get("headline", ""), row.get("url", "")))
+    _rewrite_day_index(path, keys)
+    return keys
+
+
+def _rewrite_day_index(path: Path, keys: set[str]) -> None:
+    RAW_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    index_path = _index_path(path)
+    tmp_path = index_path.parent / f"{index_path.name}.tmp"
+    size = path.stat().st_size if path.exists() else 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for k in sorted(keys):
+            f.write(k + "\n")
+        f.write(f"@size {size}\n")
+    tmp_path.replace(index_path)
+
+
+def save_raw_daily_csv(articles: list[RawArticle], suffix: str = "") -> Path:
+    """
+    Append into data/raw/headlines_YYYYMMDD[suffix].csv (UTC calendar day).
+    Schema: source, fetched_at, headline, posted_at, reporter, url.
+    Rows whose (headline, url) is already in the day file (per the sidecar index under
+    data/raw/.index/) are dropped; only new rows are appended, so a second same-day scrape does not
+    rewrite the file. Rows stay in append order; compact_raw_daily_csv restores sorted order.
+    """
+    now = datetime.now(timezone.utc)
+    date_str = now.strftime("%Y%m%d")
+    fetched_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    path = DATA_RAW / f"headlines_{date_str}{suffix}.csv"
+
+    new_rows = _raw_rows(articles, fetched_at)
 
     if not new_rows and path.exists():
         return path
 
+    has_rows = path.exists() and path.stat().st_size > 0
+    if has_rows and _read_csv_header(path) != RAW_ROW_COLUMNS:
+        # Legacy column layout: fall back to a full merge-rewrite in the canonical schema.
+        return compact_raw_daily_csv(path, extra_rows=new_rows)
+
+    seen = _load_day_index(path)
+    fresh: list[dict] = []
+    fresh_keys: list[str] = []
+    for row in new_rows:
+        k = _raw_key(row["headline"], row["url"])
+        if k in seen:
+            continue
+        seen.add(k)
+        fresh.append(row)
+        fresh_keys.append(k)
+
+    if fresh or not has_rows:
+        if has_rows and not _ends_with_newline(path):
+            with open(path, "a", encoding="utf-8", newline="") as f:
+                f.write("\n")
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=RAW_ROW_COLUMNS, lineterminator="\n")
+            if not has_rows:
+                writer.writeheader()
+            writer.writerows(fresh)
+    RAW_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    with open(_index_path(path), "a", encoding="utf-8") as f:
+        for k in fresh_keys:
+            f.write(k + "\n")
+        f.write(f"@size {path.stat().st_size}\n")
+    return path
+
+
+def compact_raw_daily_csv(path: Path, extra_rows: list[dict] | None = None) -> Path:
+    """
+    Optional compaction of one day file: dedupe by (headline, url) keeping first, sort by posted_at
+    then headline (stable), atomically overwrite, and rebuild its sidecar index.
+    """
+    import pandas as pd
+
+    frames = []
     if path.exists() and path.stat().st_size > 0:
         old_df = pd.read_csv(
             path, encoding="utf-8", dtype=str, keep_default_na=False, na_filter=False
@@ -86,78 +227,269 @@ def save_raw_daily_csv(articles: list[RawArticle], suffix: str = "") -> Path:
         for col in RAW_ROW_COLUMNS:
             if col not in old_df.columns:
                 old_df[col] = ""
-        old_df = old_df[RAW_ROW_COLUMNS]
-        combined = pd.concat([old_df, new_df], ignore_index=True)
-        combined = combined.drop_duplicates(subset=["headline", "url"], keep="first")
-        combined = combined.sort_values(
-            by=["posted_at", "headline"], kind="mergesort"
-        ).reset_index(drop=True)
-    else:
-        combined = new_df
+        frames.append(old_df[RAW_ROW_COLUMNS])
+    if extra_rows:
+        frames.append(pd.DataFrame(extra_rows, columns=RAW_ROW_COLUMNS))
+    if not frames:
+        return path
+    combined = pd.concat(frames, ignore_index=True)
+    combined = combined.drop_duplicates(subset=["headline", "url"], keep="first")
+    combined = combined.sort_values(
+        by=["posted_at", "headline"], kind="mergesort"
+    ).reset_index(drop=True)
 
     tmp_path = path.parent / f"{path.name}.tmp"
     combined.to_csv(tmp_path, index=False, encoding="utf-8")
     tmp_path.replace(path)
+    _rewrite_day_index(
+        path, {_raw_key(h, u) for h, u in zip(combined["headline"], combined["url"])}
+    )
     return path
 
 
-def fetch_html(url: str, delay_seconds: float = 1.0, timeout: int = 15) -> str:
-    """GET URL and return text. Respects a short delay to avoid hammering."""
-    time.sleep(delay_seconds)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/115.0"
-    }
-    r = requests.get(url, headers=headers, timeout=timeout)
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
+
+
+class HostRateLimiter:
+    """Thread-safe per-host spacing: each request to a host starts at least its interval after the previous one."""
+
+    def __init__(self, default_interval_s: float = DEFAULT_HOST_INTERVAL_S) -> None:
+        self.default_interval_s = default_interval_s
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str, interval_s: float | None = None) -> None:
+        host = urlparse(url).netloc.lower()
+        if interval_s is None:
+            interval_s = HOST_MIN_INTERVAL_S.get(host.removeprefix("www."), self.default_interval_s)
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = start + interval_s
+        if start > now:
+            time.sleep(start - now)
+
+
+rate_limiter = HostRateLimiter()
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session for every scraper (one connection pool per host, reused across runs)."""
+    import requests
+
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            _session.headers["User-Agent"] = USER_AGENT
+        return _session
+
+
+class ValidatorStore:
+    """
+    ETag / Last-Modified validators per URL, persisted as JSON.
+    Validators from a fetch stay pending until commit(), which scrape_all_sources calls only after
+    the raw file is saved; otherwise a later 304 could hide articles that were never stored.
+    """
+
+    def __init__(self, path: Path = VALIDATORS_PATH) -> None:
+        self.path = path
+        self._saved: dict[str, dict[str, str]] = {}
+        self._pending: dict[str, dict[str, str]] = {}
+        self.not_modified: set[str] = set()
+        self._lock = threading.Lock()
+        if path.exists():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self._saved = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._saved = {}
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for url (empty if never fetched)."""
+        with self._lock:
+            v = self._saved.get(url) or {}
+        headers = {}
+        if v.get("etag"):
+            headers["If-None-Match"] = v["etag"]
+        if v.get("last_modified"):
+            headers["If-Modified-Since"] = v["last_modified"]
+        return headers
+
+    def record(self, url: str, response: requests.Response) -> None:
+        """Note the response status and stage its validators for the next commit()."""
+        with self._lock:
+            if response.status_code == 304:
+                self.not_modified.add(url)
+                return
+            self.not_modified.discard(url)
+            v = {}
+            if response.headers.get("ETag"):
+                v["etag"] = response.headers["ETag"]
+            if response.headers.get("Last-Modified"):
+                v["last_modified"] = response.headers["Last-Modified"]
+            if v:
+                self._pending[url] = v
+
+    def commit(self) -> None:
+        """Persist staged validators (temp file + atomic replace)."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._saved.update(self._pending)
+            self._pending = {}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.parent / f"{self.path.name}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._saved, f, indent=2, sort_keys=True)
+                f.write("\n")
+            tmp_path.replace(self.path)
+
+
+validators = ValidatorStore()
+
+
+def _conditional_get(url: str, timeout: int) -> requests.Response:
+    rate_limiter.wait(url)
+    r = get_session().get(url, headers=validators.request_headers(url), timeout=timeout)
+    if r.status_code != 304:
+        r.raise_for_status()
+    validators.record(url, r)
+    return r
+
+
+def fetch_html(url: str, delay_seconds: float | None = None, timeout: int = 15) -> str:
+    """GET URL via the shared session and return text. Spaced per host (delay_seconds overrides the interval)."""
+    rate_limiter.wait(url, delay_seconds)
+    r = get_session().get(url, timeout=timeout)
     r.raise_for_status()
     return r.text
 
 
-def parse_feed_date(date_str: str) -> str:
-    """Convert feed date string to ISO format for storage."""
-    if not date_str or not hasattr(date_str, "strip"):
-        return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    s = date_str.strip()
-    s_clean = re.sub(r"\s*[+-]\d{4}$", "", re.sub(r"\s*GMT$", "", s))
-    for fmt in (
-        "%a, %d %b %Y %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    ):
-        try:
-            dt = datetime.strptime(s_clean.strip(), fmt)
-            return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-        except (ValueError, TypeError):
-            continue
+def fetch_feed(url: str, timeout: int = 15):
+    """
+    Conditional GET of an RSS/Atom feed via the shared session (per-host spacing), parsed with feedparser.
+    A 304 Not Modified skips parsing and returns an empty feed with status 304.
+    Network/HTTP errors yield an empty parsed feed, as feedparser.parse(url) does.
+    """
+    import feedparser
+    import requests
+
     try:
-        dt = datetime.strptime(s_clean[:10], "%Y-%m-%d")
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-    except (ValueError, TypeError):
-        pass
-    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        r = _conditional_get(url, timeout)
+    except requests.RequestException:
+        return feedparser.parse(b"")
+    if r.status_code == 304:
+        feed = feedparser.parse(b"")
+        feed["status"] = 304
+        return feed
+    feed = feedparser.parse(
+        r.content, response_headers={"content-type": r.headers.get("Content-Type", "")}
+    )
+    feed["status"] = r.status_code
+    return feed
+
+
+def parse_feed_date(date_str: str) -> str:
+    """Convert feed date string to ISO format for storage (see timestamps.TimestampNormalizer)."""
+    from .timestamps import timestamps
+
+    return timestamps.normalize(date_str if isinstance(date_str, str) else "")
 
 
-def scrape_all_sources(save: bool = True, limit_per_source: int = 100) -> list[RawArticle]:
-    """Run all configured scrapers, dedupe, optionally save. Returns combined list."""
-    from .techcrunch import scrape_techcrunch
+def scrape_all_sources(
+    save: bool = True,
+    limit_per_source: int = 100,
+    fmt: str = "csv",
+    skip_seen: bool = True,
+) -> list[RawArticle]:
+    """
+    Run all configured scrapers, dedupe, optionally save. Returns combined list.
+    skip_seen drops articles whose (headline, url) is already archived on any earlier day (SeenIndex
+    Bloom filter; new keys are added after save).
+    Feeds are fetched conditionally (ETag / Last-Modified); unchanged feeds report "not modified".
+    Validators are persisted only when save=True, after the raw file is written.
+    fmt: "csv" (daily CSV), "parquet" (date-partitioned Parquet dataset) or "both".
+    """
+    from .techcrunch import TECHCRUNCH_FEED, scrape_techcrunch
     from .newsapi_tech import scrape_newsapi_tech
-    from .google_news_rss import scrape_google_news_tech
+    from .google_news_rss import GOOGLE_NEWS_AI_RSS, scrape_google_news_tech
+
+    def newsapi_or_empty(limit: int) -> list[RawArticle]:
+        try:
+            return scrape_newsapi_tech(limit=limit)
+        except ValueError:
+            return []
+
+    sources = [
+        ("TechCrunch", scrape_techcrunch),
+        ("NewsAPI", newsapi_or_empty),
+        ("Google News", scrape_google_news_tech),
+    ]
+    feed_urls = {"TechCrunch": TECHCRUNCH_FEED, "Google News": GOOGLE_NEWS_AI_RSS}
+
+    def timed(scrape) -> tuple[list[RawArticle], float]:
+        t0 = time.monotonic()
+        articles = scrape(limit=limit_per_source)
+        return articles, time.monotonic() - t0
+
+    from .timestamps import timestamps
+
+    timestamps.reset()
+    # Sources run concurrently (HostRateLimiter spaces same-host requests); results are combined
+    # in fixed source order so dedupe keeps the same first occurrence as a serial run.
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = [pool.submit(timed, scrape) for _, scrape in sources]
+        results = [f.result() for f in futures]
+    wall = time.monotonic() - start
+
     all_articles = []
-    tc = scrape_techcrunch(limit=limit_per_source)
-    all_articles.extend(tc)
-    time.sleep(1.0)
-    try:
-        newsapi = scrape_newsapi_tech(limit=limit_per_source)
-    except ValueError:
-        newsapi = []
-    all_articles.extend(newsapi)
-    time.sleep(1.0)
-    google_news = scrape_google_news_tech(limit=limit_per_source)
-    all_articles.extend(google_news)
-    n_tc, n_newsapi, n_google = len(tc), len(newsapi), len(google_news)
+    for articles, _ in results:
+        all_articles.extend(articles)
+    parts = []
+    for (name, _), (articles, elapsed) in zip(sources, results):
+        if feed_urls.get(name) in validators.not_modified:
+            parts.append(f"{name} not modified ({elapsed:.1f}s)")
+        else:
+            parts.append(f"{name} {len(articles)} ({elapsed:.1f}s)")
+    before = ", ".join(parts)
     all_articles = deduplicate(all_articles)
+    archived = ""
+    seen = None
+    if skip_seen:
+        from .seen_index import SeenIndex, seen_key
+
+        seen = SeenIndex.open()
+        n_before = len(all_articles)
+        all_articles = [a for a in all_articles if seen_key(a.headline, a.url) not in seen]
+        archived = f"  |  Already archived: {n_before - len(all_articles)}"
     if save:
-        save_raw_daily_csv(all_articles)
-    print(f"  Before dedup: TechCrunch {n_tc}, NewsAPI {n_newsapi}, Google News {n_google}  |  After dedup: {len(all_articles)}")
+        saved: list[Path] = []
+        if fmt in ("csv", "both"):
+            saved.append(save_raw_daily_csv(all_articles))
+        if fmt in ("parquet", "both"):
+            saved.append(save_raw_daily_parquet(all_articles))
+        validators.commit()
+        if seen is not None:
+            seen.add_rows({"headline": a.headline, "url": a.url} for a in all_articles)
+            for path in saved:
+                if path.exists():
+                    seen.files[path.name] = path.stat().st_size
+            seen.save()
+    print(
+        f"  Before dedup: {before}  |  After dedup: {len(all_articles)}{archived}  |  "
+        f"Fetch wall time: {wall:.1f}s"
+    )
+    if timestamps.fallbacks:
+        samples = ", ".join(f"{src or '?'}: {val}" for src, val in timestamps.fallback_samples[:3])
+        print(f"  Warning: {timestamps.fallbacks} article(s) had no parseable date and were stamped now ({samples})")
     return all_articles
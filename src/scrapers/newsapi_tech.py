@@ -1,16 +1,12 @@
 """Technology / Mag-7 / AI headlines via NewsAPI.org. Query built from config entities."""
 import os
-import re
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import yaml
-
-from .base import RawArticle
+from .base import RawArticle, get_session, rate_limiter
+from .timestamps import timestamps
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-_RELATIONSHIPS_DIR = _PROJECT_ROOT / "config" / "relationships"
-_GLOBAL_CONFIG_PATH = _PROJECT_ROOT / "config" / "entities_global.yaml"
 _SECRETS_ENV = _PROJECT_ROOT / "config" / "secrets.env"
 
 
@@ -31,61 +27,12 @@ def _load_api_key_from_file() -> str | None:
 
 def _load_search_terms() -> list[str]:
     """
-    Load Mag-7 tickers/aliases and AI buzz from the new YAML layout:
-
-    - Tickers and aliases from config/relationships/<ticker>.yaml
-    - AI buzz phrases/entities from config/entities_global.yaml
+    Mag-7 tickers/aliases/products/subsidiaries (config/relationships/*.yaml) and AI buzz
+    (config/entities_global.yaml), from the shared compiled config (see load_search_terms).
     """
-    terms: list[str] = []
-
-    # 1) Per-ticker relationships: tickers, aliases, products, subsidiaries.
-    if _RELATIONSHIPS_DIR.exists():
-        for path in _RELATIONSHIPS_DIR.glob("*.yaml"):
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-            except OSError:
-                continue
+    from src.matching import get_matching_config
 
-            metadata = data.get("metadata") or {}
-            identity = data.get("identity") or {}
-
-            ticker = metadata.get("target_ticker") or identity.get("ticker")
-            if ticker:
-                terms.append(str(ticker))
-
-            for alias in identity.get("aliases", []):
-                terms.append(alias)
-
-            for section in ("subsidiaries", "products"):
-                for name, meta in (data.get(section) or {}).items():
-                    terms.append(str(name))
-                    for alias in (meta or {}).get("aliases", []):
-                        terms.append(alias)
-
-    # 2) Global AI buzzwords / entities.
-    if _GLOBAL_CONFIG_PATH.exists():
-        try:
-            with open(_GLOBAL_CONFIG_PATH, encoding="utf-8") as f:
-                g = yaml.safe_load(f) or {}
-        except OSError:
-            g = {}
-        terms.extend(g.get("ai_buzz_phrases") or [])
-        terms.extend(g.get("ai_buzz_entities") or [])
-
-    # Fallback if config is missing or empty.
-    if not terms:
-        terms = ["AI", "artificial intelligence"]
-
-    # Deduplicate while preserving order.
-    seen: set[str] = set()
-    out: list[str] = []
-    for t in terms:
-        t = (t or "").strip()
-        if t and t not in seen:
-            seen.add(t)
-            out.append(t)
-    return out
+    return list(get_matching_config()["search_terms"])
 
 
 def _build_query(terms: list[str], max_len: int = 500) -> str:
@@ -109,15 +56,8 @@ def _build_query(terms: list[str], max_len: int = 500) -> str:
 
 
 def _normalize_ts(published_at: str | None) -> str:
-    """Normalize to ISO with Z."""
-    if not (published_at or "").strip():
-        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    s = (published_at or "").strip()
-    if s.endswith("Z") or re.search(r"[+-]\d{2}:?\d{2}$", s):
-        return s if s.endswith("Z") else s.replace(" ", "T") + "Z"
-    if "T" in s:
-        return s + "Z" if not s.endswith("Z") else s
-    return s[:10] + "T12:00:00Z"
+    """Normalize to ISO with Z (UTC); date-only values get 12:00:00."""
+    return timestamps.normalize(published_at or "", "NewsAPI", date_only_time="12:00:00")
 
 
 def scrape_newsapi_tech(
@@ -137,19 +77,33 @@ def scrape_newsapi_tech(
         )
 
     from newsapi import NewsApiClient
+    from newsapi.const import TOP_HEADLINES_URL
 
-    client = NewsApiClient(api_key=key)
-    all_articles: list[RawArticle] = []
-    page = 1
+    client = NewsApiClient(api_key=key, session=get_session())
     page_size = min(100, max(limit, 20))
 
-    while True:
-        resp = client.get_top_headlines(
+    def fetch_page(page: int):
+        rate_limiter.wait(TOP_HEADLINES_URL)
+        return client.get_top_headlines(
             category="technology",
             country=country,
             page_size=page_size,
             page=page,
         )
+
+    # Page 1 tells us totalResults; the remaining pages (capped at 10 and at `limit`) are fetched
+    # concurrently, then processed in page order with the same stop rules as a serial walk.
+    first = fetch_page(1)
+    pages = [first]
+    total = first.get("totalResults") if isinstance(first, dict) else getattr(first, "totalResults", None)
+    if isinstance(total, int):
+        n_pages = min(10, -(-min(total, limit) // page_size))
+        if n_pages > 1:
+            with ThreadPoolExecutor(max_workers=min(4, n_pages - 1)) as pool:
+                pages.extend(pool.map(fetch_page, range(2, n_pages + 1)))
+
+    all_articles: list[RawArticle] = []
+    for resp in pages:
         status = resp.get("status") if isinstance(resp, dict) else getattr(resp, "status", None)
         if status != "ok":
             break
@@ -181,8 +135,5 @@ def scrape_newsapi_tech(
             break
         if len(articles) < page_size:
             break
-        page += 1
-        if page > 10:
-            break
 
     return all_articles[:limit]
@@ -0,0 +1,196 @@
+"""Persistent Bloom filter of every archived (headline, url), so repeat stories are dropped before the raw CSV."""
+import hashlib
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Iterable
+
+SEEN_INDEX_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "raw" / ".index" / "seen.bloom"
+# False-positive rate = chance a genuinely new article is taken as already archived (and dropped).
+DEFAULT_FP_RATE = 1e-4
+DEFAULT_CAPACITY = 500_000
+
+
+def seen_key(headline: str, url: str) -> bytes:
+    """Digest of the same (headline, url) pair the daily raw CSV dedupes on."""
+    return hashlib.sha256(f"{headline}\x1f{url}".encode("utf-8")).digest()
+
+
+def _bloom_params(capacity: int, fp_rate: float) -> tuple[int, int]:
+    """Optimal (bits, hash count) for capacity items at fp_rate."""
+    n_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+    n_hashes = max(1, round(n_bits / capacity * math.log(2)))
+    return n_bits, n_hashes
+
+
+class SeenIndex:
+    """
+    Bloom filter over seen_key digests, persisted as SEEN_INDEX_PATH (bit array) plus a
+    "<name>.json" header (sizing, item count, and the size of each raw file already folded in).
+    No false negatives: anything added is always reported seen. open() folds in raw files that
+    are new or grew since the last save (e.g. after a git pull), so the index never lags data/raw.
+    """
+
+    def __init__(
+        self,
+        path: Path = SEEN_INDEX_PATH,
+        capacity: int = DEFAULT_CAPACITY,
+        fp_rate: float = DEFAULT_FP_RATE,
+    ) -> None:
+        if not 0 < fp_rate < 1:
+            raise ValueError(f"fp_rate must be between 0 and 1, got {fp_rate}")
+        self.path = path
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.n_bits, self.n_hashes = _bloom_params(capacity, fp_rate)
+        self.bits = bytearray((self.n_bits + 7) // 8)
+        self.count = 0
+        self.files: dict[str, int] = {}
+
+    @property
+    def meta_path(self) -> Path:
+        return self.path.parent / f"{self.path.name}.json"
+
+    def _positions(self, key: bytes) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over two 64-bit halves of the digest.
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:16], "little") | 1
+        return [(h1 + i * h2) % self.n_bits for i in range(self.n_hashes)]
+
+    def __contains__(self, key: bytes) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: bytes) -> bool:
+        """Set key's bits. Returns True if the key was not (apparently) present before."""
+        new = False
+        for p in self._positions(key):
+            mask = 1 << (p & 7)
+            if not self.bits[p >> 3] & mask:
+                self.bits[p >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def add_rows(self, rows: Iterable[dict]) -> int:
+        """Add (headline, url) of each row; returns how many were new."""
+        return sum(self.add(seen_key(r.get("headline", ""), r.get("url", ""))) for r in rows)
+
+    def expected_fp_rate(self) -> float:
+        """Current false-positive estimate given the number of items added."""
+        return (1 - math.exp(-self.n_hashes * self.count / self.n_bits)) ** self.n_hashes
+
+    def sync_raw(self, raw_paths: list[Path]) -> int:
+        """Fold in raw files whose size changed since they were last added. Returns keys added."""
+        from src.utils import iter_rows
+
+        added = 0
+        for p in raw_paths:
+            size = p.stat().st_size
+            if self.files.get(p.name) == size:
+                continue
+            added += self.add_rows(iter_rows(p))
+            self.files[p.name] = size
+        if self.count > self.capacity:
+            print(
+                f"  Seen index holds {self.count} keys (capacity {self.capacity}); "
+                f"FP rate now ~{self.expected_fp_rate():.1e}. Rebuild with a larger --capacity.",
+                file=sys.stderr,
+            )
+        return added
+
+    def save(self) -> None:
+        """Atomically write the bit array and header."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.parent / f"{self.path.name}.tmp"
+        tmp_path.write_bytes(self.bits)
+        meta = {
+            "capacity": self.capacity,
+            "fp_rate": self.fp_rate,
+            "n_bits": self.n_bits,
+            "n_hashes": self.n_hashes,
+            "count": self.count,
+            "files": self.files,
+        }
+        tmp_meta = self.meta_path.parent / f"{self.meta_path.name}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, sort_keys=True)
+            f.write("\n")
+        tmp_path.replace(self.path)
+        tmp_meta.replace(self.meta_path)
+
+    @classmethod
+    def load(cls, path: Path = SEEN_INDEX_PATH) -> "SeenIndex | None":
+        """Read a saved index; None if missing or inconsistent."""
+        meta_path = path.parent / f"{path.name}.json"
+        if not path.exists() or not meta_path.exists():
+            return None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            index = cls(path, capacity=meta["capacity"], fp_rate=meta["fp_rate"])
+            bits = path.read_bytes()
+        except (OSError, ValueError, KeyError, json.JSONDecodeError):
+            return None
+        if (index.n_bits, index.n_hashes) != (meta["n_bits"], meta["n_hashes"]) or len(bits) != len(index.bits):
+            return None
+        index.bits = bytearray(bits)
+        index.count = meta.get("count", 0)
+        index.files = meta.get("files", {})
+        return index
+
+    def is_ahead_of(self, raw_paths: list[Path]) -> bool:
+        """
+        True if a file folded in is now missing or smaller than recorded (e.g. an index restored
+        from a CI cache whose scrape was never pushed): its keys may not be archived any more.
+        """
+        sizes = {p.name: p.stat().st_size for p in raw_paths}
+        return any(sizes.get(name, -1) < size for name, size in self.files.items())
+
+    @classmethod
+    def open(cls, path: Path = SEEN_INDEX_PATH) -> "SeenIndex":
+        """
+        Load the saved index and fold in only raw files that are new or grew since it was saved.
+        Builds it from data/raw if absent, or if it is ahead of data/raw (see is_ahead_of).
+        """
+        index = cls.load(path)
+        raw_paths = _archived_paths()
+        if index is None or index.is_ahead_of(raw_paths):
+            return rebuild_seen_index(path)
+        if index.sync_raw(raw_paths):
+            index.save()
+        return index
+
+
+def _archived_paths() -> list[Path]:
+    """Raw daily CSV / legacy JSONL files plus raw Parquet partitions, if any."""
+    from src.utils import iter_raw_headline_paths, iter_raw_parquet_paths
+
+    return iter_raw_headline_paths() + iter_raw_parquet_paths()
+
+
+def rebuild_seen_index(
+    path: Path = SEEN_INDEX_PATH,
+    capacity: int | None = None,
+    fp_rate: float = DEFAULT_FP_RATE,
+) -> SeenIndex:
+    """
+    Build a fresh index from every archived raw file (see _archived_paths) and save it.
+    capacity defaults to DEFAULT_CAPACITY or twice the archived row count, whichever is larger.
+    """
+    raw_paths = _archived_paths()
+    if capacity is None:
+        # Lines are a cheap upper bound on distinct keys; Parquet partitions mirror the CSVs, so skip them.
+        n_rows = 0
+        for p in raw_paths:
+            if p.suffix == ".parquet":
+                continue
+            with open(p, "rb") as f:
+                n_rows += sum(1 for _ in f)
+        capacity = max(DEFAULT_CAPACITY, 2 * n_rows)
+    index = SeenIndex(path, capacity=capacity, fp_rate=fp_rate)
+    index.sync_raw(raw_paths)
+    index.save()
+    return index
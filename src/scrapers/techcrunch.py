@@ -1,38 +1,14 @@
 """TechCrunch scraper via RSS feed."""
-import time
-from datetime import datetime, timezone
-
-import feedparser
-
-from .base import RawArticle, parse_feed_date
+from .base import RawArticle, fetch_feed
+from .timestamps import timestamps
 
 TECHCRUNCH_FEED = "https://techcrunch.com/feed/"
 
 
-def _parse_date(entry) -> str:
-    """Get ISO timestamp from feed entry."""
-    for key in ("published", "updated", "created"):
-        val = entry.get(key)
-        if val:
-            if hasattr(val, "strip"):
-                return parse_feed_date(val)
-            # feedparser can return time.struct_time
-            if hasattr(val, "tm_year"):
-                try:
-                    dt = datetime(
-                        val.tm_year, val.tm_mon, val.tm_mday,
-                        val.tm_hour, val.tm_min, min(val.tm_sec, 59),
-                    )
-                    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-                except (ValueError, TypeError):
-                    pass
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-
 def scrape_techcrunch(limit: int = 50) -> list[RawArticle]:
     """Fetch TechCrunch RSS and return RawArticle list."""
     articles = []
-    feed = feedparser.parse(TECHCRUNCH_FEED)
+    feed = fetch_feed(TECHCRUNCH_FEED)
     for i, entry in enumerate(feed.entries):
         if i >= limit:
             break
@@ -49,7 +25,7 @@ def scrape_techcrunch(limit: int = 50) -> list[RawArticle]:
         if "<" in summary:
             from bs4 import BeautifulSoup
             summary = BeautifulSoup(summary, "lxml").get_text(separator=" ").strip()[:500]
-        ts = _parse_date(entry)
+        ts = timestamps.entry_timestamp(entry, "TechCrunch")
         articles.append(
             RawArticle(
                 url=link,
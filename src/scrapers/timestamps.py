@@ -0,0 +1,186 @@
+"""Shared timestamp normalization for scrapers: any feed/API date -> "YYYY-MM-DDTHH:MM:SSZ" (UTC)."""
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Keys feedparser fills for an entry, most specific first; each has a "<key>_parsed" struct_time (UTC).
+ENTRY_DATE_KEYS = ("published", "updated", "created")
+MAX_FALLBACK_SAMPLES = 20
+
+
+def _format_utc(dt: datetime) -> str:
+    """Aware datetimes are converted to UTC; naive ones are taken as UTC already."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+
+
+def _parse_iso(s: str) -> datetime:
+    # Python 3.11+: "Z", offsets, fractional seconds, "T" or space separator, date-only.
+    return datetime.fromisoformat(s)
+
+
+_MONTHS = {m: i for i, m in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+)}
+_UTC_ZONES = frozenset(("GMT", "UT", "UTC", "Z", "+0000", "-0000"))
+
+
+def _parse_rfc2822(s: str) -> datetime:
+    # RSS pubDate: "Mon, 09 Mar 2026 14:05:00 GMT" / "+0000". The common UTC shape is split by hand;
+    # anything else goes through email.utils (raises ValueError/TypeError when not RFC 2822).
+    parts = s.split()
+    if len(parts) == 6 and parts[5] in _UTC_ZONES and len(parts[4]) == 8:
+        month = _MONTHS.get(parts[2])
+        if month is not None:
+            hms = parts[4]
+            # Naive = UTC for _format_utc.
+            return datetime(int(parts[3]), month, int(parts[1]), int(hms[:2]), int(hms[3:5]), int(hms[6:]))
+    return parsedate_to_datetime(s)
+
+
+def _parse_date_prefix(s: str) -> datetime:
+    # Last resort before "now": a leading YYYY-MM-DD with unparseable trailing junk.
+    return datetime.strptime(s[:10], "%Y-%m-%d")
+
+
+PARSERS: tuple[tuple[str, Callable[[str], datetime]], ...] = (
+    ("iso", _parse_iso),
+    ("rfc2822", _parse_rfc2822),
+    ("date_prefix", _parse_date_prefix),
+)
+# Try order per "last successful parser" index: that parser first, then the rest in PARSERS order.
+_ORDERS = tuple(
+    (first,) + tuple(i for i in range(len(PARSERS)) if i != first) for first in range(len(PARSERS))
+)
+
+
+class TimestampNormalizer:
+    """
+    Normalizes date strings and feedparser struct_times to ISO_FORMAT. Per source, the parser that
+    last succeeded is tried first (feeds are consistent, so usually one attempt per value).
+    Counts successes per format and every fallback to the current time, with a few sample inputs,
+    so bad rows are visible instead of silently stamped "now".
+    """
+
+    def __init__(self) -> None:
+        self._last: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.counts: Counter[str] = Counter()
+        self.fallback_samples: list[tuple[str, str]] = []
+
+    @property
+    def fallbacks(self) -> int:
+        return self.counts["fallback_now"]
+
+    def _record(self, fmt: str, source: str = "", value: str = "") -> None:
+        # Scrapers share one normalizer across threads; Counter += is a read-modify-write.
+        with self._lock:
+            self.counts[fmt] += 1
+            if fmt == "fallback_now" and len(self.fallback_samples) < MAX_FALLBACK_SAMPLES:
+                self.fallback_samples.append((source, value))
+
+    def parse(self, value: str, source: str = "") -> tuple[datetime, str] | None:
+        """(datetime, parser name) for value, or None if no parser accepts it."""
+        s = value.strip()
+        if not s:
+            return None
+        first = self._last.get(source, 0)
+        for i in _ORDERS[first]:
+            name, parser = PARSERS[i]
+            try:
+                dt = parser(s)
+            except (ValueError, TypeError, IndexError):
+                continue
+            if i != first:
+                self._last[source] = i
+            return dt, name
+        return None
+
+    def normalize(
+        self,
+        value,
+        source: str = "",
+        date_only_time: str = "00:00:00",
+        fallback_now: bool = True,
+    ) -> str | None:
+        """
+        ISO_FORMAT string for a date string or struct_time. Date-only inputs get date_only_time.
+        Unparseable or empty input returns the current UTC time (counted as "fallback_now"),
+        or None with fallback_now=False.
+        """
+        if hasattr(value, "tm_year"):
+            out = self.from_struct(value)
+            if out is not None:
+                return out
+        elif isinstance(value, str):
+            s = value.strip()
+            if len(s) == 20 and s[10] == "T" and s[19] == "Z":
+                # Already canonical (re-normalizing stored posted_at): validate, return as is.
+                try:
+                    datetime.fromisoformat(s)
+                except ValueError:
+                    pass
+                else:
+                    self._record("iso")
+                    return s
+            parsed = self.parse(s, source)
+            if parsed is not None:
+                dt, name = parsed
+                self._record(name)
+                if name == "iso" and len(s) == 10:
+                    return f"{s}T{date_only_time}Z"
+                return _format_utc(dt)
+        if not fallback_now:
+            return None
+        self._record("fallback_now", source, repr(value)[:200])
+        return datetime.now(timezone.utc).strftime(ISO_FORMAT)
+
+    def from_struct(self, st: time.struct_time) -> str | None:
+        """feedparser *_parsed values (already UTC); leap seconds clamp to :59. None if invalid."""
+        try:
+            out = "%04d-%02d-%02dT%02d:%02d:%02dZ" % (
+                st.tm_year, st.tm_mon, st.tm_mday, st.tm_hour, st.tm_min, min(st.tm_sec, 59),
+            )
+            datetime(st.tm_year, st.tm_mon, st.tm_mday, st.tm_hour, st.tm_min)
+        except (ValueError, TypeError, AttributeError):
+            return None
+        self._record("struct_time")
+        return out
+
+    def entry_timestamp(self, entry, source: str = "") -> str:
+        """
+        Timestamp for a feedparser entry: the first of published/updated/created, using feedparser's
+        parsed struct_time when present and the raw string otherwise; current time if none parse.
+        """
+        bad = ""
+        for key in ENTRY_DATE_KEYS:
+            st = entry.get(f"{key}_parsed")
+            if st:
+                out = self.from_struct(st)
+                if out is not None:
+                    return out
+            val = entry.get(key)
+            if val:
+                out = self.normalize(val, source, fallback_now=False)
+                if out is not None:
+                    return out
+                bad = bad or val
+        return self.normalize(bad, source)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+            self.fallback_samples.clear()
+
+
+# Process-wide normalizer shared by all scrapers (stats cover one scrape_all_sources run).
+timestamps = TimestampNormalizer()
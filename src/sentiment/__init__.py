@@ -1,7 +1,22 @@
 """Sentiment scoring: FinBERT and Ollama LLM backends; pipeline to score matched headlines."""
+from src.lazy import lazy_exports
 
-from .finbert_scorer import score_finbert
-from .ollama_scorer import score_ollama
-from .pipeline import run_sentiment, add_sentiment_to_rows
+# Public name -> submodule. Loaded on first attribute access (PEP 562), so importing the package
+# does not pull in requests, numpy or the pipeline until a name is used.
+_EXPORTS = {
+    "score_finbert": ".finbert_scorer",
+    "score_finbert_batch": ".finbert_scorer",
+    "score_finbert_int8_batch": ".finbert_scorer",
+    "score_ollama": ".ollama_scorer",
+    "score_ollama_many": ".ollama_engine",
+    "run_sentiment": ".pipeline",
+    "run_sentiment_checkpointed": ".pipeline",
+    "add_sentiment_to_rows": ".pipeline",
+    "ScoreCache": ".score_cache",
+    "DailyPanel": ".daily",
+    "build_daily_panel": ".daily",
+}
 
-__all__ = ["score_finbert", "score_ollama", "run_sentiment", "add_sentiment_to_rows"]
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
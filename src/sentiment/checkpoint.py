@@ -0,0 +1,61 @@
+"""Append-only JSONL checkpoint of per-headline sentiment scores, so interrupted runs can resume."""
+import json
+from pathlib import Path
+
+
+def checkpoint_path_for(output_path: Path) -> Path:
+    """processed_<suffix>.jsonl -> processed_<suffix>.checkpoint.jsonl next to it."""
+    return output_path.with_name(f"{output_path.stem}.checkpoint.jsonl")
+
+
+def load_checkpoint(path: Path) -> dict[str, dict[str, float | None]]:
+    """
+    Read checkpoint lines {"headline", "key", "score"} into headline -> { output_key: score }.
+    A torn last line (crash mid-write) is skipped; later lines win over earlier ones.
+    """
+    scores: dict[str, dict[str, float | None]] = {}
+    if not path.exists():
+        return scores
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            scores.setdefault(rec["headline"], {})[rec["key"]] = rec["score"]
+    return scores
+
+
+class CheckpointWriter:
+    """Appends one line per (headline, output_key, score) and flushes it, so every score survives a crash."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        needs_newline = path.exists() and path.stat().st_size > 0 and not _ends_with_newline(path)
+        self.path = path
+        self._f = open(path, "a", encoding="utf-8")
+        if needs_newline:
+            self._f.write("\n")
+
+    def write(self, headline: str, key: str, score: float | None) -> None:
+        rec = {"headline": headline, "key": key, "score": score}
+        self._f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
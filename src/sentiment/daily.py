@@ -0,0 +1,272 @@
+"""Daily (date x ticker x backend) sentiment panel from processed rows, updated incrementally by touched date."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+import numpy as np
+
+from .pipeline import BACKENDS, DEFAULT_BACKENDS, LOCAL_SCORERS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Row filter per variant: (is_ai_related, is_proxy_partnership) bool arrays -> rows to aggregate.
+VARIANTS: dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "all": lambda ai, partner: np.ones(len(ai), dtype=bool),
+    "ai": lambda ai, partner: ai,
+    "partnership": lambda ai, partner: partner,
+    "direct": lambda ai, partner: ~partner,
+}
+# Deltas are every LLM backend's daily mean minus this backend's.
+REFERENCE_BACKEND = "finbert"
+# A row is identified by the base_data dedupe key; a re-processed row replaces its earlier version.
+ROW_KEY = ("posted_at", "url", "ticker")
+
+
+def backend_label(output_key: str) -> str:
+    """Short name of a BACKENDS output key for feature columns ("sentiment_llm_llama3_2" -> "llama3_2")."""
+    return output_key.removeprefix("sentiment_").removeprefix("llm_")
+
+
+def _flag(value: Any) -> bool:
+    """is_ai_related / is_proxy_partnership as stored in JSONL ("True") or Parquet (True)."""
+    return value is True or str(value).strip().lower() in ("true", "1")
+
+
+def _score(value: Any) -> float:
+    if value is None or value == "":
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def ffill(values: np.ndarray) -> np.ndarray:
+    """Carry the last non-NaN value forward along axis 0 (dates), independently per ticker/backend."""
+    if values.shape[0] == 0:
+        return values.copy()
+    rows = np.arange(values.shape[0]).reshape(-1, *([1] * (values.ndim - 1)))
+    last = np.maximum.accumulate(np.where(np.isnan(values), 0, rows), axis=0)
+    return np.take_along_axis(values, last, axis=0)
+
+
+def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    out = np.full(num.shape, np.nan)
+    np.divide(num, den, out=out, where=den > 0)
+    return out
+
+
+class DailyPanel:
+    """
+    Per (date, ticker, backend) sums and counts of non-null scores over processed rows, plus
+    headlines per (date, ticker). Dates are every calendar day from the first to the last headline
+    (UTC), tickers sorted; backends are BACKENDS ids. update() re-aggregates only the dates its rows
+    fall on, so a growing processed file can be folded in without rebuilding the panel.
+    """
+
+    def __init__(self, backends: list[str] | None = None, variant: str = "all") -> None:
+        if variant not in VARIANTS:
+            raise ValueError(f"variant must be one of {list(VARIANTS)}, got {variant!r}")
+        self.backends = [b for b in (backends or DEFAULT_BACKENDS) if b in BACKENDS]
+        self.keys = [BACKENDS[b][0] for b in self.backends]
+        self.labels = [backend_label(k) for k in self.keys]
+        self.variant = variant
+        self.tickers: list[str] = []
+        self._origin = 0  # days since 1970-01-01 of dates[0]
+        # Row store (one entry per ROW_KEY), columnar.
+        self._row_of: dict[tuple, int] = {}
+        self._day = np.empty(0, dtype=np.int64)
+        self._tick = np.empty(0, dtype=np.int64)
+        self._scores = np.empty((0, len(self.keys)))
+        self._ai = np.empty(0, dtype=bool)
+        self._partner = np.empty(0, dtype=bool)
+        # Aggregates: (dates, tickers, backends) and (dates, tickers).
+        self.sums = np.zeros((0, 0, len(self.keys)))
+        self.counts = np.zeros((0, 0, len(self.keys)))
+        self.headline_counts = np.zeros((0, 0))
+
+    @property
+    def dates(self) -> np.ndarray:
+        """datetime64[D], one per calendar day."""
+        return np.datetime64(0, "D") + self._origin + np.arange(self.sums.shape[0])
+
+    def _grow(self, days: np.ndarray, tickers: set[str]) -> None:
+        """Widen the date axis to cover days and add new tickers (kept sorted), moving aggregates over."""
+        n_dates = self.sums.shape[0]
+        first = min(int(days.min()), self._origin) if n_dates else int(days.min())
+        last = max(int(days.max()), self._origin + n_dates - 1) if n_dates else int(days.max())
+        names = sorted(set(self.tickers) | tickers)
+        if first == self._origin and last == self._origin + n_dates - 1 and len(names) == len(self.tickers):
+            return
+        col_of = {t: i for i, t in enumerate(names)}
+        remap = np.array([col_of[t] for t in self.tickers], dtype=np.int64)
+        shift = self._origin - first
+        shape = (last - first + 1, len(names))
+        for attr, extra in (("sums", self.keys), ("counts", self.keys), ("headline_counts", None)):
+            old = getattr(self, attr)
+            new = np.zeros(shape + ((len(extra),) if extra is not None else ()))
+            if old.size:
+                new[shift : shift + n_dates, remap] = old
+            setattr(self, attr, new)
+        self._tick = remap[self._tick] if len(self._tick) else self._tick
+        self.tickers = names
+        self._origin = first
+
+    def update(self, rows: Iterable[dict[str, Any]]) -> np.ndarray:
+        """
+        Add or replace rows (by ROW_KEY) and recompute the aggregates of the dates they fall on.
+        Rows without a ticker or a parseable posted_at are skipped. Returns the touched dates.
+        """
+        from src.returns.calendar import event_days
+
+        keys, posted, tickers, scores, ai, partner = [], [], [], [], [], []
+        for row in rows:
+            ticker = (row.get("ticker") or "").strip()
+            if not ticker:
+                continue
+            keys.append(tuple(row.get(k) for k in ROW_KEY))
+            posted.append(row.get("posted_at") or "")
+            tickers.append(ticker)
+            scores.append([_score(row.get(k)) for k in self.keys])
+            ai.append(_flag(row.get("is_ai_related")))
+            partner.append(_flag(row.get("is_proxy_partnership")))
+        days = event_days(posted)
+        ok = ~np.isnat(days)
+        if not ok.any():
+            return np.array([], dtype="datetime64[D]")
+        days = days[ok].astype(np.int64)
+        keys = [k for k, keep in zip(keys, ok) if keep]
+        tickers = [t for t, keep in zip(tickers, ok) if keep]
+        self._grow(days, set(tickers))
+
+        col_of = {t: i for i, t in enumerate(self.tickers)}
+        pos = np.empty(len(keys), dtype=np.int64)
+        n_rows = len(self._day)
+        for i, key in enumerate(keys):
+            if key not in self._row_of:
+                self._row_of[key] = n_rows
+                n_rows += 1
+            pos[i] = self._row_of[key]
+        if n_rows > len(self._day):
+            extra = n_rows - len(self._day)
+            self._day = np.concatenate([self._day, np.zeros(extra, dtype=np.int64)])
+            self._tick = np.concatenate([self._tick, np.zeros(extra, dtype=np.int64)])
+            self._scores = np.concatenate([self._scores, np.zeros((extra, len(self.keys)))])
+            self._ai = np.concatenate([self._ai, np.zeros(extra, dtype=bool)])
+            self._partner = np.concatenate([self._partner, np.zeros(extra, dtype=bool)])
+        self._day[pos] = days
+        self._tick[pos] = [col_of[t] for t in tickers]
+        self._scores[pos] = np.array(scores, dtype=np.float64).reshape(-1, len(self.keys))[ok]
+        self._ai[pos] = np.array(ai, dtype=bool)[ok]
+        self._partner[pos] = np.array(partner, dtype=bool)[ok]
+
+        touched = np.unique(days)
+        self._aggregate(touched)
+        return touched.astype("datetime64[D]")
+
+    def _aggregate(self, touched: np.ndarray) -> None:
+        """Rebuild sums / counts / headline_counts for the touched days (days since epoch) from the row store."""
+        n_dates, n_tickers = self.headline_counts.shape
+        idx = touched - self._origin
+        self.sums[idx] = 0
+        self.counts[idx] = 0
+        self.headline_counts[idx] = 0
+        sel = np.isin(self._day, touched) & VARIANTS[self.variant](self._ai, self._partner)
+        flat = (self._day[sel] - self._origin) * n_tickers + self._tick[sel]
+        size = n_dates * n_tickers
+        self.headline_counts += np.bincount(flat, minlength=size).reshape(n_dates, n_tickers)
+        scores = self._scores[sel]
+        has = ~np.isnan(scores)
+        for b in range(len(self.keys)):
+            self.sums[..., b] += np.bincount(flat, weights=np.where(has[:, b], scores[:, b], 0), minlength=size).reshape(n_dates, n_tickers)
+            self.counts[..., b] += np.bincount(flat, weights=has[:, b], minlength=size).reshape(n_dates, n_tickers)
+
+    def mean(self) -> np.ndarray:
+        """Daily mean score per (date, ticker, backend); NaN where no headline had a score."""
+        return _ratio(self.sums, self.counts)
+
+    def window_mean(self, days: int) -> np.ndarray:
+        """Count-weighted mean over the trailing `days` calendar days (inclusive): every headline weighs the same."""
+        if days < 1:
+            raise ValueError(f"days must be >= 1, got {days}")
+        sums = np.cumsum(self.sums, axis=0)
+        counts = np.cumsum(self.counts, axis=0)
+        sums[days:] -= sums[:-days].copy()
+        counts[days:] -= counts[:-days].copy()
+        return _ratio(sums, counts)
+
+    def ewm_mean(self, halflife_days: float) -> np.ndarray:
+        """Count-weighted mean with each headline's weight halving every halflife_days calendar days."""
+        if halflife_days <= 0:
+            raise ValueError(f"halflife_days must be > 0, got {halflife_days}")
+        if self.sums.shape[0] == 0:
+            return _ratio(self.sums, self.counts)
+        from scipy.signal import lfilter
+
+        # y[t] = x[t] + decay * y[t-1] along dates, as one first-order IIR filter over every (ticker, backend).
+        decay = 0.5 ** (1.0 / halflife_days)
+        sums = lfilter([1.0], [1.0, -decay], self.sums, axis=0)
+        counts = lfilter([1.0], [1.0, -decay], self.counts, axis=0)
+        return _ratio(sums, counts)
+
+    def features(self, values: np.ndarray | None = None) -> dict[str, np.ndarray]:
+        """
+        (date, ticker) arrays from per-backend values (default: daily mean, forward-filled per ticker):
+        <label>_avg per backend; with the reference and LLM backends present, <label>_delta (LLM minus
+        reference), delta_sum (sum of |delta|), delta_mean_signed; with 2+ LLMs, llm_spread (their std).
+        """
+        if values is None:
+            values = ffill(self.mean())
+        out = {f"{label}_avg": values[..., b] for b, label in enumerate(self.labels)}
+        llm = [b for b, backend in enumerate(self.backends) if BACKENDS[backend][1] not in LOCAL_SCORERS]
+        if REFERENCE_BACKEND in self.backends and llm:
+            ref = self.backends.index(REFERENCE_BACKEND)
+            deltas = values[..., llm] - values[..., [ref]]
+            for k, b in enumerate(llm):
+                out[f"{self.labels[b]}_delta"] = deltas[..., k]
+            out["delta_sum"] = np.abs(deltas).sum(axis=-1)
+            out["delta_mean_signed"] = deltas.mean(axis=-1)
+        if len(llm) >= 2:
+            llm_values = values[..., llm]
+            n = (~np.isnan(llm_values)).sum(axis=-1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.nanmean(np.where(n[..., None] > 0, llm_values, 0), axis=-1)
+                sq = np.nansum((llm_values - mean[..., None]) ** 2, axis=-1)
+                out["llm_spread"] = np.where(n >= 2, np.sqrt(sq / (n - 1)), np.nan)
+        return out
+
+    def to_frame(self, values: np.ndarray | None = None) -> pd.DataFrame:
+        """
+        Long table like the notebook's groupby: ticker, date, headline_count and features(values), one
+        row per (ticker, date) with at least one headline, sorted by ticker then date.
+        """
+        import pandas as pd
+
+        feats = self.features(values)
+        date_idx, tick_idx = np.nonzero(self.headline_counts > 0)
+        order = np.lexsort((date_idx, tick_idx))
+        date_idx, tick_idx = date_idx[order], tick_idx[order]
+        data = {
+            "ticker": np.array(self.tickers, dtype=object)[tick_idx] if self.tickers else np.array([], dtype=object),
+            "date": self.dates[date_idx].astype("datetime64[ns]"),
+            "headline_count": self.headline_counts[date_idx, tick_idx].astype(np.int64),
+        }
+        for name, arr in feats.items():
+            data[name] = arr[date_idx, tick_idx]
+        return pd.DataFrame(data)
+
+
+def build_daily_panel(
+    rows: Iterable[dict[str, Any]],
+    backends: list[str] | None = None,
+    variant: str = "all",
+) -> DailyPanel:
+    """DailyPanel over rows. backends default to every BACKENDS id whose output key appears in the rows."""
+    if backends is None:
+        rows = rows if isinstance(rows, list) else list(rows)
+        present = {k for row in rows for k in row if k.startswith("sentiment_")}
+        backends = [b for b, (key, _) in BACKENDS.items() if key in present] or None
+    panel = DailyPanel(backends, variant)
+    panel.update(rows)
+    return panel
@@ -1,10 +1,33 @@
-"""FinBERT sentiment: map finance polarity to score in [-1, 1]."""
-from typing import Any
+"""FinBERT sentiment: map finance polarity to score in [-1, 1]. fp32 PyTorch, or dynamically int8-quantized for CPU."""
+import copy
+import os
+import warnings
+from typing import Any, Callable
 
 _tokenizer = None
 _model = None
+_model_int8 = None
 _id2label: dict[int, str] = {}
 
+FINBERT_MODEL_NAME = "ProsusAI/finbert"
+# Cache-key model name for the quantized variant, so its scores never mix with fp32 ones.
+FINBERT_INT8_MODEL_NAME = f"{FINBERT_MODEL_NAME}@int8-dynamic"
+DEFAULT_BATCH_SIZE = 32
+# Intra-op CPU threads for FinBERT (torch.set_num_threads); unset = torch default (all cores).
+FINBERT_THREADS_ENV = "FINBERT_THREADS"
+
+
+def set_num_threads(n: int | None = None) -> None:
+    """Set torch intra-op threads to n, or to $FINBERT_THREADS when n is None (no-op if neither is set)."""
+    if n is None:
+        env = os.environ.get(FINBERT_THREADS_ENV, "").strip()
+        n = int(env) if env else None
+    if n is None or n < 1:
+        return
+    import torch
+
+    torch.set_num_threads(n)
+
 
 def _load_finbert() -> tuple[Any, Any]:
     """Lazy-load FinBERT model/tokenizer to avoid import cost at module import."""
@@ -14,13 +37,41 @@ def _load_finbert() -> tuple[Any, Any]:
 
     from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
-    model_name = "ProsusAI/finbert"
-    _tokenizer = AutoTokenizer.from_pretrained(model_name)
-    _model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    set_num_threads()
+    _tokenizer = AutoTokenizer.from_pretrained(FINBERT_MODEL_NAME)
+    _model = AutoModelForSequenceClassification.from_pretrained(FINBERT_MODEL_NAME)
     _id2label = {int(k): str(v).lower() for k, v in _model.config.id2label.items()}
     return _tokenizer, _model
 
 
+def _load_finbert_int8() -> tuple[Any, Any]:
+    """
+    FinBERT with every nn.Linear dynamically quantized to int8 (weights int8, activations quantized
+    per batch); same tokenizer and labels. If the fp32 model was not already in use its Linear layers
+    are swapped in place (inplace=True) and the fp32 reference dropped, so an int8-only run holds one
+    model; otherwise a copy is quantized and the fp32 model stays usable.
+    """
+    global _model, _model_int8
+    if _model_int8 is not None:
+        return _tokenizer, _model_int8
+
+    import torch
+
+    fp32_in_use = _model is not None
+    tokenizer, model = _load_finbert()
+    if fp32_in_use:
+        model = copy.deepcopy(model)
+    else:
+        _model = None
+    with warnings.catch_warnings():
+        # torch.ao eager quantization warns about its move to torchao; the API still works.
+        warnings.simplefilter("ignore")
+        _model_int8 = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+    return tokenizer, _model_int8
+
+
 def score_finbert(text: str) -> float:
     """
     Score finance text with FinBERT using probability(positive) - probability(negative).
@@ -52,3 +103,61 @@ def score_finbert(text: str) -> float:
     neg = label_to_prob.get("negative", 0.0)
     score = pos - neg
     return max(-1.0, min(1.0, float(score)))
+
+
+def _label_index(label: str) -> int | None:
+    """Logit column for a FinBERT label ("positive" / "negative"), or None if absent."""
+    for idx, name in _id2label.items():
+        if name == label:
+            return idx
+    return None
+
+
+def score_finbert_batch(texts: list[str], batch_size: int = DEFAULT_BATCH_SIZE) -> list[float]:
+    """
+    Batched score_finbert: same probability(positive) - probability(negative) in [-1, 1], same order as texts.
+    Texts are tokenized once, sorted by token length and padded per batch only to the longest
+    member (truncation at 512 as in score_finbert), so short headlines do not pay for long ones.
+    Blank input -> 0.0.
+    """
+    return _score_batch(texts, batch_size, _load_finbert)
+
+
+def score_finbert_int8_batch(texts: list[str], batch_size: int = DEFAULT_BATCH_SIZE) -> list[float]:
+    """score_finbert_batch on the dynamically int8-quantized model (faster on CPU; parity: scripts/bench_finbert.py)."""
+    return _score_batch(texts, batch_size, _load_finbert_int8)
+
+
+def _score_batch(texts: list[str], batch_size: int, load: Callable[[], tuple[Any, Any]]) -> list[float]:
+    scores = [0.0] * len(texts)
+    items = [(i, t.strip()) for i, t in enumerate(texts) if t and t.strip()]
+    if not items:
+        return scores
+
+    tokenizer, model = load()
+
+    import torch
+
+    encoded = tokenizer(
+        [t for _, t in items],
+        truncation=True,
+        max_length=512,
+    )
+    features = [
+        {key: encoded[key][j] for key in encoded.keys()}
+        for j in range(len(items))
+    ]
+    order = sorted(range(len(items)), key=lambda j: len(features[j]["input_ids"]))
+    pos_idx = _label_index("positive")
+    neg_idx = _label_index("negative")
+
+    with torch.inference_mode():
+        for start in range(0, len(order), max(1, batch_size)):
+            chunk = order[start : start + max(1, batch_size)]
+            batch = tokenizer.pad([features[j] for j in chunk], return_tensors="pt")
+            probs = torch.softmax(model(**batch).logits, dim=1)
+            pos = probs[:, pos_idx] if pos_idx is not None else torch.zeros(len(chunk))
+            neg = probs[:, neg_idx] if neg_idx is not None else torch.zeros(len(chunk))
+            for j, score in zip(chunk, (pos - neg).clamp(-1.0, 1.0).tolist()):
+                scores[items[j][0]] = float(score)
+    return scores
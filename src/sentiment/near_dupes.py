@@ -0,0 +1,131 @@
+"""Near-duplicate headline clustering (publisher-suffix stripping, optional MinHash/LSH) so each story is scored once."""
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Minimum word-set Jaccard between a headline and its cluster representative. 1.0 clusters only
+# identical canonical text: fuzzy cutoffs such as 0.8 also merge "No. 1" / "No. 2" or "June" / "July".
+DEFAULT_THRESHOLD = 1.0
+NUM_PERM = 64
+# 16 bands x 4 rows: LSH candidates from roughly Jaccard 0.5 up; every candidate is verified exactly.
+LSH_BANDS = 16
+CLUSTER_ID_KEY = "headline_cluster_id"
+
+# Trailing " - Publisher" (Google News), " | Site" or dash variants with a short tail.
+_SUFFIX_RE = re.compile(r"\s+[-|–—]\s+([^-|–—]+)$")
+MAX_SUFFIX_WORDS = 5
+_TOKEN_RE = re.compile(r"\w+")
+_PRIME = 4294967311  # smallest prime above 2**32
+_PERM_SEED = 20260310
+
+
+def strip_publisher_suffix(headline: str) -> str:
+    """Drop a trailing " - Publisher" style segment of at most MAX_SUFFIX_WORDS words."""
+    h = (headline or "").strip()
+    m = _SUFFIX_RE.search(h)
+    if m and len(m.group(1).split()) <= MAX_SUFFIX_WORDS:
+        return h[: m.start()]
+    return h
+
+
+def _tokens(headline: str) -> frozenset[str]:
+    return frozenset(_TOKEN_RE.findall(strip_publisher_suffix(headline).lower()))
+
+
+def canonical_headline(headline: str) -> str:
+    """Lowercased word tokens of the headline without its publisher suffix, space-joined."""
+    return " ".join(_TOKEN_RE.findall(strip_publisher_suffix(headline).lower()))
+
+
+@lru_cache(maxsize=1)
+def _permutations() -> tuple[np.ndarray, np.ndarray]:
+    """(a, b) coefficients of the NUM_PERM hash permutations; numpy is loaded on first clustering."""
+    import numpy as np
+
+    rng = np.random.default_rng(_PERM_SEED)
+    a = rng.integers(1, 2**31, size=NUM_PERM, dtype=np.uint64)
+    b = rng.integers(0, 2**31, size=NUM_PERM, dtype=np.uint64)
+    return a[:, None], b[:, None]
+
+
+def _minhash(tokens: frozenset[str]) -> np.ndarray:
+    import numpy as np
+
+    a, b = _permutations()
+    x = np.fromiter((zlib.crc32(t.encode("utf-8")) for t in tokens), dtype=np.uint64, count=len(tokens))
+    return ((a * x[None, :] + b) % _PRIME).min(axis=1)
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def cluster_headlines(
+    headlines: list[str],
+    headline_to_tickers: dict[str, list[str]] | None = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> dict[str, str]:
+    """
+    Map each headline to its cluster representative (the first-seen member, scored as is).
+    A headline joins the earliest representative with the same ticker set (so LLM context is the
+    same) whose word-set Jaccard, after publisher-suffix stripping, is at least threshold; members
+    are compared to the representative only, so clusters do not chain. threshold >= 1.0 requires
+    the same canonical_headline (same words in the same order) and skips MinHash.
+    """
+    headline_to_tickers = headline_to_tickers or {}
+    if threshold >= 1.0:
+        first: dict[tuple, str] = {}
+        return {
+            h: first.setdefault((tuple(sorted(headline_to_tickers.get(h, []))), canonical_headline(h)), h)
+            for h in headlines
+        }
+    rows_per_band = NUM_PERM // LSH_BANDS
+    rep_of: dict[str, str] = {}
+    exact: dict[tuple, str] = {}
+    buckets: dict[tuple, list[str]] = {}
+    rep_tokens: dict[str, frozenset[str]] = {}
+    rep_order: dict[str, int] = {}
+    for h in headlines:
+        if h in rep_of:
+            continue
+        tickers = tuple(sorted(headline_to_tickers.get(h, [])))
+        tokens = _tokens(h)
+        key = (tickers, tokens)
+        if key in exact:
+            rep_of[h] = exact[key]
+            continue
+        if not tokens:
+            rep_of[h] = exact[key] = h
+            continue
+        sig = _minhash(tokens)
+        band_keys = [
+            (tickers, b, sig[b * rows_per_band : (b + 1) * rows_per_band].tobytes()) for b in range(LSH_BANDS)
+        ]
+        candidates: dict[str, None] = {}
+        for bk in band_keys:
+            for rep in buckets.get(bk, ()):
+                candidates.setdefault(rep)
+        rep = next(
+            (c for c in sorted(candidates, key=rep_order.__getitem__) if _jaccard(tokens, rep_tokens[c]) >= threshold),
+            None,
+        )
+        if rep is None:
+            rep = h
+            rep_tokens[h] = tokens
+            rep_order[h] = len(rep_order)
+            for bk in band_keys:
+                buckets.setdefault(bk, []).append(h)
+        rep_of[h] = exact[key] = rep
+    return rep_of
+
+
+def cluster_id(representative: str) -> str:
+    """Stable id for a cluster: short hash of its representative headline."""
+    return hashlib.sha1(representative.encode("utf-8")).hexdigest()[:12]
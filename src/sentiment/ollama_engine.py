@@ -0,0 +1,171 @@
+"""Concurrent Ollama scoring: pooled session, per-model in-flight limit with adaptive backpressure, bounded retries."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ollama_scorer import DEFAULT_TIMEOUT, OLLAMA_URL, _build_payload, _parse_sentiment_number
+
+DEFAULT_CONCURRENCY = 4
+# Per-model in-flight ceiling; models not listed use DEFAULT_CONCURRENCY.
+# Keep at or below the server's OLLAMA_NUM_PARALLEL or requests just queue server-side.
+OLLAMA_CONCURRENCY: dict[str, int] = {
+    "phi3": 4,
+    "llama3.2:3b": 4,
+    "deepseek-r1:1.5b": 4,
+}
+DEFAULT_MAX_RETRIES = 2
+RETRY_BACKOFF_S = 1.0
+MAX_BACKOFF_S = 10.0
+# Statuses meaning the server is saturated: shrink the in-flight limit, then retry.
+OVERLOAD_STATUSES = frozenset({429, 502, 503, 504})
+# 4xx statuses worth retrying; any other 4xx (bad request, model not found) fails the same way again.
+RETRYABLE_4XX = frozenset({408, 429})
+# A reply slower than this multiple of the model's running latency baseline counts as pressure.
+LATENCY_FACTOR = 3.0
+# Weight of each new reply in the running latency baseline (EWMA).
+BASELINE_ALPHA = 0.1
+
+
+def make_session(pool_size: int = DEFAULT_CONCURRENCY) -> requests.Session:
+    """requests.Session with a keep-alive pool sized for pool_size concurrent calls."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class AdaptiveLimiter:
+    """
+    AIMD in-flight limit between 1 and max_in_flight, for one model.
+    Pressure halves the limit: the server pushing back (429/5xx overload, timeout, refused
+    connection) or a reply slower than latency_factor x the running baseline of this model's
+    replies, so slow models are judged against themselves. A run of `limit` replies without
+    pressure adds one. Other failures (unparseable reply, non-retryable 4xx) leave the limit alone.
+    """
+
+    def __init__(self, max_in_flight: int, latency_factor: float = LATENCY_FACTOR) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+        self.latency_factor = latency_factor
+        self.baseline_s: float | None = None
+        self.limit = self.max_in_flight
+        self._in_flight = 0
+        self._streak = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, latency_s: float, ok: bool, overloaded: bool = False) -> None:
+        """ok: a reply came back. overloaded: the server signalled saturation (see class docstring)."""
+        with self._cond:
+            self._in_flight -= 1
+            slow = False
+            if ok:
+                if self.baseline_s is None:
+                    self.baseline_s = latency_s
+                else:
+                    slow = latency_s > self.latency_factor * self.baseline_s
+                    self.baseline_s += BASELINE_ALPHA * (latency_s - self.baseline_s)
+            if overloaded or slow:
+                self.limit = max(1, self.limit // 2)
+                self._streak = 0
+            elif ok:
+                self._streak += 1
+                if self._streak >= self.limit and self.limit < self.max_in_flight:
+                    self.limit += 1
+                    self._streak = 0
+            self._cond.notify_all()
+
+
+def _score_with_retries(
+    session: requests.Session,
+    limiter: AdaptiveLimiter,
+    text: str,
+    model: str,
+    context: str | None,
+    timeout: int,
+    max_retries: int,
+) -> float | None:
+    """
+    One headline: up to 1 + max_retries attempts with capped exponential backoff. None if all fail;
+    a non-retryable 4xx (e.g. 404 for a model that is not pulled) returns None without retrying.
+    """
+    if not text or not text.strip():
+        return None
+    payload = _build_payload(text, model, context)
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        start = time.monotonic()
+        ok = overloaded = fatal = False
+        response_text = ""
+        try:
+            resp = session.post(OLLAMA_URL, json=payload, timeout=timeout)
+            overloaded = resp.status_code in OVERLOAD_STATUSES
+            fatal = 400 <= resp.status_code < 500 and resp.status_code not in RETRYABLE_4XX
+            resp.raise_for_status()
+            response_text = resp.json().get("response") or ""
+            ok = True
+        except (requests.Timeout, requests.ConnectionError):
+            overloaded = True
+        except (requests.RequestException, ValueError, AttributeError):
+            pass
+        finally:
+            limiter.release(time.monotonic() - start, ok, overloaded)
+        if ok:
+            return _parse_sentiment_number(response_text)
+        if fatal:
+            return None
+        if attempt < max_retries:
+            time.sleep(min(MAX_BACKOFF_S, RETRY_BACKOFF_S * (2 ** attempt)))
+    return None
+
+
+def score_ollama_many(
+    headlines: list[str],
+    model: str,
+    contexts: dict[str, str | None] | None = None,
+    concurrency: int | None = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    session: requests.Session | None = None,
+    limiter: AdaptiveLimiter | None = None,
+) -> Iterator[tuple[str, float | None]]:
+    """
+    Score headlines against one Ollama model concurrently; yields (headline, score) as each completes
+    (completion order, not input order). Same prompt/parsing as score_ollama; None on repeated failure.
+    concurrency defaults to OLLAMA_CONCURRENCY[model] or DEFAULT_CONCURRENCY. Pass a limiter shared
+    between calls (e.g. one per model in the scoring service) to cap in-flight requests across them.
+    """
+    if not headlines:
+        return
+    contexts = contexts or {}
+    if concurrency is None:
+        concurrency = OLLAMA_CONCURRENCY.get(model, DEFAULT_CONCURRENCY)
+    concurrency = max(1, concurrency)
+    own_session = session is None
+    if own_session:
+        session = make_session(concurrency)
+    limiter = limiter or AdaptiveLimiter(concurrency)
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = {
+            pool.submit(
+                _score_with_retries,
+                session, limiter, h, model, contexts.get(h), timeout, max_retries,
+            ): h
+            for h in headlines
+        }
+        for fut in as_completed(futures):
+            yield futures[fut], fut.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if own_session:
+            session.close()
@@ -1,9 +1,13 @@
 """Ollama LLM sentiment: prompt model for a number in [-1, 1], parse last number, clamp."""
+from __future__ import annotations
+
+import hashlib
 import re
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 OLLAMA_URL = "http://localhost:11434/api/generate"
 DEFAULT_TIMEOUT = 60
@@ -41,6 +45,9 @@ Score:
 
 Response must be a single float value only. No prose."""
 
+# Content hash of SENTIMENT_PROMPT; part of the score cache key so prompt edits invalidate cached LLM scores.
+PROMPT_VERSION = hashlib.sha256(SENTIMENT_PROMPT.encode("utf-8")).hexdigest()[:12]
+
 
 def _parse_sentiment_number(response_text: str) -> float | None:
     """Extract a number in [-1, 1] from response; take last match for reasoning models."""
@@ -57,30 +64,40 @@ def _parse_sentiment_number(response_text: str) -> float | None:
         return None
 
 
+def _build_payload(text: str, model: str, context: str | None = None) -> dict[str, Any]:
+    """Ollama /api/generate payload: SENTIMENT_PROMPT with optional context block, temperature=0."""
+    context_block = f"Context: {context}\n\n" if (context and context.strip()) else ""
+    prompt = SENTIMENT_PROMPT.format(CONTEXT=context_block, HEADLINE=text.strip())
+    return {
+        "model": model,
+        "prompt": prompt,
+        "stream": False,
+        "options": {"temperature": 0.0},
+    }
+
+
 def score_ollama(
     text: str,
     model: str,
     timeout: int = DEFAULT_TIMEOUT,
     delay_after_s: float = DELAY_BETWEEN_CALLS_S,
     context: str | None = None,
+    session: requests.Session | None = None,
 ) -> float | None:
     """
     Send headline to Ollama, parse response for a number in [-1, 1].
     Uses temperature=0 for deterministic scoring. Optional context (e.g. from YAML) is prepended.
-    Returns None on timeout, HTTP error, or parse failure.
+    Pass a session to reuse pooled connections. Returns None on timeout, HTTP error, or parse failure.
+    For many headlines prefer score_ollama_many (ollama_engine), which replaces the fixed delay.
     """
     if not text or not text.strip():
         return None
-    context_block = f"Context: {context}\n\n" if (context and context.strip()) else ""
-    prompt = SENTIMENT_PROMPT.format(CONTEXT=context_block, HEADLINE=text.strip())
-    payload: dict[str, Any] = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "options": {"temperature": 0.0},
-    }
+    import requests
+
+    payload = _build_payload(text, model, context)
+    post = session.post if session is not None else requests.post
     try:
-        resp = requests.post(OLLAMA_URL, json=payload, timeout=timeout)
+        resp = post(OLLAMA_URL, json=payload, timeout=timeout)
         resp.raise_for_status()
         data = resp.json()
         response_text = data.get("response") or ""
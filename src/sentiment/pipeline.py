@@ -1,84 +1,221 @@
-"""Run sentiment on matched JSONL or rows in memory; score per unique headline, merge back."""
+"""Run sentiment on matched JSONL or rows in memory; score per unique headline (or near-duplicate cluster), merge back."""
+from __future__ import annotations
+
+import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from .checkpoint import CheckpointWriter, checkpoint_path_for, load_checkpoint
+from .finbert_scorer import (
+    FINBERT_INT8_MODEL_NAME,
+    FINBERT_MODEL_NAME,
+    score_finbert_batch,
+    score_finbert_int8_batch,
+)
+from .near_dupes import CLUSTER_ID_KEY, cluster_headlines, cluster_id
+from .ollama_scorer import PROMPT_VERSION
+from .score_cache import ScoreCache, cache_key
 
-from .finbert_scorer import score_finbert
-from .ollama_scorer import score_ollama
+if TYPE_CHECKING:
+    from .service import ServiceClient
 
-# Backend id -> (output key, scorer: "finbert" | model name for Ollama)
+# Backend id -> (output key, scorer: a LOCAL_SCORERS key | model name for Ollama)
 BACKENDS: dict[str, tuple[str, str]] = {
     "finbert": ("sentiment_finbert", "finbert"),
+    "finbert-int8": ("sentiment_finbert_int8", "finbert-int8"),
     "phi3": ("sentiment_llm_phi3", "phi3"),
     "llama3.2:3b": ("sentiment_llm_llama3_2", "llama3.2:3b"),
     "deepseek-r1:1.5b": ("sentiment_llm_deepseek_r1", "deepseek-r1:1.5b"),
 }
 
+# In-process scorers: spec -> (cache model name, batch scorer). Any other spec is an Ollama model.
+LOCAL_SCORERS: dict[str, tuple[str, Callable[[list[str]], list[float]]]] = {
+    "finbert": (FINBERT_MODEL_NAME, score_finbert_batch),
+    "finbert-int8": (FINBERT_INT8_MODEL_NAME, score_finbert_int8_batch),
+}
+# Backends used when none are given (finbert-int8 is opt-in via --backends).
+DEFAULT_BACKENDS = ["finbert", "phi3", "llama3.2:3b", "deepseek-r1:1.5b"]
+
+# Write new scores to the cache every N headlines so an interrupted LLM run keeps its progress.
+CACHE_FLUSH_EVERY = 50
+
 
 def _score_unique_headlines(
     unique_headlines: list[str],
     backends: list[str],
     headline_to_tickers: dict[str, list[str]] | None = None,
     matching_config: dict | None = None,
+    cache: ScoreCache | None = None,
+    ollama_concurrency: int | None = None,
+    done: dict[str, dict[str, float | None]] | None = None,
+    on_score: Callable[[str, str, float | None], None] | None = None,
+    client: ServiceClient | None = None,
 ) -> dict[str, dict[str, float | None]]:
-    """Return map: headline -> { output_key: score or None }. Injects YAML context for LLM when provided."""
+    """
+    Return map: headline -> { output_key: score or None }. Injects YAML context for LLM when provided.
+    With a cache, headlines already scored for the same (model, prompt version, context) are read
+    from it and only misses are sent to the scorers; new scores are written back as they arrive.
+    Ollama backends run concurrently per model (ollama_concurrency overrides OLLAMA_CONCURRENCY).
+    done: scores from an earlier partial run; those (headline, output_key) pairs are not rescored.
+    on_score(headline, output_key, score) is called for every new score (cache hits included).
+    client: send cache misses to a running scoring service instead of loading models in-process.
+    """
     from src.matching import build_context_for_headline
 
-    results: dict[str, dict[str, float | None]] = {h: {} for h in unique_headlines}
+    done = done or {}
+    results: dict[str, dict[str, float | None]] = {h: dict(done.get(h, {})) for h in unique_headlines}
+    # YAML context per headline, computed once and shared by every LLM backend.
+    llm_contexts: dict[str, str | None] = {}
+    if headline_to_tickers and matching_config and any(
+        BACKENDS[b][1] not in LOCAL_SCORERS for b in backends if b in BACKENDS
+    ):
+        llm_contexts = {
+            h: build_context_for_headline(
+                h.strip().lower(), headline_to_tickers.get(h, []), matching_config
+            )
+            for h in unique_headlines
+        }
     for backend_id in backends:
         if backend_id not in BACKENDS:
             continue
         out_key, scorer_spec = BACKENDS[backend_id]
-        for headline in unique_headlines:
-            if scorer_spec == "finbert":
-                score = score_finbert(headline)
-            else:
-                context = None
-                if headline_to_tickers and matching_config:
-                    tickers = headline_to_tickers.get(headline, [])
-                    context = build_context_for_headline(
-                        headline.strip().lower(), tickers, matching_config
-                    )
-                score = score_ollama(headline, model=scorer_spec, context=context)
+        remaining = [h for h in unique_headlines if out_key not in results[h]]
+        if scorer_spec in LOCAL_SCORERS:
+            model, prompt_ver = LOCAL_SCORERS[scorer_spec][0], ""
+            contexts: dict[str, str | None] = {}
+        else:
+            model, prompt_ver = scorer_spec, PROMPT_VERSION
+            contexts = llm_contexts
+
+        todo = remaining
+        keys: dict[str, str] = {}
+        if cache is not None:
+            keys = {h: cache_key(h, model, prompt_ver, contexts.get(h)) for h in remaining}
+            cached = cache.get_many(list(keys.values()))
+            todo = []
+            for headline in remaining:
+                if keys[headline] in cached:
+                    results[headline][out_key] = cached[keys[headline]]
+                    if on_score is not None:
+                        on_score(headline, out_key, cached[keys[headline]])
+                else:
+                    todo.append(headline)
+
+        if client is not None:
+            scored = client.score_many(backend_id, todo, contexts)
+        elif scorer_spec in LOCAL_SCORERS:
+            scored = zip(todo, LOCAL_SCORERS[scorer_spec][1](todo))
+        else:
+            from .ollama_engine import score_ollama_many
+
+            scored = score_ollama_many(
+                todo, scorer_spec, contexts=contexts, concurrency=ollama_concurrency
+            )
+        pending: list[tuple[str, float | None]] = []
+        for headline, score in scored:
             results[headline][out_key] = score
+            if on_score is not None:
+                on_score(headline, out_key, score)
+            if cache is None:
+                continue
+            pending.append((keys[headline], score))
+            if len(pending) >= CACHE_FLUSH_EVERY:
+                cache.put_many(pending, backend_id, model, prompt_ver)
+                pending = []
+        if cache is not None:
+            cache.put_many(pending, backend_id, model, prompt_ver)
     return results
 
 
+def _collect_headlines(rows: Iterable[dict[str, Any]]) -> tuple[list[str], dict[str, list[str]]]:
+    """Unique headlines (first-seen order) and headline -> unique tickers, in one pass over rows."""
+    unique: dict[str, None] = {}
+    headline_to_tickers: dict[str, dict[str, None]] = {}
+    for r in rows:
+        h = r.get("headline", "")
+        unique.setdefault(h)
+        t = (r.get("ticker") or "").strip()
+        if t:
+            headline_to_tickers.setdefault(h, {}).setdefault(t)
+    return list(unique), {h: list(ts) for h, ts in headline_to_tickers.items()}
+
+
+def _representatives(
+    unique_headlines: list[str],
+    headline_to_tickers: dict[str, list[str]],
+    near_dup_threshold: float | None,
+) -> tuple[list[str], dict[str, str] | None]:
+    """Headlines to score (one per near-duplicate cluster) and headline -> representative; None map if disabled."""
+    if near_dup_threshold is None:
+        return unique_headlines, None
+    rep_of = cluster_headlines(unique_headlines, headline_to_tickers, near_dup_threshold)
+    return list(dict.fromkeys(rep_of.values())), rep_of
+
+
+def _merge_scores(
+    row: dict[str, Any],
+    headline_scores: dict[str, dict[str, float | None]],
+    rep_of: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Copy of row with its cluster id (when clustering) and sentiment_* keys (BACKENDS order) for its headline."""
+    out_row = dict(row)
+    headline = row.get("headline", "")
+    if rep_of is not None:
+        headline = rep_of.get(headline, headline)
+        out_row[CLUSTER_ID_KEY] = cluster_id(headline)
+    scores = headline_scores.get(headline, {})
+    for _, (out_key, _) in BACKENDS.items():
+        if out_key in scores:
+            out_row[out_key] = scores.get(out_key)
+    return out_row
+
+
+def _service_client(service: str | None) -> ServiceClient | None:
+    if not service:
+        return None
+    from .service import ServiceClient
+
+    return ServiceClient(service)
+
+
 def add_sentiment_to_rows(
     rows: list[dict[str, Any]],
     backends: list[str] | None = None,
+    cache: ScoreCache | None = None,
+    ollama_concurrency: int | None = None,
+    near_dup_threshold: float | None = None,
+    service: str | None = None,
 ) -> list[dict[str, Any]]:
     """
     Add sentiment columns to matched rows in memory. Scores each unique headline once per backend.
     Uses temperature=0 and YAML context for LLM backends. Returns new list of rows with sentiment_* keys added.
+    Pass a ScoreCache to reuse scores from earlier runs and only score new headlines.
+    ollama_concurrency caps in-flight requests per Ollama model (default: OLLAMA_CONCURRENCY).
+    near_dup_threshold: None (default) scores every distinct headline string. A number opts in to
+    near-duplicate collapsing: headlines with the same tickers and, after publisher-suffix stripping,
+    word Jaccard >= threshold (1.0 = same canonical text, see near_dupes.DEFAULT_THRESHOLD) share
+    their cluster representative's scores and get a headline_cluster_id column.
+    service: URL of a running scoring service ("http://127.0.0.1:8765" or "unix:/path.sock", see
+    scripts/serve_sentiment.py); models stay warm there instead of loading in this process.
     """
     if backends is None:
-        backends = list(BACKENDS.keys())
+        backends = list(DEFAULT_BACKENDS)
     if not rows:
         return []
-    unique_headlines = list(dict.fromkeys(r["headline"] for r in rows))
-    headline_to_tickers: dict[str, list[str]] = {}
-    for r in rows:
-        h = r.get("headline", "")
-        t = (r.get("ticker") or "").strip()
-        if t:
-            headline_to_tickers.setdefault(h, []).append(t)
-    for h in list(headline_to_tickers):
-        headline_to_tickers[h] = list(dict.fromkeys(headline_to_tickers[h]))
-    from src.matching import load_matching_config
-
-    matching_config = load_matching_config()
-    headline_scores = _score_unique_headlines(
-        unique_headlines, backends, headline_to_tickers, matching_config
-    )
-    out = []
-    for row in rows:
-        out_row = dict(row)
-        h = row.get("headline", "")
-        for _, (out_key, _) in BACKENDS.items():
-            if out_key in headline_scores.get(h, {}):
-                out_row[out_key] = headline_scores[h].get(out_key)
-        out.append(out_row)
-    return out
+    unique_headlines, headline_to_tickers = _collect_headlines(rows)
+    from src.matching import get_matching_config
+
+    matching_config = get_matching_config()
+    to_score, rep_of = _representatives(unique_headlines, headline_to_tickers, near_dup_threshold)
+    client = _service_client(service)
+    try:
+        headline_scores = _score_unique_headlines(
+            to_score, backends, headline_to_tickers, matching_config, cache, ollama_concurrency, client=client
+        )
+    finally:
+        if client is not None:
+            client.close()
+    return [_merge_scores(row, headline_scores, rep_of) for row in rows]
 
 
 def run_sentiment(
@@ -93,7 +230,7 @@ def run_sentiment(
     from src.utils import load_jsonl, write_jsonl
 
     if backends is None:
-        backends = list(BACKENDS.keys())
+        backends = list(DEFAULT_BACKENDS)
     rows = load_jsonl(matched_path)
     if not rows:
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -103,3 +240,71 @@ def run_sentiment(
     full = add_sentiment_to_rows(rows, backends)
     write_jsonl(full, output_path)
     return (len(rows), len(full))
+
+
+def run_sentiment_checkpointed(
+    input_path: Path,
+    output_path: Path,
+    backends: list[str] | None = None,
+    cache: ScoreCache | None = None,
+    ollama_concurrency: int | None = None,
+    resume: bool = False,
+    checkpoint_path: Path | None = None,
+    near_dup_threshold: float | None = None,
+    service: str | None = None,
+) -> tuple[int, int]:
+    """
+    Score base-data rows (CSV, JSONL or Parquet dataset) with every score appended to a checkpoint as it arrives, then assemble
+    output_path JSONL from the checkpoint by streaming the input again. Rows are never held in memory;
+    only the headline -> scores map is. resume=True keeps an existing checkpoint and skips the
+    (headline, backend) pairs it already has; otherwise any old checkpoint is discarded.
+    The checkpoint is removed after the output is written. Returns (rows_read, rows_written).
+    near_dup_threshold: as in add_sentiment_to_rows (clustering is deterministic, so resume sees the
+    same representatives). service: as in add_sentiment_to_rows.
+    """
+    from src.matching import get_matching_config
+    from src.utils import iter_rows
+
+    if backends is None:
+        backends = list(DEFAULT_BACKENDS)
+    checkpoint_path = checkpoint_path or checkpoint_path_for(output_path)
+    if not resume:
+        checkpoint_path.unlink(missing_ok=True)
+
+    unique_headlines, headline_to_tickers = _collect_headlines(iter_rows(input_path))
+    to_score, rep_of = _representatives(unique_headlines, headline_to_tickers, near_dup_threshold)
+    done = load_checkpoint(checkpoint_path) if resume else {}
+    client = _service_client(service)
+    try:
+        with CheckpointWriter(checkpoint_path) as checkpoint:
+            _score_unique_headlines(
+                to_score,
+                backends,
+                headline_to_tickers,
+                get_matching_config(),
+                cache,
+                ollama_concurrency,
+                done=done,
+                on_score=checkpoint.write,
+                client=client,
+            )
+    finally:
+        if client is not None:
+            client.close()
+    del done
+
+    wanted = {BACKENDS[b][0] for b in backends if b in BACKENDS}
+    headline_scores = {
+        h: {k: v for k, v in scores.items() if k in wanted}
+        for h, scores in load_checkpoint(checkpoint_path).items()
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.parent / f"{output_path.name}.tmp"
+    n_rows = 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for row in iter_rows(input_path):
+            f.write(json.dumps(_merge_scores(row, headline_scores, rep_of), ensure_ascii=False) + "\n")
+            n_rows += 1
+    tmp_path.replace(output_path)
+    checkpoint_path.unlink(missing_ok=True)
+    return (n_rows, n_rows)
@@ -0,0 +1,163 @@
+"""Persistent SQLite cache of sentiment scores keyed by headline, backend, prompt version and YAML context."""
+import hashlib
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.utils import ROOT
+
+CACHE_PATH = ROOT / "data" / "sentiment_cache.db"
+DEFAULT_MAX_ENTRIES = 500_000
+# Entries allowed past max_entries before put_many evicts, so writes skip COUNT(*) between evictions.
+EVICT_SLACK = 1000
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS score_cache (
+    cache_key TEXT PRIMARY KEY,
+    backend TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    score REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    last_used_at TEXT NOT NULL
+);
+"""
+CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_score_cache_model ON score_cache (model, prompt_version)",
+    "CREATE INDEX IF NOT EXISTS idx_score_cache_last_used ON score_cache (last_used_at)",
+)
+
+
+def normalize_headline(headline: str) -> str:
+    """Headline as the scorers receive it (stripped only): internal spacing and case reach the prompt."""
+    return (headline or "").strip()
+
+
+def cache_key(headline: str, model: str, prompt_ver: str, context: str | None = None) -> str:
+    """sha256 over (stripped headline, model id, prompt version, injected context)."""
+    parts = (normalize_headline(headline), model, prompt_ver, context or "")
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ScoreCache:
+    """
+    Content-addressed score store. Only successful (non-None) scores are cached, so failed
+    LLM calls are retried on the next run. hits/misses count lookups since open.
+    Eviction runs once the entry count may exceed max_entries by EVICT_SLACK; the count is
+    tracked as an upper bound between evictions instead of queried on every write.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(CREATE_TABLE)
+        for sql in CREATE_INDEXES:
+            self._conn.execute(sql)
+        self._conn.commit()
+        self._count = len(self)
+
+    def get_many(self, keys: list[str]) -> dict[str, float]:
+        """Return {key: score} for cached keys; updates hit/miss counters and last_used_at."""
+        found: dict[str, float] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), 500):
+            chunk = unique[start : start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            for key, score in self._conn.execute(
+                f"SELECT cache_key, score FROM score_cache WHERE cache_key IN ({placeholders})",
+                chunk,
+            ):
+                found[key] = score
+        if found:
+            now = _now()
+            self._conn.executemany(
+                "UPDATE score_cache SET last_used_at = ? WHERE cache_key = ?",
+                [(now, k) for k in found],
+            )
+            self._conn.commit()
+        self.hits += len(found)
+        self.misses += len(unique) - len(found)
+        return found
+
+    def put_many(
+        self,
+        entries: list[tuple[str, float | None]],
+        backend: str,
+        model: str,
+        prompt_ver: str,
+    ) -> None:
+        """Store (key, score) pairs for one backend; None scores are skipped. Evicts past max_entries + EVICT_SLACK."""
+        now = _now()
+        rows = [
+            (key, backend, model, prompt_ver, float(score), now, now)
+            for key, score in entries
+            if score is not None
+        ]
+        if not rows:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO score_cache "
+            "(cache_key, backend, model, prompt_version, score, created_at, last_used_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.commit()
+        # Replaced keys are counted too, so _count only over-estimates and evict() corrects it.
+        self._count += len(rows)
+        if self._count > self.max_entries + EVICT_SLACK:
+            self.evict()
+
+    def invalidate(self, model: str | None = None, prompt_ver: str | None = None) -> int:
+        """Delete entries for a model and/or prompt version (both None clears all). Returns rows deleted."""
+        clauses, params = [], []
+        if model is not None:
+            clauses.append("model = ?")
+            params.append(model)
+        if prompt_ver is not None:
+            clauses.append("prompt_version = ?")
+            params.append(prompt_ver)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        cur = self._conn.execute(f"DELETE FROM score_cache{where}", params)
+        self._conn.commit()
+        self._count -= cur.rowcount
+        return cur.rowcount
+
+    def evict(self, max_entries: int | None = None) -> int:
+        """Drop least recently used entries beyond max_entries. Returns rows deleted."""
+        limit = self.max_entries if max_entries is None else max_entries
+        count = len(self)
+        excess = count - limit
+        if excess <= 0:
+            self._count = count
+            return 0
+        cur = self._conn.execute(
+            "DELETE FROM score_cache WHERE cache_key IN "
+            "(SELECT cache_key FROM score_cache ORDER BY last_used_at, created_at LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+        self._count = count - cur.rowcount
+        return cur.rowcount
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM score_cache").fetchone()[0]
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ScoreCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,438 @@
+"""Warm-model scoring service: FinBERT kept resident with micro-batching, Ollama fronted; local HTTP or Unix socket."""
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from urllib.parse import urlparse
+
+from .finbert_scorer import DEFAULT_BATCH_SIZE
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_SERVICE_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+# Micro-batching: a FinBERT forward starts once MAX_BATCH headlines are queued or the oldest
+# request has waited MAX_WAIT_MS, whichever comes first.
+MAX_BATCH = 64
+MAX_WAIT_MS = 2.0
+# Headlines per /score request from ServiceClient.score_many (bounds request size and lets
+# callers checkpoint between chunks).
+CLIENT_CHUNK = 256
+CLIENT_TIMEOUT = 600
+# How long Ollama keeps a warmed model loaded after the last request.
+OLLAMA_KEEP_ALIVE = "30m"
+LATENCY_WINDOW = 2048
+
+
+class LatencyStats:
+    """Request/headline counters and a rolling window of request latencies (ms) for one backend."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self.requests = 0
+        self.headlines = 0
+        self.errors = 0
+        self._recent: deque[tuple[float, int]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float, n_headlines: int, ok: bool = True) -> None:
+        with self._lock:
+            self.requests += 1
+            self.headlines += n_headlines
+            if not ok:
+                self.errors += 1
+                return
+            self._recent.append((latency_ms, n_headlines))
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            recent = list(self._recent)
+            out: dict[str, Any] = {"requests": self.requests, "headlines": self.headlines, "errors": self.errors}
+        if recent:
+            ms = sorted(m for m, _ in recent)
+            out["p50_ms"] = round(ms[len(ms) // 2], 3)
+            out["p95_ms"] = round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3)
+            out["ms_per_headline"] = round(sum(ms) / max(1, sum(n for _, n in recent)), 3)
+        return out
+
+
+class FinbertBatcher:
+    """
+    Coalesces concurrent requests for one in-process FinBERT scorer (score_finbert_batch or the int8
+    variant) into shared batch calls on one worker thread (the model stays loaded for the life of the
+    process). submit() returns a Future of the scores.
+    """
+
+    def __init__(
+        self,
+        score_batch: Callable[..., list[float]],
+        max_batch: int = MAX_BATCH,
+        max_wait_ms: float = MAX_WAIT_MS,
+    ) -> None:
+        self.score_batch = score_batch
+        self.max_batch = max(1, max_batch)
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000
+        self.batches = 0
+        self.batched_headlines = 0
+        self.forward_ms = 0.0
+        self._queue: queue.Queue[tuple[list[str], Future] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="finbert-batcher", daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, texts: list[str]) -> Future:
+        fut: Future = Future()
+        if not texts:
+            fut.set_result([])
+        else:
+            self._queue.put((texts, fut))
+        return fut
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            jobs = [item]
+            n = len(item[0])
+            deadline = time.monotonic() + self.max_wait_s
+            stop = False
+            while n < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                jobs.append(nxt)
+                n += len(nxt[0])
+            self._score(jobs)
+            if stop:
+                return
+
+    def _score(self, jobs: list[tuple[list[str], Future]]) -> None:
+        texts = [t for job_texts, _ in jobs for t in job_texts]
+        start = time.perf_counter()
+        try:
+            scores = self.score_batch(texts, batch_size=max(DEFAULT_BATCH_SIZE, self.max_batch))
+        except Exception as e:  # surface model errors to every waiting request
+            for _, fut in jobs:
+                fut.set_exception(e)
+            return
+        self.forward_ms += (time.perf_counter() - start) * 1000
+        self.batches += 1
+        self.batched_headlines += len(texts)
+        i = 0
+        for job_texts, fut in jobs:
+            fut.set_result(scores[i : i + len(job_texts)])
+            i += len(job_texts)
+
+
+class ScoringService:
+    """
+    Backend dispatch behind the HTTP handler. backends are BACKENDS ids this process serves
+    (default DEFAULT_BACKENDS). FinBERT scorers (LOCAL_SCORERS) get one batcher each; Ollama models
+    go through score_ollama_many with one pooled session and one adaptive in-flight limiter per
+    model shared by all requests.
+    """
+
+    def __init__(
+        self,
+        backends: list[str] | None = None,
+        max_batch: int = MAX_BATCH,
+        max_wait_ms: float = MAX_WAIT_MS,
+    ) -> None:
+        from .pipeline import BACKENDS, DEFAULT_BACKENDS, LOCAL_SCORERS
+
+        self.backends = {b: BACKENDS[b][1] for b in (backends or DEFAULT_BACKENDS) if b in BACKENDS}
+        self.started = time.time()
+        self.stats = {b: LatencyStats() for b in self.backends}
+        self.batchers = {
+            spec: FinbertBatcher(LOCAL_SCORERS[spec][1], max_batch, max_wait_ms)
+            for spec in dict.fromkeys(self.backends.values())
+            if spec in LOCAL_SCORERS
+        }
+        self.finbert_loaded = False
+        self.ollama_warm: dict[str, bool] = {}
+        self._session = None
+        self._limiters: dict[str, Any] = {}
+        self._ollama_lock = threading.Lock()
+
+    def warm(self, ollama: bool = True) -> None:
+        """Load FinBERT (one dummy forward) and ask Ollama to load each served model; Ollama failures are recorded, not raised."""
+        for batcher in self.batchers.values():
+            batcher.submit(["warm up"]).result()
+            self.finbert_loaded = True
+        if not ollama:
+            return
+        import requests
+
+        from .ollama_scorer import OLLAMA_URL
+
+        for model in self.backends.values():
+            if model in self.batchers:
+                continue
+            try:
+                # A generate call without a prompt only loads the model.
+                r = requests.post(OLLAMA_URL, json={"model": model, "keep_alive": OLLAMA_KEEP_ALIVE}, timeout=120)
+                r.raise_for_status()
+                self.ollama_warm[model] = True
+            except requests.RequestException:
+                self.ollama_warm[model] = False
+
+    def _ollama(self, model: str) -> tuple[Any, Any]:
+        from .ollama_engine import DEFAULT_CONCURRENCY, OLLAMA_CONCURRENCY, AdaptiveLimiter, make_session
+
+        with self._ollama_lock:
+            if self._session is None:
+                self._session = make_session(sum(OLLAMA_CONCURRENCY.values()) or DEFAULT_CONCURRENCY)
+            if model not in self._limiters:
+                self._limiters[model] = AdaptiveLimiter(OLLAMA_CONCURRENCY.get(model, DEFAULT_CONCURRENCY))
+            return self._session, self._limiters[model]
+
+    def score(self, backend: str, headlines: list[str], contexts: dict[str, str | None] | None = None) -> list[float | None]:
+        """Scores for headlines (input order) from one served backend; ValueError if it is not served."""
+        if backend not in self.backends:
+            raise ValueError(f"backend {backend!r} not served (serving: {', '.join(self.backends)})")
+        spec = self.backends[backend]
+        start = time.perf_counter()
+        ok = False
+        try:
+            if spec in self.batchers:
+                scores: list[float | None] = list(self.batchers[spec].submit(headlines).result())
+                self.finbert_loaded = True
+            else:
+                from .ollama_engine import score_ollama_many
+
+                session, limiter = self._ollama(spec)
+                by_headline = dict(
+                    score_ollama_many(headlines, spec, contexts=contexts, session=session, limiter=limiter)
+                )
+                scores = [by_headline.get(h) for h in headlines]
+            ok = True
+            return scores
+        finally:
+            self.stats[backend].record((time.perf_counter() - start) * 1000, len(headlines), ok)
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started, 1),
+            "backends": list(self.backends),
+            "finbert_loaded": self.finbert_loaded,
+            "ollama_warm": self.ollama_warm,
+            "finbert_queue_depth": sum(b.queue_depth for b in self.batchers.values()),
+        }
+
+    def stats_snapshot(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"backends": {b: s.snapshot() for b, s in self.stats.items()}}
+        out["finbert_batches"] = {
+            spec: {
+                "batches": b.batches,
+                "headlines": b.batched_headlines,
+                "mean_batch": round(b.batched_headlines / b.batches, 2) if b.batches else 0.0,
+                "forward_ms_per_headline": round(b.forward_ms / b.batched_headlines, 3) if b.batched_headlines else 0.0,
+            }
+            for spec, b in self.batchers.items()
+        }
+        return out
+
+    def close(self) -> None:
+        for batcher in self.batchers.values():
+            batcher.close()
+        if self._session is not None:
+            self._session.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """GET /health, GET /stats, POST /score {"backend", "headlines", "contexts"?} -> {"scores"}."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "SentimentService/1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        service: ScoringService = self.server.service
+        if self.path == "/health":
+            self._reply(200, service.health())
+        elif self.path == "/stats":
+            self._reply(200, service.stats_snapshot())
+        else:
+            self._reply(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        service: ScoringService = self.server.service
+        if self.path != "/score":
+            self._reply(404, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            backend = body["backend"]
+            headlines = [str(h) for h in body["headlines"]]
+            contexts = body.get("contexts") or None
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply(400, {"error": f"bad request: {e}"})
+            return
+        try:
+            scores = service.score(backend, headlines, contexts)
+        except ValueError as e:
+            self._reply(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._reply(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._reply(200, {"backend": backend, "scores": scores})
+
+
+class _TCPHandler(_Handler):
+    # Headers and body go out in separate writes; without TCP_NODELAY each reply waits on delayed ACK (~40 ms).
+    disable_nagle_algorithm = True
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # A full Unix-socket backlog fails connect() with EAGAIN instead of making the client wait.
+    request_queue_size = 128
+
+
+def make_server(
+    service: ScoringService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """HTTP server for service on host:port, or on a Unix socket when socket_path is given (stale socket file replaced)."""
+    if socket_path is not None:
+        socket_path.unlink(missing_ok=True)
+        server: socketserver.BaseServer = _UnixServer(str(socket_path), _Handler)
+    else:
+        server = _TCPServer((host, port), _TCPHandler)
+    server.service = service
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._socket_path)
+
+
+class ServiceClient:
+    """
+    Keep-alive client for the scoring service. url is "http://host:port" or "unix:/path/to.sock".
+    Raises OSError if the service is unreachable and RuntimeError on an error reply.
+    """
+
+    def __init__(self, url: str = DEFAULT_SERVICE_URL, timeout: float = CLIENT_TIMEOUT) -> None:
+        self.url = url
+        self.timeout = timeout
+        self._conn: http.client.HTTPConnection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.url.startswith("unix:"):
+            return _UnixHTTPConnection(self.url[len("unix:") :], self.timeout)
+        parsed = urlparse(self.url)
+        return http.client.HTTPConnection(parsed.hostname or DEFAULT_HOST, parsed.port or DEFAULT_PORT, timeout=self.timeout)
+
+    def _request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        with self._lock:
+            for attempt in range(2):
+                if self._conn is None:
+                    self._conn = self._connect()
+                try:
+                    self._conn.request(method, path, body=body, headers=headers)
+                    resp = self._conn.getresponse()
+                    data = json.loads(resp.read() or b"{}")
+                    break
+                except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                    # Server closed an idle keep-alive connection: reconnect once.
+                    self._conn.close()
+                    self._conn = None
+                    if attempt:
+                        raise
+        if resp.status != 200:
+            raise RuntimeError(f"scoring service {method} {path} -> {resp.status}: {data.get('error', data)}")
+        return data
+
+    def health(self) -> dict[str, Any]:
+        return self._request("GET", "/health")
+
+    def stats(self) -> dict[str, Any]:
+        return self._request("GET", "/stats")
+
+    def score(
+        self, backend: str, headlines: list[str], contexts: dict[str, str | None] | None = None
+    ) -> list[float | None]:
+        """Scores for headlines (same order) from backend (a BACKENDS id)."""
+        payload: dict[str, Any] = {"backend": backend, "headlines": headlines}
+        if contexts:
+            payload["contexts"] = {h: contexts[h] for h in headlines if contexts.get(h)}
+        return self._request("POST", "/score", payload)["scores"]
+
+    def score_many(
+        self,
+        backend: str,
+        headlines: list[str],
+        contexts: dict[str, str | None] | None = None,
+        chunk_size: int = CLIENT_CHUNK,
+    ) -> Iterator[tuple[str, float | None]]:
+        """Yield (headline, score) in input order, chunk_size headlines per request."""
+        for start in range(0, len(headlines), max(1, chunk_size)):
+            chunk = headlines[start : start + max(1, chunk_size)]
+            yield from zip(chunk, self.score(backend, chunk, contexts))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "ServiceClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,66 +1,190 @@
 """Shared I/O and path helpers for the pipeline."""
+from __future__ import annotations
+
 import json
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 ROOT = Path(__file__).resolve().parent.parent
 DATA_RAW = ROOT / "data" / "raw"
 DATA_CLEANED = ROOT / "data" / "cleaned"
 BASE_DATA_PATH = DATA_CLEANED / "base_data.jsonl"
 
+# Optional Parquet datasets (needs pyarrow): one partition directory per date, date=YYYYMMDD/.
+DATA_RAW_PARQUET = DATA_RAW / "parquet"
+BASE_DATA_PARQUET = DATA_CLEANED / "base_data_parquet"
+PARQUET_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+PARQUET_TIMESTAMP_COLUMNS = ("posted_at", "fetched_at")
+PARQUET_BOOL_COLUMNS = ("is_ai_related", "is_proxy_partnership")
+PARQUET_CATEGORY_COLUMNS = ("source", "reporter", "ticker")
+
 # Raw scrape files: daily CSV (headlines_YYYYMMDD.csv); legacy per-run JSONL still readable.
 RAW_HEADLINE_CSV_GLOB = "headlines_*.csv"
 RAW_HEADLINE_JSONL_GLOB = "headlines_*.jsonl"
 
+# Rows per pandas chunk for streaming CSV reads (without pyarrow).
+CSV_CHUNK_ROWS = 5000
+# Bytes per block for pyarrow's streaming CSV reader.
+CSV_BLOCK_BYTES = 1 << 20
+# Rows per record batch for streaming Parquet reads.
+PARQUET_BATCH_ROWS = 10000
+
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[list]:
+    """Consecutive lists of up to size items from rows, consumed lazily."""
+    it = iter(rows)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+@lru_cache(maxsize=1)
+def _json_loads() -> Callable[[bytes], Any]:
+    """orjson.loads when orjson is installed (several times faster), else json.loads."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
 
 def load_csv(path: Path) -> list[dict]:
-    """Load a UTF-8 CSV as list of dicts. Empty/missing file -> []."""
+    """Load a UTF-8 CSV as list of dicts (all values str, empty fields ""). Empty/missing file -> []."""
+    return list(iter_csv(path))
+
+
+def iter_csv(path: Path, chunksize: int = CSV_CHUNK_ROWS) -> Iterator[dict]:
+    """
+    Yield rows of a UTF-8 CSV as dicts (all values str, empty fields ""), one block at a time:
+    pyarrow's streaming reader when installed, else pandas in chunks of chunksize rows.
+    """
     if not path.exists() or path.stat().st_size == 0:
-        return []
-    df = pd.read_csv(
-        path, encoding="utf-8", dtype=str, keep_default_na=False, na_filter=False
+        return
+    try:
+        import pyarrow.csv  # noqa: F401
+    except ImportError:
+        yield from _iter_csv_pandas(path, chunksize)
+        return
+    yield from _iter_csv_arrow(path, chunksize)
+
+
+def _iter_csv_arrow(path: Path, chunksize: int) -> Iterator[dict]:
+    """
+    pyarrow streaming read. Arrow rejects rows with fewer fields than the header, which pandas pads
+    with ""; on ArrowInvalid the rest of the file is read with pandas, skipping rows already yielded.
+    """
+    import csv
+
+    import pyarrow as pa
+    import pyarrow.csv as pcsv
+
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        return
+    done = 0
+    try:
+        reader = pcsv.open_csv(
+            path,
+            read_options=pcsv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+            parse_options=pcsv.ParseOptions(newlines_in_values=True),
+            convert_options=pcsv.ConvertOptions(
+                column_types={c: pa.string() for c in header},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+        for batch in reader:
+            rows = batch.to_pylist()
+            done += len(rows)
+            yield from rows
+    except pa.ArrowInvalid:
+        yield from islice(_iter_csv_pandas(path, chunksize), done, None)
+
+
+def _iter_csv_pandas(path: Path, chunksize: int) -> Iterator[dict]:
+    import pandas as pd
+
+    reader = pd.read_csv(
+        path,
+        encoding="utf-8",
+        dtype=str,
+        keep_default_na=False,
+        na_filter=False,
+        chunksize=chunksize,
     )
-    return df.to_dict(orient="records")
+    with reader:
+        for chunk in reader:
+            yield from chunk.to_dict(orient="records")
 
 
-def load_jsonl(path: Path) -> list[dict]:
-    """Load a JSONL file as list of dicts. Skips blank lines and invalid JSON."""
-    rows = []
+def iter_rows(path: Path) -> Iterator[dict]:
+    """Yield rows from a .csv, .jsonl, or Parquet file/dataset directory, a block/line/batch at a time."""
+    suf = path.suffix.lower()
+    if suf == ".csv":
+        yield from iter_csv(path)
+    elif suf == ".jsonl":
+        yield from iter_jsonl(path)
+    elif suf == ".parquet" or path.is_dir():
+        yield from iter_parquet(path)
+    else:
+        raise ValueError(f"Unsupported row file format: {path}")
+
+
+def iter_headline_rows(paths: Iterable[Path]) -> Iterator[dict]:
+    """Yield rows of several headline files (.csv / .jsonl / Parquet) in order, streaming each as iter_rows."""
+    for p in paths:
+        yield from iter_rows(p)
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """
+    Yield dicts from a JSONL file line by line (orjson when installed). Skips blank lines and invalid JSON.
+    Lines orjson rejects are retried with json.loads, which accepts the NaN / Infinity that write_jsonl
+    (json.dumps) emits for non-finite floats; a line is skipped only if both fail.
+    """
     if not path.exists():
-        return rows
-    with open(path, encoding="utf-8") as f:
+        return
+    loads = _json_loads()
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                rows.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return rows
+                yield loads(line)
+            except ValueError:
+                if loads is json.loads:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def iter_jsonl_rows(paths: Iterable[Path]) -> Iterator[dict]:
+    """Yield dicts from one or more JSONL files in order."""
+    for p in paths:
+        yield from iter_jsonl(p)
+
+
+def load_jsonl(path: Path) -> list[dict]:
+    """Load a JSONL file as list of dicts. Skips blank lines and invalid JSON."""
+    return list(iter_jsonl(path))
 
 
 def load_jsonl_paths(paths: list[Path]) -> list[dict]:
     """Load one or more JSONL files and return concatenated list of dicts."""
-    out = []
-    for p in paths:
-        out.extend(load_jsonl(p))
-    return out
+    return list(iter_jsonl_rows(paths))
 
 
 def load_headline_paths(paths: list[Path]) -> list[dict]:
-    """Load raw headline files: .csv via read_csv, .jsonl via load_jsonl."""
-    out: list[dict] = []
-    for p in paths:
-        suf = p.suffix.lower()
-        if suf == ".csv":
-            out.extend(load_csv(p))
-        elif suf == ".jsonl":
-            out.extend(load_jsonl(p))
-        else:
-            raise ValueError(f"Unsupported raw headline format: {p}")
-    return out
+    """Load raw headline files (.csv, .jsonl, .parquet / dataset dir) as one list; see iter_headline_rows."""
+    return list(iter_headline_rows(paths))
 
 
 def iter_raw_headline_paths() -> list[Path]:
@@ -70,6 +194,145 @@ def iter_raw_headline_paths() -> list[Path]:
     return sorted(csv_paths + jsonl_paths, key=lambda p: p.stat().st_mtime)
 
 
+def iter_raw_parquet_paths() -> list[Path]:
+    """Daily partition files under data/raw/parquet/date=*/, oldest date first."""
+    return sorted(DATA_RAW_PARQUET.glob("date=*/*.parquet"))
+
+
+def _to_typed_frame(rows: list[dict]) -> pd.DataFrame:
+    """Rows (string-valued like load_csv) -> DataFrame with UTC timestamps, nullable booleans, categories."""
+    import pandas as pd
+
+    df = pd.DataFrame(rows)
+    for col in PARQUET_TIMESTAMP_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(
+                df[col], format=PARQUET_TIMESTAMP_FORMAT, utc=True, errors="coerce"
+            )
+    for col in PARQUET_BOOL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(
+                {True: True, False: False, "True": True, "False": False}
+            ).astype("boolean")
+    for col in PARQUET_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _from_typed_frame(df: pd.DataFrame) -> list[dict]:
+    """Inverse of _to_typed_frame: back to the string form load_csv returns (NaN floats -> None)."""
+    df = df.copy()
+    for col in PARQUET_TIMESTAMP_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].dt.strftime(PARQUET_TIMESTAMP_FORMAT).fillna("")
+    for col in PARQUET_BOOL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map({True: "True", False: "False"}).astype(object).fillna("")
+    for col in PARQUET_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(object).fillna("")
+    df = df.astype(object)
+    return df.where(df.notna(), None).to_dict(orient="records")
+
+
+def read_parquet_df(root: Path, columns: list[str] | None = None, filters: list | None = None) -> pd.DataFrame:
+    """
+    Typed, column-pruned read of a Parquet file or date-partitioned dataset directory (needs pyarrow).
+    filters use pyarrow syntax, e.g. [("date", ">=", "20260301")]. Missing path -> empty DataFrame.
+    """
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    if not root.exists():
+        return pd.DataFrame(columns=columns or [])
+    table = pq.read_table(root, columns=columns, filters=filters)
+    return table.to_pandas()
+
+
+def load_parquet(root: Path, columns: list[str] | None = None) -> list[dict]:
+    """Load a Parquet file/dataset as list of dicts in load_csv's string form (partition column dropped)."""
+    return list(iter_parquet(root, columns))
+
+
+def iter_parquet(
+    root: Path, columns: list[str] | None = None, batch_rows: int = PARQUET_BATCH_ROWS
+) -> Iterator[dict]:
+    """
+    Yield rows of a Parquet file, or of every file under a dataset directory in path order, as
+    load_parquet does, reading batch_rows rows at a time (needs pyarrow). Missing path -> nothing.
+    """
+    import pyarrow.parquet as pq
+
+    if not root.exists():
+        return
+    if root.is_dir() and columns and "date" in columns:
+        # The partition column only exists in directory names; read it through the dataset.
+        yield from _from_typed_frame(read_parquet_df(root, columns=columns))
+        return
+    files = sorted(root.rglob("*.parquet")) if root.is_dir() else [root]
+    for path in files:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows, columns=columns):
+            df = batch.to_pandas()
+            if "date" in df.columns and (columns is None or "date" not in columns):
+                df = df.drop(columns=["date"])
+            yield from _from_typed_frame(df)
+
+
+def write_parquet(
+    rows: list[dict],
+    root: Path,
+    partition_col: str,
+    stem: str,
+    key_cols: list[str] | None = None,
+    sort_cols: list[str] | None = None,
+    replace: bool = False,
+) -> list[Path]:
+    """
+    Write rows to root/date=YYYYMMDD/<stem>_YYYYMMDD.parquet, partitioned by the UTC date of partition_col.
+    Touched partitions are merged with what is already on disk (existing rows first), deduped on key_cols
+    keeping first, sorted by sort_cols, and replaced atomically. replace=True drops the whole dataset first.
+    Timestamps/booleans are typed and source/reporter/ticker dictionary-encoded. Needs pyarrow.
+    """
+    import shutil
+
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if replace and root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True, exist_ok=True)
+    if not rows:
+        return []
+    new_df = _to_typed_frame(rows)
+    dates = new_df[partition_col].dt.strftime("%Y%m%d").fillna("unknown")
+    written: list[Path] = []
+    for date_str, part in new_df.groupby(dates, sort=True):
+        path = root / f"date={date_str}" / f"{stem}_{date_str}.parquet"
+        if path.exists():
+            old_df = pq.read_table(path).to_pandas()
+            part = pd.concat([old_df, part], ignore_index=True)
+            for col in PARQUET_CATEGORY_COLUMNS:
+                if col in part.columns:
+                    part[col] = part[col].astype(str).astype("category")
+        if key_cols:
+            part = part.drop_duplicates(subset=key_cols, keep="first")
+        if sort_cols:
+            part = part.sort_values(by=sort_cols, kind="mergesort")
+        part = part.reset_index(drop=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.parent / f"{path.name}.tmp"
+        pq.write_table(
+            pa.Table.from_pandas(part, preserve_index=False),
+            tmp_path,
+            compression="zstd",
+        )
+        tmp_path.replace(path)
+        written.append(path)
+    return written
+
+
 def write_jsonl(rows: list[dict], path: Path) -> None:
     """Write list of dicts to JSONL. Creates parent dirs if needed."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,41 @@
+"""Shared pytest setup: make the repo root importable, as scripts/ do with sys.path; shared fixtures."""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def events():
+    """
+    Synthetic backtest Events over three tickers (60 / 45 / 30 events): three signals with NaNs, one
+    rounded (ties and exact zeros) and one constant within a ticker (corr NaN), two return horizons.
+    """
+    import numpy as np
+
+    from src.backtest import Events
+
+    rng = np.random.default_rng(7)
+    sizes = [60, 45, 30]
+    ticker_idx = np.repeat(np.arange(len(sizes)), sizes)
+    n = len(ticker_idx)
+    signals = rng.normal(size=(3, n))
+    signals[1] = np.round(signals[1], 1)
+    signals[2, ticker_idx == 2] = 0.25
+    signals[:, rng.random(n) < 0.1] = np.nan
+    returns = rng.normal(scale=0.02, size=(2, n))
+    returns[:, rng.random(n) < 0.1] = np.nan
+    excess = returns - rng.normal(scale=0.005, size=(2, n))
+    return Events(
+        tickers=["AAA", "BBB", "CCC"],
+        ticker_idx=ticker_idx,
+        days=np.concatenate([np.arange(s) for s in sizes]).astype("datetime64[D]"),
+        signal_names=["s0", "s1", "s2"],
+        signals=signals,
+        return_names=["ret_eod", "ret_1d"],
+        returns=returns,
+        excess=excess,
+    )
@@ -0,0 +1,54 @@
+"""Vectorized backtest metrics vs a straightforward pandas groupby over the same events."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import ALL_TICKERS, backtest
+
+
+def _reference(df: pd.DataFrame) -> dict:
+    """Metrics for one (scope, signal, horizon) from a frame with columns s, r, x."""
+    pair = df.dropna(subset=["s", "r"])
+    decided = pair[(pair["s"] != 0) & (pair["r"] != 0)]
+    pnl = -np.sign(pair["s"]) * pair["r"]
+    q = df.dropna(subset=["s"]).copy()
+    q["bucket"] = pd.qcut(q["s"], 5, labels=False, duplicates="drop")
+    low = q[q["bucket"] == 0]["x"].mean()
+    high = q[q["bucket"] == 4]["x"].mean()
+    return {
+        "n": len(pair),
+        "corr": pair["s"].corr(pair["r"]),
+        "hit_rate": (np.sign(decided["s"]) == np.sign(decided["r"])).mean() if len(decided) else np.nan,
+        "q_low": low,
+        "q_high": high,
+        "overlay_mean": pnl.mean(),
+        "overlay_total": pnl.sum(),
+        "overlay_tstat": pnl.mean() / (pnl.std(ddof=1) / np.sqrt(len(pnl))),
+    }
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")  # Series.corr on the constant signal
+def test_backtest_matches_pandas(events):
+    got = backtest(events).set_index(["ticker", "signal", "horizon"])
+    for k, signal in enumerate(events.signal_names):
+        for h, horizon in enumerate(events.return_names):
+            frame = pd.DataFrame(
+                {
+                    "ticker": np.array(events.tickers)[events.ticker_idx],
+                    "s": events.signals[k],
+                    "r": events.returns[h],
+                    "x": events.excess[h],
+                }
+            )
+            scopes = [(t, frame[frame["ticker"] == t]) for t in events.tickers] + [(ALL_TICKERS, frame)]
+            for scope, df in scopes:
+                row = got.loc[(scope, signal, horizon)]
+                for name, expected in _reference(df).items():
+                    if name in ("q_low", "q_high") and df["s"].nunique() < 5:
+                        continue  # qcut collapses duplicate edges; the engine keeps 5 buckets
+                    assert row[name] == pytest.approx(expected, rel=1e-9, abs=1e-12, nan_ok=True), (
+                        scope,
+                        signal,
+                        horizon,
+                        name,
+                    )
@@ -0,0 +1,63 @@
+"""scripts/base_data.py: incremental builds equal full rebuilds; the committed manifest is checkout-independent."""
+import importlib.util
+import os
+import shutil
+import sys
+
+import pytest
+
+from src.utils import DATA_RAW
+
+ROOT = DATA_RAW.parent.parent
+
+
+@pytest.fixture
+def base_data(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("base_data_script", ROOT / "scripts" / "base_data.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    raw_dir, cleaned = tmp_path / "raw", tmp_path / "cleaned"
+    raw_dir.mkdir()
+    cleaned.mkdir()
+    monkeypatch.setattr(module, "DATA_CLEANED", cleaned)
+    monkeypatch.setattr(module, "MANIFEST_PATH", cleaned / "base_data_manifest.json")
+    monkeypatch.setattr(module, "STAT_CACHE_PATH", cleaned / "base_data_stat_cache.json")
+    monkeypatch.setattr(module, "iter_raw_headline_paths", lambda: sorted(raw_dir.glob("headlines_*.csv")))
+    module.raw_dir = raw_dir
+    return module
+
+
+def _run(module, monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["base_data.py", *args])
+    module.main()
+    return (module.DATA_CLEANED / "base_data.csv").read_bytes()
+
+
+def _add_raw(module, paths):
+    for p in paths:
+        shutil.copy(p, module.raw_dir / p.name)
+
+
+def test_incremental_equals_full(base_data, monkeypatch):
+    raw = sorted(DATA_RAW.glob("headlines_*.csv"))[:6]
+    _add_raw(base_data, raw[:4])
+    _run(base_data, monkeypatch)
+    _add_raw(base_data, raw[4:])
+    incremental = _run(base_data, monkeypatch)
+    full = _run(base_data, monkeypatch, "--full")
+    assert incremental == full
+    assert full.count(b"\n") > 100
+
+
+def test_manifest_ignores_mtimes(base_data, monkeypatch):
+    _add_raw(base_data, sorted(DATA_RAW.glob("headlines_*.csv"))[:3])
+    _run(base_data, monkeypatch)
+    manifest = base_data.MANIFEST_PATH.read_bytes()
+    assert b"mtime" not in manifest
+    # A fresh checkout: new mtimes and no local stat cache.
+    for p in base_data.raw_dir.iterdir():
+        os.utime(p, (1_000_000_000, 1_000_000_000))
+    base_data.STAT_CACHE_PATH.unlink()
+    _run(base_data, monkeypatch)
+    assert base_data.MANIFEST_PATH.read_bytes() == manifest
+    assert base_data.STAT_CACHE_PATH.exists()
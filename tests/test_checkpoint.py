@@ -0,0 +1,80 @@
+"""Checkpointed sentiment: an interrupted run resumed with --resume gives the uninterrupted output."""
+import csv
+
+import pytest
+
+from src.sentiment import pipeline
+from src.sentiment.checkpoint import checkpoint_path_for, load_checkpoint
+from src.utils import load_jsonl
+
+HEADLINES = [f"Nvidia headline number {i}" for i in range(12)]
+
+
+class Interrupted(Exception):
+    pass
+
+
+def _scorer(calls: list[str], offset: float, fail_after: int | None = None):
+    def score(texts):
+        # Lazily, like a real batch arriving: each score reaches the checkpoint before the next.
+        for t in texts:
+            if fail_after is not None and len(calls) >= fail_after:
+                raise Interrupted
+            calls.append(t)
+            yield offset + len(t) / 100
+
+    return score
+
+
+def _write_input(path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=["posted_at", "headline", "url", "ticker"])
+        w.writeheader()
+        for i, h in enumerate(HEADLINES):
+            for ticker in ("NVDA", "MSFT") if i % 3 == 0 else ("NVDA",):
+                w.writerow({"posted_at": f"2026-03-{i + 1:02d}T12:00:00Z", "headline": h, "url": f"u{i}", "ticker": ticker})
+
+
+def _run(monkeypatch, input_path, output_path, finbert, int8, resume=False):
+    monkeypatch.setitem(pipeline.LOCAL_SCORERS, "finbert", ("fake-finbert", finbert))
+    monkeypatch.setitem(pipeline.LOCAL_SCORERS, "finbert-int8", ("fake-int8", int8))
+    return pipeline.run_sentiment_checkpointed(
+        input_path, output_path, backends=["finbert", "finbert-int8"], resume=resume, near_dup_threshold=None
+    )
+
+
+def test_resume_matches_uninterrupted_run(tmp_path, monkeypatch):
+    input_path = tmp_path / "base.csv"
+    _write_input(input_path)
+    full_out, out = tmp_path / "full.jsonl", tmp_path / "processed.jsonl"
+    _run(monkeypatch, input_path, full_out, _scorer([], 0.0), _scorer([], 0.5))
+
+    first, second = [], []
+    with pytest.raises(Interrupted):
+        _run(monkeypatch, input_path, out, _scorer(first, 0.0), _scorer(second, 0.5, fail_after=5))
+    checkpoint = checkpoint_path_for(out)
+    saved = load_checkpoint(checkpoint)
+    assert len(saved) == len(HEADLINES)
+    assert sum("sentiment_finbert_int8" in s for s in saved.values()) == 5
+    assert not out.exists()
+
+    resumed_first, resumed_second = [], []
+    n_read, n_written = _run(
+        monkeypatch, input_path, out, _scorer(resumed_first, 0.0), _scorer(resumed_second, 0.5), resume=True
+    )
+    assert resumed_first == []
+    assert resumed_second == HEADLINES[5:]
+    assert n_read == n_written == 16
+    assert load_jsonl(out) == load_jsonl(full_out)
+    assert not checkpoint.exists()
+
+
+def test_without_resume_discards_checkpoint(tmp_path, monkeypatch):
+    input_path = tmp_path / "base.csv"
+    _write_input(input_path)
+    out = tmp_path / "processed.jsonl"
+    with pytest.raises(Interrupted):
+        _run(monkeypatch, input_path, out, _scorer([], 0.0, fail_after=3), _scorer([], 0.5))
+    calls = []
+    _run(monkeypatch, input_path, out, _scorer(calls, 0.0), _scorer([], 0.5))
+    assert calls == HEADLINES
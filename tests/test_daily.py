@@ -0,0 +1,115 @@
+"""DailyPanel vs the notebook's pandas groupby, incremental updates, row-filter variants and decay windows."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sentiment import build_daily_panel
+from src.sentiment.daily import DailyPanel
+from src.utils import DATA_CLEANED, load_jsonl
+
+# Notebook column -> panel feature.
+NOTEBOOK_AVGS = {
+    "finbert_avg": "sentiment_finbert",
+    "phi3_avg": "sentiment_llm_phi3",
+    "llama3_2_avg": "sentiment_llm_llama3_2",
+    "deepseek_r1_avg": "sentiment_llm_deepseek_r1",
+}
+
+
+@pytest.fixture(scope="module")
+def rows() -> list[dict]:
+    return load_jsonl(DATA_CLEANED / "processed_base_data.jsonl")
+
+
+def _notebook_daily(rows: list[dict]) -> pd.DataFrame:
+    """The notebook's daily table before the panel: groupby/agg, per-ticker ffill, deltas and LLM spread."""
+    df = pd.DataFrame(rows)
+    df["posted_at"] = pd.to_datetime(df["posted_at"], utc=True, errors="coerce")
+    df["date"] = df["posted_at"].dt.tz_convert(None).dt.normalize()
+    daily = (
+        df.groupby(["ticker", "date"], as_index=False)
+        .agg(headline_count=("headline", "count"), **{c: (src, "mean") for c, src in NOTEBOOK_AVGS.items()})
+        .sort_values(["ticker", "date"])
+    )
+    avg_cols = list(NOTEBOOK_AVGS)
+    daily[avg_cols] = daily.groupby("ticker")[avg_cols].ffill()
+    llm = ["phi3", "llama3_2", "deepseek_r1"]
+    for name in llm:
+        daily[f"{name}_delta"] = daily[f"{name}_avg"] - daily["finbert_avg"]
+    deltas = daily[[f"{name}_delta" for name in llm]]
+    daily["delta_sum"] = deltas.abs().sum(axis=1)
+    daily["delta_mean_signed"] = deltas.sum(axis=1) / 3
+    daily["llm_spread"] = daily[[f"{name}_avg" for name in llm]].std(axis=1)
+    return daily.reset_index(drop=True)
+
+
+def test_matches_notebook_groupby(rows):
+    got = build_daily_panel(rows).to_frame()
+    expected = _notebook_daily(rows)
+    assert list(got["ticker"]) == list(expected["ticker"])
+    assert (got["date"].values == expected["date"].values).all()
+    assert list(got["headline_count"]) == list(expected["headline_count"])
+    for col in expected.columns[3:]:
+        np.testing.assert_allclose(got[col], expected[col], rtol=1e-12, atol=1e-12, err_msg=col)
+
+
+def _state(panel: DailyPanel) -> tuple:
+    return panel.tickers, panel.dates, panel.sums, panel.counts, panel.headline_counts
+
+
+def test_incremental_update_matches_full_build(rows, monkeypatch):
+    rows = sorted(rows, key=lambda r: r["posted_at"])
+    cut = len(rows) * 2 // 3
+    # The second batch overlaps the first by a few rows (replaced, not double-counted) and rescores one.
+    batch1, batch2 = rows[:cut], [dict(r) for r in rows[cut - 5 :]]
+    batch2[0]["sentiment_finbert"] = 0.123
+    full = build_daily_panel(rows[: cut - 5] + batch2)
+
+    panel = build_daily_panel(batch1)
+    touched = []
+    aggregate = DailyPanel._aggregate
+    monkeypatch.setattr(DailyPanel, "_aggregate", lambda self, days: touched.append(days) or aggregate(self, days))
+    returned = panel.update(batch2)
+
+    batch2_days = np.unique(np.array([r["posted_at"][:10] for r in batch2], dtype="datetime64[D]"))
+    assert len(touched) == 1
+    assert (touched[0].astype("datetime64[D]") == batch2_days).all()
+    assert (returned == batch2_days).all()
+    for a, b in zip(_state(panel), _state(full)):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_variants_filter_on_flags(rows):
+    # Committed rows are all AI-related; clear the flag on every third row so "ai" has something to drop.
+    rows = [dict(r, is_ai_related=str(i % 3 != 0)) for i, r in enumerate(rows)]
+    checks = {
+        "ai": lambda r: r["is_ai_related"] == "True",
+        "partnership": lambda r: r["is_proxy_partnership"] == "True",
+        "direct": lambda r: r["is_proxy_partnership"] != "True",
+    }
+    for variant, keep in checks.items():
+        panel = build_daily_panel(rows, variant=variant)
+        kept = [r for r in rows if keep(r)]
+        assert 0 < len(kept) < len(rows)
+        reference = build_daily_panel(kept)
+        # The variant panel spans every row's dates and tickers; outside the kept rows it is empty.
+        d = np.searchsorted(panel.dates, reference.dates)
+        t = [panel.tickers.index(x) for x in reference.tickers]
+        for name in ("sums", "counts", "headline_counts"):
+            got, expected = getattr(panel, name), getattr(reference, name)
+            np.testing.assert_array_equal(got[np.ix_(d, t)], expected)
+            assert got.sum() == pytest.approx(expected.sum())
+
+
+def test_decay_windows_against_loops(rows):
+    panel = build_daily_panel(rows)
+    decay = 0.5 ** (1 / 3.0)
+    sums, counts = panel.sums.copy(), panel.counts.copy()
+    for t in range(1, len(sums)):
+        sums[t] += decay * sums[t - 1]
+        counts[t] += decay * counts[t - 1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.testing.assert_allclose(panel.ewm_mean(3.0), sums / counts, rtol=1e-12)
+        s7 = np.stack([panel.sums[max(0, t - 6) : t + 1].sum(axis=0) for t in range(len(sums))])
+        c7 = np.stack([panel.counts[max(0, t - 6) : t + 1].sum(axis=0) for t in range(len(sums))])
+        np.testing.assert_allclose(panel.window_mean(7), s7 / c7, rtol=1e-9, atol=1e-12)
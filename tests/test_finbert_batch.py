@@ -0,0 +1,63 @@
+"""score_finbert_batch vs per-row score_finbert on a small randomly initialised BERT standing in for FinBERT."""
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from src.sentiment import finbert_scorer as fs
+
+TEXTS = [
+    "Nvidia beats estimates as data center revenue soars",
+    "",
+    "Microsoft cuts Azure guidance",
+    "   ",
+    "Apple",
+    "Tesla recalls vehicles over self driving software after regulators open a probe into crashes",
+    "Meta and Nvidia expand partnership",
+    "  Amazon shares fall  ",
+]
+# Batch vs single row differ only by float summation order under padding (~4e-7 on the stand-in).
+TOLERANCE = 1e-5
+
+
+@pytest.fixture
+def stand_in(tmp_path, monkeypatch):
+    words = sorted({w for t in TEXTS for w in t.lower().split()})
+    vocab = tmp_path / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *words]) + "\n", encoding="utf-8")
+    tokenizer = transformers.BertTokenizerFast(str(vocab))
+    config = transformers.BertConfig(
+        vocab_size=len(words) + 5,
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        num_labels=3,
+        initializer_range=0.5,  # wide logits so texts score visibly differently
+        id2label={0: "positive", 1: "negative", 2: "neutral"},
+    )
+    torch.manual_seed(0)
+    model = transformers.BertForSequenceClassification(config).eval()
+    monkeypatch.setattr(fs, "_tokenizer", tokenizer)
+    monkeypatch.setattr(fs, "_model", model)
+    monkeypatch.setattr(fs, "_id2label", {0: "positive", 1: "negative", 2: "neutral"})
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 32])
+def test_batch_matches_single_row(stand_in, batch_size):
+    batch = fs.score_finbert_batch(TEXTS, batch_size=batch_size)
+    single = [fs.score_finbert(t) for t in TEXTS]
+    assert len(batch) == len(TEXTS)
+    for text, b, s in zip(TEXTS, batch, single):
+        if not text.strip():
+            assert b == 0.0 and s == 0.0
+        else:
+            assert -1.0 <= b <= 1.0
+            assert b == pytest.approx(s, abs=TOLERANCE), text
+    # Order follows the input, not the length-sorted batches.
+    assert fs.score_finbert_batch(TEXTS[::-1], batch_size=batch_size) == pytest.approx(batch[::-1], abs=TOLERANCE)
+
+
+def test_all_blank_skips_model(monkeypatch):
+    monkeypatch.setattr(fs, "_load_finbert", lambda: pytest.fail("model loaded for blank input"))
+    assert fs.score_finbert_batch(["", "  ", "\n"]) == [0.0, 0.0, 0.0]
@@ -0,0 +1,101 @@
+"""Keyword automaton matching vs the original per-keyword regex matcher."""
+import re
+
+import pytest
+
+from src.matching import compile_matcher, load_matching_config
+from src.matching.config_loader import build_context_for_headline
+from src.matching.matcher import _normalize, match_headline
+from src.utils import DATA_RAW, load_csv
+
+EDGE_HEADLINES = [
+    "Nvidia unveils Blackwell B200 for generative AI",
+    "NVIDIA's new GPUs power OpenAI training runs",
+    "nvidiaX is not a ticker keyword",
+    "Microsoft and OpenAI expand partnership on Azure",
+    "Apple Intelligence arrives on iPhone",
+    "Tesla's FSD v13: self-driving AI, again",
+    "Amazon Web Services (AWS) signs deal with Anthropic",
+    "Meta's Llama 4 — open weights, big claims",
+    "Alphabet/Google DeepMind ships Gemini 2.5",
+    "Spectrum-X and Spectrum X networking",
+    "AMD vs. Nvidia: the 2nm race",
+    "A headline about nothing in particular",
+    "   Extra   whitespace   around   Microsoft   Copilot   ",
+    "café AI_tools and ai-powered robots",
+    "",
+]
+
+
+def _contains_keyword(text_lower: str, keyword: str) -> bool:
+    k = keyword.lower().strip()
+    if not k:
+        return False
+    if " " in k:
+        return k in text_lower
+    return bool(re.search(r"\b" + re.escape(k) + r"\b", text_lower))
+
+
+def _regex_match(headline: str, config: dict) -> list[tuple]:
+    """(ticker, is_ai_related, is_proxy_partnership) per output row, as the regex matcher produced them."""
+    text = _normalize(headline)
+    is_ai = any(
+        _contains_keyword(text, k) for k in config["ai_buzz_phrases"] + config["ai_buzz_entities"]
+    )
+    out = []
+    for ticker, data in config["tickers"].items():
+        if any(_contains_keyword(text, k) for k in data["ticker_keywords"]):
+            partner = any(_contains_keyword(text, k) for k in data["partner_keywords"])
+            out.append((ticker, is_ai, partner))
+    return out
+
+
+def _per_entry_context(headline_lower: str, tickers: list[str], config: dict) -> str | None:
+    """build_context_for_headline as it walked keyword_contexts before the compiled index."""
+    headline_lower = headline_lower.strip().lower()
+    parts = []
+    for ticker in tickers:
+        data = config.get("tickers", {}).get(ticker, {})
+        for keyword, ctx in (data.get("keyword_contexts") or {}).items():
+            if not keyword or not ctx:
+                continue
+            if keyword.lower() in headline_lower:
+                parts.append(ctx)
+    if not parts:
+        return None
+    return "This news relates to " + "; ".join(parts) + "."
+
+
+@pytest.fixture(scope="module")
+def config() -> dict:
+    return load_matching_config()
+
+
+def _headlines() -> list[str]:
+    raw = [r["headline"] for p in sorted(DATA_RAW.glob("headlines_*.csv"))[:5] for r in load_csv(p)]
+    return EDGE_HEADLINES + raw
+
+
+def test_automaton_matches_regex(config):
+    for headline in _headlines():
+        rows = match_headline({"headline": headline}, config)
+        got = [(r["ticker"], r["is_ai_related"], r["is_proxy_partnership"]) for r in rows]
+        assert got == _regex_match(headline, config), headline
+
+
+def test_word_boundaries():
+    automaton = compile_matcher(
+        {"ai_buzz_phrases": ["machine learning"], "ai_buzz_entities": ["ai"], "tickers": {}}
+    )
+    assert automaton.scan("ai-powered") == {("ai_entity", None)}
+    assert automaton.scan("said ai_tools") == set()
+    assert automaton.scan("chairman") == set()
+    assert automaton.scan("quantum machine learningx") == {("ai_phrase", None)}
+
+
+def test_keyword_contexts_match_per_entry_lookup(config):
+    tickers = list(config["tickers"])
+    for headline in _headlines():
+        for ticker_set in [[t] for t in tickers] + [tickers]:
+            got = build_context_for_headline(headline.lower(), ticker_set, config)
+            assert got == _per_entry_context(headline.lower(), ticker_set, config), headline
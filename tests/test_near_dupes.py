@@ -0,0 +1,49 @@
+"""Near-duplicate collapsing: off by default; opt-in default merges only identical canonical text."""
+import inspect
+
+from src.sentiment import pipeline
+from src.sentiment.near_dupes import DEFAULT_THRESHOLD, cluster_headlines
+
+# Real base_data.csv pairs that word Jaccard 0.8 merged although they differ in meaning.
+DIFFERENT_STORIES = [
+    (
+        "Anthropic’s Claude rises to No. 2 in the App Store following Pentagon dispute",
+        "Anthropic’s Claude rises to No. 1 in the App Store following Pentagon dispute",
+    ),
+    (
+        "The latest AI news we announced in June 2026 - blog.google",
+        "The latest AI news we announced in July 2026 - blog.google",
+    ),
+    (
+        "NVIDIA vs. TSMC: One AI Stock Is a Clear Buy Right Now - Zacks Investment Research",
+        "Micron vs. NVIDIA: One AI Stock Is a Clear Buy Right Now - Zacks Investment Research",
+    ),
+]
+
+
+def test_collapsing_is_off_by_default():
+    for fn in (pipeline.add_sentiment_to_rows, pipeline.run_sentiment_checkpointed):
+        assert inspect.signature(fn).parameters["near_dup_threshold"].default is None
+    headlines = [h for pair in DIFFERENT_STORIES for h in pair]
+    assert pipeline._representatives(headlines, {}, None) == (headlines, None)
+
+
+def test_different_stories_are_not_merged():
+    headlines = [h for pair in DIFFERENT_STORIES for h in pair]
+    rep_of = cluster_headlines(headlines, threshold=DEFAULT_THRESHOLD)
+    assert all(rep_of[h] == h for h in headlines)
+
+
+def test_syndicated_copies_are_merged():
+    a = "Nvidia unveils Rubin AI chips - Reuters"
+    b = "Nvidia  unveils Rubin AI chips | CNBC"
+    c = "nvidia unveils rubin AI chips!"
+    other_tickers = "Nvidia unveils Rubin AI chips - Bloomberg"
+    tickers = {a: ["NVDA"], b: ["NVDA"], c: ["NVDA"], other_tickers: ["NVDA", "MSFT"]}
+    rep_of = cluster_headlines([a, b, c, other_tickers], tickers)
+    assert rep_of == {a: a, b: a, c: a, other_tickers: other_tickers}
+
+
+def test_fuzzy_threshold_is_opt_in():
+    a, b = DIFFERENT_STORIES[0]
+    assert cluster_headlines([a, b], threshold=0.8)[b] == a
@@ -0,0 +1,78 @@
+"""Ollama engine backpressure and retry policy, against a fake session (no server needed)."""
+import requests
+
+from src.sentiment import ollama_engine
+from src.sentiment.ollama_engine import AdaptiveLimiter, _score_with_retries
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: dict | None = None) -> None:
+        self.status_code = status
+        self._body = body or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+    def json(self) -> dict:
+        return self._body
+
+
+class FakeSession:
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+        self.calls = 0
+
+    def post(self, url, json=None, timeout=None):
+        self.calls += 1
+        r = self.responses.pop(0)
+        if isinstance(r, Exception):
+            raise r
+        return r
+
+
+def _score(session, limiter=None, retries=2):
+    return _score_with_retries(session, limiter or AdaptiveLimiter(4), "Nvidia beats", "m", None, 5, retries)
+
+
+def test_slow_model_keeps_its_concurrency():
+    limiter = AdaptiveLimiter(4)
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(45.0, ok=True)
+    assert limiter.limit == 4
+
+
+def test_spike_against_baseline_halves():
+    limiter = AdaptiveLimiter(4)
+    for latency in (2.0, 2.0, 10.0):
+        limiter.acquire()
+        limiter.release(latency, ok=True)
+    assert limiter.limit == 2
+
+
+def test_overload_halves_and_parse_errors_do_not():
+    limiter = AdaptiveLimiter(4)
+    limiter.acquire()
+    limiter.release(0.1, ok=False)
+    assert limiter.limit == 4
+    limiter.acquire()
+    limiter.release(0.1, ok=False, overloaded=True)
+    assert limiter.limit == 2
+
+
+def test_missing_model_is_not_retried(monkeypatch):
+    monkeypatch.setattr(ollama_engine, "RETRY_BACKOFF_S", 0.0)
+    session = FakeSession(FakeResponse(404), FakeResponse(200, {"response": "0.5"}))
+    assert _score(session) is None
+    assert session.calls == 1
+
+
+def test_overload_is_retried_with_backpressure(monkeypatch):
+    monkeypatch.setattr(ollama_engine, "RETRY_BACKOFF_S", 0.0)
+    limiter = AdaptiveLimiter(4)
+    session = FakeSession(FakeResponse(503), requests.Timeout(), FakeResponse(200, {"response": "-0.4"}))
+    assert _score(session, limiter) == -0.4
+    assert session.calls == 3
+    # 4 -> 2 (503) -> 1 (timeout), then the reply at limit 1 completes a run and adds one.
+    assert limiter.limit == 2
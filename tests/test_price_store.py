@@ -0,0 +1,43 @@
+"""PriceStore.update never stores a bar for a session that has not closed."""
+from datetime import date, datetime, timedelta, timezone
+
+from src.returns import store as store_mod
+from src.returns.store import PriceStore, completed_end
+
+
+def test_completed_end_waits_for_close():
+    # 2026-10-16 is a Friday; New York is UTC-4 (EDT).
+    assert completed_end(datetime(2026, 10, 16, 14, 0, tzinfo=timezone.utc)) == date(2026, 10, 16)
+    assert completed_end(datetime(2026, 10, 16, 20, 15, tzinfo=timezone.utc)) == date(2026, 10, 16)
+    assert completed_end(datetime(2026, 10, 16, 20, 30, tzinfo=timezone.utc)) == date(2026, 10, 17)
+    # Naive values are UTC: 02:00 UTC Saturday is still Friday evening in New York.
+    assert completed_end(datetime(2026, 10, 17, 2, 0)) == date(2026, 10, 17)
+
+
+def _fake_fetch(calls):
+    def fetch(ticker, start, end):
+        calls.append((ticker, start, end))
+        rows, d = [], start
+        while d < end:
+            rows.append({"trade_date": d.isoformat(), "close": 100.0 + d.day})
+            d += timedelta(days=1)
+        return rows
+
+    return fetch
+
+
+def test_update_skips_open_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(store_mod, "completed_end", lambda now=None: date(2026, 10, 16))
+    calls = []
+    with PriceStore(tmp_path / "prices.db") as store:
+        added = store.update(["NVDA"], date(2026, 10, 12), date(2026, 10, 17), fetch=_fake_fetch(calls))
+        assert added == {"NVDA": 4}
+        assert calls == [("NVDA", date(2026, 10, 12), date(2026, 10, 16))]
+        assert store.coverage()["NVDA"][1] == "2026-10-15"
+
+        # After the close the next update picks up the finished session.
+        monkeypatch.setattr(store_mod, "completed_end", lambda now=None: date(2026, 10, 17))
+        added = store.update(["NVDA"], date(2026, 10, 12), date(2026, 10, 17), fetch=_fake_fetch(calls))
+        assert added == {"NVDA": 1}
+        assert calls[-1] == ("NVDA", date(2026, 10, 16), date(2026, 10, 17))
+        assert store.coverage()["NVDA"] == ("2026-10-12", "2026-10-16", 5)
@@ -0,0 +1,78 @@
+"""Append-only day CSV: same-day saves append only new rows, the key sidecar self-heals, compaction dedupes."""
+import csv
+
+import pytest
+
+from src.scrapers import base
+from src.scrapers.base import RawArticle, compact_raw_daily_csv, save_raw_daily_csv
+
+
+@pytest.fixture(autouse=True)
+def raw_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "DATA_RAW", tmp_path)
+    monkeypatch.setattr(base, "RAW_INDEX_DIR", tmp_path / ".index")
+    return tmp_path
+
+
+def _article(i: int, posted: str = "2026-10-17T09:00:00Z") -> RawArticle:
+    return RawArticle(url=f"https://example.com/{i}", headline=f"Nvidia headline {i}", timestamp=posted, source="Reuters")
+
+
+def _rows(path) -> list[dict]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def _keys(path) -> list[str]:
+    return (base.RAW_INDEX_DIR / f"{path.stem}.keys").read_text(encoding="utf-8").splitlines()
+
+
+def test_second_save_appends_only_new_rows():
+    path = save_raw_daily_csv([_article(0), _article(1)])
+    before = path.read_bytes()
+    path2 = save_raw_daily_csv([_article(1), _article(2), _article(2)])
+    assert path2 == path
+    after = path.read_bytes()
+    assert after.startswith(before)
+    assert [r["headline"] for r in _rows(path)] == ["Nvidia headline 0", "Nvidia headline 1", "Nvidia headline 2"]
+    # Sidecar: one key per stored row, closed by the CSV size after the last write.
+    keys = _keys(path)
+    assert keys[-1] == f"@size {len(after)}"
+    assert len([k for k in keys if not k.startswith("@")]) == 3
+
+    # Nothing new: the file is left untouched.
+    save_raw_daily_csv([_article(0)])
+    assert path.read_bytes() == after
+
+
+@pytest.mark.parametrize("damage", ["missing", "stale"])
+def test_sidecar_rebuilt_from_csv(damage):
+    path = save_raw_daily_csv([_article(0)])
+    index_path = base.RAW_INDEX_DIR / f"{path.stem}.keys"
+    if damage == "missing":
+        index_path.unlink()
+    else:
+        # A row added behind the sidecar's back (e.g. a fresh checkout of a newer CSV).
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            csv.writer(f, lineterminator="\n").writerow(["Reuters", "", "Nvidia headline 1", "", "Reuters", "https://example.com/1"])
+    save_raw_daily_csv([_article(1), _article(2)])
+    headlines = [r["headline"] for r in _rows(path)]
+    assert headlines == ["Nvidia headline 0", "Nvidia headline 1", "Nvidia headline 2"]
+    assert _keys(path)[-1] == f"@size {path.stat().st_size}"
+
+
+def test_compaction_sorts_and_dedupes():
+    path = save_raw_daily_csv([_article(2, "2026-10-17T11:00:00Z"), _article(0, "2026-10-17T09:00:00Z")])
+    save_raw_daily_csv([_article(1, "2026-10-17T10:00:00Z")])
+    # A duplicate slipped in by hand (same headline and url, later fetch).
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        csv.writer(f, lineterminator="\n").writerow(
+            ["Reuters", "later", "Nvidia headline 0", "2026-10-17T09:00:00Z", "Reuters", "https://example.com/0"]
+        )
+    compact_raw_daily_csv(path)
+    rows = _rows(path)
+    assert [r["headline"] for r in rows] == ["Nvidia headline 0", "Nvidia headline 1", "Nvidia headline 2"]
+    assert rows[0]["fetched_at"] != "later"  # first occurrence kept
+    assert list(rows[0]) == base.RAW_ROW_COLUMNS
+    keys = _keys(path)
+    assert keys[-1] == f"@size {path.stat().st_size}" and len(keys) == 4
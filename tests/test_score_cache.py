@@ -0,0 +1,20 @@
+"""ScoreCache keys and eviction."""
+from src.sentiment.score_cache import EVICT_SLACK, ScoreCache, cache_key
+
+
+def test_key_follows_scorer_text():
+    assert cache_key("  Nvidia beats  ", "m", "v1") == cache_key("Nvidia beats", "m", "v1")
+    assert cache_key("Nvidia  beats", "m", "v1") != cache_key("Nvidia beats", "m", "v1")
+    assert cache_key("Nvidia beats", "m", "v1", "ctx") != cache_key("Nvidia beats", "m", "v1")
+
+
+def test_eviction_with_slack(tmp_path):
+    with ScoreCache(tmp_path / "cache.db", max_entries=10) as cache:
+        cache.put_many([(f"k{i}", 0.1) for i in range(EVICT_SLACK + 10)], "b", "m", "v")
+        assert len(cache) == EVICT_SLACK + 10
+        cache.put_many([("k0", 0.2)], "b", "m", "v")
+        assert len(cache) == 10
+        cache.put_many([(f"n{i}", 0.3) for i in range(5)], "b", "m", "v")
+        assert len(cache) == 15
+        assert cache.evict() == 5
+        assert len(cache) == 10
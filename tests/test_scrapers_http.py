@@ -0,0 +1,54 @@
+"""Scraper HTTP helpers: fetch_html always returns text; only fetch_feed is conditional."""
+import pytest
+
+from src.scrapers import base
+
+
+class FakeResponse:
+    def __init__(self, status: int, text: str = "", headers: dict | None = None) -> None:
+        self.status_code = status
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise base.requests.HTTPError(str(self.status_code))
+
+
+class FakeSession:
+    def __init__(self, response: FakeResponse) -> None:
+        self.response = response
+        self.headers_sent: list[dict | None] = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.headers_sent.append(headers)
+        return self.response
+
+
+@pytest.fixture
+def validators(tmp_path, monkeypatch):
+    store = base.ValidatorStore(tmp_path / "validators.json")
+    store._saved["https://example.com/feed"] = {"etag": '"v1"'}
+    store._saved["https://example.com/page"] = {"etag": '"v1"'}
+    monkeypatch.setattr(base, "validators", store)
+    monkeypatch.setattr(base.rate_limiter, "wait", lambda url, interval_s=None: None)
+    return store
+
+
+def test_fetch_html_is_unconditional(validators, monkeypatch):
+    session = FakeSession(FakeResponse(200, "<html>ok</html>"))
+    monkeypatch.setattr(base, "get_session", lambda: session)
+    assert base.fetch_html("https://example.com/page") == "<html>ok</html>"
+    assert session.headers_sent == [None]
+
+
+def test_fetch_feed_not_modified(validators, monkeypatch):
+    pytest.importorskip("feedparser")
+    session = FakeSession(FakeResponse(304))
+    monkeypatch.setattr(base, "get_session", lambda: session)
+    feed = base.fetch_feed("https://example.com/feed")
+    assert feed["status"] == 304
+    assert feed.entries == []
+    assert session.headers_sent[0].get("If-None-Match") == '"v1"'
+    assert "https://example.com/feed" in validators.not_modified
@@ -0,0 +1,98 @@
+"""SeenIndex Bloom filter: no false negatives, false-positive rate near target, persistence and sync."""
+import csv
+
+from src.scrapers.seen_index import SeenIndex, seen_key
+from src.utils import DATA_RAW, iter_headline_rows
+
+
+def _archived_rows() -> list[dict]:
+    return list(iter_headline_rows(sorted(DATA_RAW.glob("headlines_*.csv"))))
+
+
+def test_no_false_negatives_on_archive(tmp_path):
+    rows = _archived_rows()
+    index = SeenIndex(tmp_path / "seen.bloom", capacity=len(rows), fp_rate=1e-3)
+    index.add_rows(rows)
+    assert all(seen_key(r["headline"], r["url"]) in index for r in rows)
+
+
+def test_false_positive_rate_near_target(tmp_path):
+    index = SeenIndex(tmp_path / "seen.bloom", capacity=5000, fp_rate=0.01)
+    for i in range(5000):
+        index.add(seen_key(f"headline {i}", f"https://example.com/{i}"))
+    fresh = [seen_key(f"other {i}", f"https://example.org/{i}") for i in range(20000)]
+    observed = sum(k in index for k in fresh) / len(fresh)
+    assert observed < 0.02
+    assert abs(index.expected_fp_rate() - 0.01) < 0.005
+
+
+def test_save_load_and_sync(tmp_path):
+    raw = tmp_path / "headlines_20260101.csv"
+    with open(raw, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=["headline", "url"])
+        w.writeheader()
+        w.writerow({"headline": "Nvidia beats", "url": "https://a/1"})
+    index = SeenIndex(tmp_path / "seen.bloom", capacity=1000)
+    assert index.sync_raw([raw]) == 1
+    index.save()
+
+    loaded = SeenIndex.load(tmp_path / "seen.bloom")
+    assert loaded.bits == index.bits and loaded.count == 1 and loaded.files == index.files
+    assert loaded.sync_raw([raw]) == 0
+    with open(raw, "a", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerow(["Microsoft ships Copilot", "https://a/2"])
+    assert loaded.sync_raw([raw]) == 1
+    assert seen_key("Microsoft ships Copilot", "https://a/2") in loaded
+    assert seen_key("Apple event", "https://a/3") not in loaded
+
+
+def test_load_rejects_mismatched_bits(tmp_path):
+    index = SeenIndex(tmp_path / "seen.bloom", capacity=1000)
+    index.save()
+    (tmp_path / "seen.bloom").write_bytes(b"\0")
+    assert SeenIndex.load(tmp_path / "seen.bloom") is None
+
+
+def _write_raw(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=["headline", "url"])
+        w.writeheader()
+        w.writerows({"headline": h, "url": u} for h, u in rows)
+
+
+def test_open_scans_only_new_or_grown_files(tmp_path, monkeypatch):
+    import src.utils
+    from src.scrapers import seen_index
+
+    day1, day2 = tmp_path / "headlines_20260101.csv", tmp_path / "headlines_20260102.csv"
+    _write_raw(day1, [("Nvidia beats", "https://a/1")])
+    raw_paths = [day1]
+    monkeypatch.setattr(seen_index, "_archived_paths", lambda: list(raw_paths))
+    path = tmp_path / "seen.bloom"
+    SeenIndex.open(path)
+
+    scanned = []
+    iter_rows = src.utils.iter_rows
+    monkeypatch.setattr(src.utils, "iter_rows", lambda p: scanned.append(p.name) or iter_rows(p))
+    SeenIndex.open(path)
+    assert scanned == []
+
+    _write_raw(day2, [("Microsoft ships Copilot", "https://a/2")])
+    raw_paths.append(day2)
+    index = SeenIndex.open(path)
+    assert scanned == [day2.name]
+    assert seen_key("Microsoft ships Copilot", "https://a/2") in index
+
+
+def test_open_rebuilds_when_ahead_of_raw(tmp_path, monkeypatch):
+    from src.scrapers import seen_index
+
+    day = tmp_path / "headlines_20260101.csv"
+    _write_raw(day, [("Nvidia beats", "https://a/1"), ("Unpushed row", "https://a/9")])
+    monkeypatch.setattr(seen_index, "_archived_paths", lambda: [day])
+    path = tmp_path / "seen.bloom"
+    SeenIndex.open(path)
+    _write_raw(day, [("Nvidia beats", "https://a/1")])
+    index = SeenIndex.open(path)
+    assert seen_key("Unpushed row", "https://a/9") not in index
+    assert seen_key("Nvidia beats", "https://a/1") in index
@@ -0,0 +1,89 @@
+"""Scoring service: concurrent requests coalesce into one FinBERT batch over HTTP and a Unix socket."""
+import threading
+
+import pytest
+
+from src.sentiment import pipeline
+from src.sentiment.service import ScoringService, ServiceClient, make_server
+
+
+class StubScorer:
+    """Stands in for score_finbert_batch: records each batch call, score = len(text) / 100."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        return [len(t) / 100 for t in texts]
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    scorer = StubScorer()
+    monkeypatch.setitem(pipeline.LOCAL_SCORERS, "finbert", ("fake-finbert", scorer))
+    return scorer
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def service_url(request, stub, tmp_path):
+    # A wide batching window so every concurrent request lands in the first batch.
+    service = ScoringService(["finbert"], max_batch=1000, max_wait_ms=500)
+    if request.param == "unix":
+        server = make_server(service, socket_path=tmp_path / "svc.sock")
+        url = f"unix:{tmp_path / 'svc.sock'}"
+    else:
+        server = make_server(service, port=0)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield url
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def test_concurrent_requests_share_one_batch(service_url, stub):
+    requests = [[f"client {c} headline {i}" + "!" * c for i in range(c + 1)] for c in range(8)]
+    results: dict[int, list] = {}
+    barrier = threading.Barrier(len(requests))
+
+    def send(c):
+        with ServiceClient(service_url) as client:
+            barrier.wait()
+            results[c] = client.score("finbert", requests[c])
+
+    threads = [threading.Thread(target=send, args=(c,)) for c in range(len(requests))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(stub.calls) == 1
+    assert sorted(stub.calls[0]) == sorted(h for req in requests for h in req)
+    for c, headlines in enumerate(requests):
+        assert results[c] == [len(h) / 100 for h in headlines]
+
+    with ServiceClient(service_url) as client:
+        health = client.health()
+        stats = client.stats()
+        with pytest.raises(RuntimeError, match="not served"):
+            client.score("phi3", ["x"])
+    assert health["status"] == "ok" and health["backends"] == ["finbert"] and health["finbert_loaded"]
+    assert stats["finbert_batches"]["finbert"]["batches"] == 1
+    assert stats["backends"]["finbert"]["headlines"] == sum(len(r) for r in requests)
+
+
+def test_add_sentiment_via_service(service_url, stub):
+    rows = [{"headline": "Nvidia beats", "ticker": "NVDA"}, {"headline": "Microsoft ships", "ticker": "MSFT"}]
+    out = pipeline.add_sentiment_to_rows(rows, backends=["finbert"], service=service_url)
+    assert [r["sentiment_finbert"] for r in out] == [len("Nvidia beats") / 100, len("Microsoft ships") / 100]
+
+
+@pytest.mark.parametrize("url", ["http://127.0.0.1:1", "unix:/nonexistent/svc.sock"])
+def test_client_mode_with_service_down(url, stub):
+    rows = [{"headline": "Nvidia beats", "ticker": "NVDA"}]
+    with pytest.raises(OSError):
+        pipeline.add_sentiment_to_rows(rows, backends=["finbert"], service=url)
+    # No silent fallback to loading the model in this process.
+    assert stub.calls == []
@@ -0,0 +1,41 @@
+"""Bootstrap / permutation significance: deterministic per seed, independent of the worker count."""
+import importlib
+
+import numpy as np
+import pandas as pd
+
+from src.backtest import block_bootstrap_index, permutation_index, significance
+
+# The package exports the significance() function under the submodule's name.
+significance_mod = importlib.import_module("src.backtest.significance")
+
+
+def test_same_seed_same_result_for_any_workers(events, monkeypatch):
+    # Small chunks so the resamples are split across several pool tasks.
+    monkeypatch.setattr(significance_mod, "CHUNK_CELLS", 3000)
+    serial = significance(events, n_resamples=60, block=3, seed=11, workers=1)
+    pooled = significance(events, n_resamples=60, block=3, seed=11, workers=2)
+    pd.testing.assert_frame_equal(serial, pooled)
+    other = significance(events, n_resamples=60, block=3, seed=12, workers=1)
+    assert not serial["corr_lo"].equals(other["corr_lo"])
+
+
+def test_resample_indices_stay_within_ticker(events):
+    ticker_idx = events.ticker_idx
+    sizes = np.bincount(ticker_idx)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rng = np.random.default_rng(0)
+    for idx in (
+        block_bootstrap_index(ticker_idx, starts, sizes, 4, rng, 20),
+        permutation_index(ticker_idx, rng, 20),
+    ):
+        assert idx.shape == (20, len(ticker_idx))
+        assert (ticker_idx[idx] == ticker_idx).all()
+
+
+def test_significance_export_is_the_function():
+    # Loading another export first imports the submodule, which binds its name on the package.
+    import src.backtest as backtest_pkg
+
+    assert callable(backtest_pkg.block_bootstrap_index)
+    assert callable(backtest_pkg.significance)
@@ -0,0 +1,21 @@
+"""TimestampNormalizer audit counts stay exact when scraper threads share one normalizer."""
+from concurrent.futures import ThreadPoolExecutor
+
+from src.scrapers.timestamps import TimestampNormalizer
+
+VALUES = ["2026-10-17T12:00:00Z", "Fri, 17 Oct 2026 12:00:00 GMT", "2026-10-17 junk", "not a date"]
+
+
+def test_counts_exact_across_threads():
+    normalizer = TimestampNormalizer()
+    per_thread = 2000
+
+    def work(t: int) -> None:
+        for i in range(per_thread):
+            normalizer.normalize(VALUES[i % len(VALUES)], source=f"s{t % 3}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+    assert sum(normalizer.counts.values()) == 8 * per_thread
+    assert normalizer.fallbacks == 8 * per_thread // len(VALUES)
+    assert normalizer.fallback_samples and all(v == repr("not a date") for _, v in normalizer.fallback_samples)
@@ -0,0 +1,50 @@
+"""Row readers: pyarrow CSV matches pandas (ragged rows included); JSONL keeps non-finite floats."""
+import importlib.util
+import math
+
+import pytest
+
+from src import utils
+from src.utils import _iter_csv_pandas, iter_csv, load_jsonl, write_jsonl
+
+requires_pyarrow = pytest.mark.skipif(importlib.util.find_spec("pyarrow") is None, reason="pyarrow not installed")
+
+
+def _write(path, lines):
+    path.write_text("headline,source,posted_at\n" + "".join(line + "\n" for line in lines), encoding="utf-8")
+    return path
+
+
+@requires_pyarrow
+@pytest.mark.parametrize("short_at", [0, 150, 399])
+def test_short_rows_fall_back_to_pandas(tmp_path, monkeypatch, short_at):
+    # Small blocks so some batches are already yielded when arrow hits the short row.
+    monkeypatch.setattr(utils, "CSV_BLOCK_BYTES", 1024)
+    lines = [f'"Headline {i}, with comma",Reuters,2026-10-0{i % 9 + 1}T12:00:00Z' for i in range(400)]
+    lines[short_at] = "Short row,Reuters"
+    path = _write(tmp_path / "ragged.csv", lines)
+    rows = list(iter_csv(path))
+    assert rows == list(_iter_csv_pandas(path, 50))
+    assert len(rows) == 400
+    assert rows[short_at] == {"headline": "Short row", "source": "Reuters", "posted_at": ""}
+
+
+@requires_pyarrow
+def test_well_formed_rows_match_pandas(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "CSV_BLOCK_BYTES", 1024)
+    lines = [f'"Line {i}\nsecond part",,2026-10-17T00:00:00Z' for i in range(200)]
+    path = _write(tmp_path / "ok.csv", lines)
+    assert list(iter_csv(path)) == list(_iter_csv_pandas(path, 50))
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_jsonl_round_trips_non_finite_floats(tmp_path, value):
+    rows = [{"headline": "a", "sentiment_finbert": 0.5}, {"headline": "b", "sentiment_finbert": value}]
+    path = tmp_path / "rows.jsonl"
+    write_jsonl(rows, path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("{not json\n")
+    got = load_jsonl(path)
+    assert [r["headline"] for r in got] == ["a", "b"]
+    score = got[1]["sentiment_finbert"]
+    assert math.isnan(score) if math.isnan(value) else score == value